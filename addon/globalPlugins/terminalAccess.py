@@ -80,18 +80,24 @@ from gui import guiHelper, nvdaControls
 from gui.settingsDialogs import SettingsPanel
 import addonHandler
 import wx
+import array
+import bisect
 import collections
 import functools
+import heapq
+import itertools
+import json
 import os
 import re
 import time
 import threading
 import unicodedata
+import zlib
 from scriptHandler import script
 import scriptHandler
 import globalCommands
 import speech
-from typing import Any
+from typing import Any, Sequence
 
 try:
 	import braille
@@ -134,6 +140,8 @@ MAX_SELECTION_ROWS = 10000  # Maximum rows for selection operations
 MAX_SELECTION_COLS = 1000   # Maximum columns for selection operations
 MAX_WINDOW_DIMENSION = 10000  # Maximum window boundary value
 MAX_REPEATED_SYMBOLS_LENGTH = 50  # Maximum length for repeated symbols string
+MAX_WORD_CHARACTERS_LENGTH = 50  # Maximum length for the word characters string
+DEFAULT_WORD_CHARACTERS = "-_./\\:~@%+=?&"  # Characters kept inside words: paths, URLs, options
 
 # Configuration spec for Terminal Access settings
 confspec = {
@@ -145,6 +153,7 @@ confspec = {
 	"punctuationLevel": "integer(default=2, min=0, max=3)",  # 0=None, 1=Some, 2=Most, 3=All
 	"repeatedSymbols": "boolean(default=False)",
 	"repeatedSymbolsValues": "string(default='-_=!')",
+	"wordCharacters": f"string(default='{DEFAULT_WORD_CHARACTERS}')",  # Characters kept inside words
 	"cursorDelay": "integer(default=20, min=0, max=1000)",
 	"quietMode": "boolean(default=False)",
 	"verboseMode": "boolean(default=False)",  # Phase 6: Verbose feedback with context
@@ -214,24 +223,188 @@ _BUILTIN_PROFILE_NAMES: frozenset[str] = frozenset([
 	'claude', 'lazygit', 'btop', 'btm', 'yazi', 'k9s',
 ])
 
+# Built-in window-title detection rules: (priority, profile name, title regex).
+# Higher priority wins when several rules match; equal priorities keep this
+# order.  More specific names (lazygit) outrank less specific ones (git, less).
+_BUILTIN_DETECTION_RULES: tuple[tuple[int, str, str], ...] = (
+	(100, 'vim', r'vim'),
+	(95, 'tmux', r'tmux'),
+	(90, 'lazygit', r'lazygit'),
+	(85, 'btop', r'btop|btm'),
+	(80, 'htop', r'htop'),
+	(70, 'less', r'\b(?:less|more)\b'),
+	(60, 'git', r'git'),
+	(50, 'nano', r'nano'),
+	(50, 'irssi', r'irssi'),
+	# TUI applications
+	(40, 'claude', r'claude'),
+	(40, 'yazi', r'yazi'),
+	(40, 'k9s', r'k9s'),
+)
+
 # Compiled regex for stripping ANSI highlight codes (used in _extractHighlightedText)
 _ANSI_HIGHLIGHT_RE: re.Pattern[str] = re.compile(r'\x1b\[[0-9;]*m')
 
-# Compiled prompt patterns for CommandHistoryManager (avoids re-compilation per instance)
-_PROMPT_PATTERNS: list[re.Pattern[str]] = [
+# Prompt rules for CommandHistoryManager, in priority order: (name, prompt
+# prefix).  Every rule captures the rest of the line as the command.
+_PROMPT_RULES: list[tuple[str, str]] = [
 	# Bash prompts: user@host:~$, root@host:#, simple $/#
-	re.compile(r'^[\w\-\.]+@[\w\-\.]+:[^\$#]*[\$#]\s*(.+)$'),
-	re.compile(r'^[\$#]\s*(.+)$'),
+	('bash_user', r'[\w\-\.]+@[\w\-\.]+:[^\$#]*[\$#]\s*'),
+	('bash', r'[\$#]\s*'),
 	# PowerShell prompts: PS>, PS C:\>, PS /home/user>
-	re.compile(r'^PS\s+[A-Za-z]:[^>]*>\s*(.+)$'),
-	re.compile(r'^PS\s+/[^>]*>\s*(.+)$'),
-	re.compile(r'^PS>\s*(.+)$'),
+	('ps_drive', r'PS\s+[A-Za-z]:[^>]*>\s*'),
+	('ps_posix', r'PS\s+/[^>]*>\s*'),
+	('ps', r'PS>\s*'),
 	# Windows CMD prompts: C:\>, D:\Users\name>
-	re.compile(r'^[A-Za-z]:[^>]*>\s*(.+)$'),
+	('cmd', r'[A-Za-z]:[^>]*>\s*'),
 	# Generic prompt with colon or arrow
-	re.compile(r'^[^\s>:]+[>:]\s*(.+)$'),
+	('generic', r'[^\s>:]+[>:]\s*'),
+]
+
+# Individually compiled prompt patterns (group 1 is the command)
+_PROMPT_PATTERNS: list[re.Pattern[str]] = [
+	re.compile(rf'^{prefix}(.+)$') for _name, prefix in _PROMPT_RULES
 ]
 
+# All prompt rules as one alternation; the named group that participated in
+# the match identifies the rule and holds the command text.  Alternation
+# order preserves the first-rule-wins priority of _PROMPT_RULES.
+_PROMPT_COMBINED_RE: re.Pattern[str] = re.compile(
+	'^(?:' + '|'.join(rf'{prefix}(?P<{name}>.+)$' for name, prefix in _PROMPT_RULES) + ')'
+)
+
+
+def _match_prompt_command(line: str) -> str | None:
+	"""
+	Extract the command from a stripped line if it looks like a shell prompt.
+
+	A literal prefilter rejects most output lines without running a regex:
+	apart from ``$``/``#`` and ``PS`` prompts, every rule needs a ``:`` or
+	``>`` before the first space.
+
+	Args:
+		line: Line text with surrounding whitespace removed
+
+	Returns:
+		Command text, or None if the line is not a prompt
+	"""
+	if not line:
+		return None
+	if line[0] not in '$#' and not line.startswith('PS'):
+		end = line.find(' ')
+		if end < 0:
+			end = len(line)
+		if line.find(':', 0, end) < 0 and line.find('>', 0, end) < 0:
+			return None
+	match = _PROMPT_COMBINED_RE.match(line)
+	if match is None:
+		return None
+	return match.group(match.lastgroup).strip()
+
+
+# Delay after the last keystroke before search-as-you-type announces results
+_INCREMENTAL_SEARCH_DEBOUNCE_MS: int = 300
+
+# Longest time a reused screen grid is trusted.  Full-screen programs
+# (htop, k9s, watch) redraw without moving the caret, so the content
+# generation alone does not show their changes.
+_SCREEN_GRID_TIMEOUT_S: float = 1.0
+
+# Upper bound on distinct (pattern, flags) pairs kept compiled at once.
+# The re module's own cache is small and shared with every other add-on,
+# so user-entered search and filter patterns are kept here instead.
+_COMPILED_PATTERN_CACHE_SIZE: int = 64
+
+
+def _learn_prompt_pattern(samples: Sequence[str]) -> re.Pattern | None:
+	"""
+	Build an anchored prompt pattern from observed bare prompts.
+
+	The prompt text seen just before typing starts is sampled for each
+	command.  Samples that are all identical become a literal pattern.
+	Otherwise the prefix and suffix shared by every sample are kept and
+	the varying middle (working directory, git branch, ...) becomes a
+	lazy wildcard.  The shared suffix must contain a symbol such as
+	``❯``, ``λ`` or ``%`` so the command boundary is unambiguous.
+
+	Args:
+		samples: Bare prompt strings, trailing whitespace removed
+
+	Returns:
+		Compiled pattern with the command in group 1, or None
+	"""
+	samples = [sample for sample in samples if sample.strip()]
+	if not samples:
+		return None
+	prefix = os.path.commonprefix(samples)
+	if all(sample == prefix for sample in samples):
+		body = re.escape(prefix)
+	else:
+		suffix = os.path.commonprefix([sample[::-1] for sample in samples])[::-1]
+		suffix = suffix[max(0, len(prefix) + len(suffix) - min(len(sample) for sample in samples)):]
+		if not any(not ch.isalnum() and not ch.isspace() for ch in suffix):
+			return None
+		body = re.escape(prefix) + '.*?' + re.escape(suffix)
+	return _get_compiled_pattern(rf'^{body}\s*(\S.*)$')
+
+
+@functools.lru_cache(maxsize=_COMPILED_PATTERN_CACHE_SIZE)
+def _get_compiled_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+	"""
+	Return a compiled regular expression from a bounded LRU cache.
+
+	Shared by output search, filtering and command history so that repeated
+	queries (F3 stepping, search-as-you-type, rescans) never recompile.
+
+	Args:
+		pattern: Regular expression source
+		flags: ``re`` flags the pattern is compiled with (part of the cache key)
+
+	Returns:
+		Compiled pattern
+
+	Raises:
+		re.error: If the pattern is not a valid regular expression
+	"""
+	return re.compile(pattern, flags)
+
+
+def _get_search_pattern(pattern: str, case_sensitive: bool = False, use_regex: bool = False) -> re.Pattern[str]:
+	"""
+	Compile a user search query into a cached pattern.
+
+	Plain-text queries are escaped so that literal and regex searches share
+	one matching path (and one cache).
+
+	Args:
+		pattern: Search text or regular expression
+		case_sensitive: Match case exactly
+		use_regex: Treat *pattern* as a regular expression
+
+	Returns:
+		Compiled pattern
+	"""
+	source = pattern if use_regex else re.escape(pattern)
+	return _get_compiled_pattern(source, 0 if case_sensitive else re.IGNORECASE)
+
+
+def _context_hash(lines: list[str], row: int, count: int) -> int:
+	"""
+	Hash *row* together with the lines just above it.
+
+	Identifies a row by content, so it can be found again after lines
+	roll off the top of the buffer.
+
+	Args:
+		lines: Buffer lines
+		row: Row the context ends at
+		count: Number of lines in the context, including *row*
+
+	Returns:
+		Content hash
+	"""
+	return hash(tuple(lines[max(0, row - count + 1):row + 1]))
+
 
 @functools.cache
 def _get_unicode_symbol_name(char: str) -> str:
@@ -252,7 +425,10 @@ class PositionCache:
 	Cache for terminal position calculations with timestamp-based invalidation.
 
 	Stores bookmark→(row, col, timestamp) mappings to avoid repeated O(n) calculations.
-	Cache entries expire after CACHE_TIMEOUT_MS milliseconds.
+	Cache entries expire after CACHE_TIMEOUT_MS milliseconds.  When a
+	ContentGeneration is supplied, entries also record the generation and
+	stay valid until content at or above their row changes, for as long as
+	snapshots keep confirming the generation (see ContentGeneration.is_confirmed).
 
 	Example usage:
 		>>> cache = PositionCache()
@@ -283,10 +459,18 @@ class PositionCache:
 	CACHE_TIMEOUT_S: float = 1.0  # Seconds (avoids per-call ms conversion)
 	MAX_CACHE_SIZE = 100  # Maximum number of cached positions
 
-	def __init__(self) -> None:
-		"""Initialize an empty position cache."""
-		self._cache: dict[str, tuple[int, int, float]] = {}
+	def __init__(self, generation: "ContentGeneration | None" = None) -> None:
+		"""
+		Initialize an empty position cache.
+
+		Args:
+			generation: Optional content generation authority; without one,
+				entries expire after CACHE_TIMEOUT_S
+		"""
+		# bookmark -> (row, col, timestamp, generation or None)
+		self._cache: dict[str, tuple[int, int, float, int | None]] = {}
 		self._lock: threading.Lock = threading.Lock()
+		self._generation = generation
 
 	def get(self, bookmark: Any) -> tuple[int, int] | None:
 		"""
@@ -302,8 +486,14 @@ class PositionCache:
 			key = str(bookmark)
 			entry = self._cache.get(key)
 			if entry is not None:
-				row, col, timestamp = entry
-				if (time.time() - timestamp) < self.CACHE_TIMEOUT_S:
+				row, col, stamp, generation = entry
+				if self._generation is not None:
+					if (
+						self._generation.is_row_current(row - 1, generation)
+						and self._generation.is_confirmed(stamp, self.CACHE_TIMEOUT_S)
+					):
+						return (row, col)
+				elif (time.time() - stamp) < self.CACHE_TIMEOUT_S:
 					return (row, col)
 				# Expired entry, remove it
 				del self._cache[key]
@@ -325,7 +515,8 @@ class PositionCache:
 				del self._cache[oldest_key]
 
 			key = str(bookmark)
-			self._cache[key] = (row, col, time.time())
+			generation = self._generation.value if self._generation is not None else None
+			self._cache[key] = (row, col, time.time(), generation)
 
 	def clear(self) -> None:
 		"""Clear all cached positions."""
@@ -449,6 +640,156 @@ class TextDiffer:
 		return self._last_text
 
 
+class ContentGeneration:
+	"""
+	Single authority for terminal content changes.
+
+	Every snapshot or diff that detects a change advances one generation
+	counter and records the first row that changed.  Caches remember the
+	generation they were filled at and ask whether anything at or above the
+	rows they depend on has changed since, instead of being cleared
+	wholesale.  Changes are only seen through snapshots and typing, so a
+	cached value is trusted for a limited time after it was stored or after
+	the last snapshot, whichever is later (see is_confirmed).
+
+	Example usage:
+		>>> generation = ContentGeneration()
+		>>> filled_at = generation.value
+		>>> generation.observe(buffer_text)  # from any snapshot
+		>>> generation.is_row_current(12, filled_at)
+
+	Thread Safety:
+		All operations are thread-safe using internal locking.
+	"""
+
+	# Recent (generation, first changed row) records kept; a cache filled
+	# before the oldest record is treated as changed from row 0
+	HISTORY_SIZE: int = 64
+
+	def __init__(self) -> None:
+		"""Initialise at generation 0 with no snapshot."""
+		self._value = 0
+		self._changes: collections.deque[tuple[int, int]] = collections.deque(maxlen=self.HISTORY_SIZE)
+		self._differ = TextDiffer()
+		self._row_count = 0  # Newline count of the last observed snapshot
+		self._observed_at = 0.0  # time.time() of the last observed snapshot
+		self._lock = threading.Lock()
+
+	@property
+	def value(self) -> int:
+		"""The current generation."""
+		return self._value
+
+	def advance(self, first_row: int = 0) -> int:
+		"""
+		Record a change detected outside a snapshot diff (for example typing).
+
+		Args:
+			first_row: First 0-based row that may have changed
+
+		Returns:
+			int: The new generation
+		"""
+		with self._lock:
+			return self._advance_locked(first_row)
+
+	def _advance_locked(self, first_row: int) -> int:
+		"""Advance the counter; the caller holds the lock."""
+		self._value += 1
+		self._changes.append((self._value, max(0, first_row)))
+		return self._value
+
+	def observe(self, text: str) -> int | None:
+		"""
+		Diff a buffer snapshot and advance the generation if it changed.
+
+		Appends and last-line rewrites are located from the previous line
+		count without scanning the buffer; other changes compare line by
+		line to find the first differing row.
+
+		Args:
+			text: Full terminal buffer text
+
+		Returns:
+			First changed 0-based row, or None if the snapshot is unchanged
+		"""
+		with self._lock:
+			self._observed_at = time.time()
+			previous_rows = self._row_count
+			old = self._differ.last_text
+			kind, new_content = self._differ.update(text)
+			if kind == TextDiffer.KIND_UNCHANGED:
+				return None
+			if kind == TextDiffer.KIND_APPENDED:
+				first_row = previous_rows
+				self._row_count = previous_rows + new_content.count('\n')
+			elif kind == TextDiffer.KIND_LAST_LINE_UPDATED:
+				first_row = previous_rows
+			else:
+				self._row_count = text.count('\n')
+				first_row = 0 if old is None else self._first_differing_row(old, text)
+			self._advance_locked(first_row)
+			return first_row
+
+	@staticmethod
+	def _first_differing_row(old: str, new: str) -> int:
+		"""Find the first row at which two buffer texts differ."""
+		old_lines = old.split('\n')
+		new_lines = new.split('\n')
+		for row, (old_line, new_line) in enumerate(zip(old_lines, new_lines)):
+			if old_line != new_line:
+				return row
+		return min(len(old_lines), len(new_lines))
+
+	def first_changed_row_since(self, generation: int) -> int | None:
+		"""
+		Get the lowest row changed after *generation*.
+
+		Args:
+			generation: Generation a cache was filled at
+
+		Returns:
+			Lowest changed 0-based row, or None if nothing changed
+		"""
+		with self._lock:
+			if generation >= self._value:
+				return None
+			if not self._changes or self._changes[0][0] > generation + 1:
+				return 0
+			return min(row for changed_at, row in self._changes if changed_at > generation)
+
+	def is_row_current(self, row: int, generation: int) -> bool:
+		"""
+		Check that nothing at or above *row* changed after *generation*.
+
+		Args:
+			row: 0-based row a cached value depends on
+			generation: Generation the value was cached at
+
+		Returns:
+			bool: True if the cached value is still valid
+		"""
+		first_row = self.first_changed_row_since(generation)
+		return first_row is None or row < first_row
+
+	def is_confirmed(self, stored_at: float, timeout: float) -> bool:
+		"""
+		Check that the generation can still vouch for a cached value.
+
+		Output that arrives while no snapshot is taken does not advance the
+		generation, so a value is trusted only within *timeout* of when it
+		was stored or of the last snapshot, whichever is later.
+
+		Args:
+			stored_at: time.time() when the value was cached
+			timeout: Seconds the value may go unconfirmed
+
+		Returns:
+			bool: True if the value may still be used
+		"""
+		return time.time() - max(stored_at, self._observed_at) < timeout
+
+
 class ANSIParser:
 	"""
 	Robust ANSI escape sequence parser for terminal color and formatting attributes.
@@ -759,6 +1100,42 @@ class ANSIParser:
 		"""
 		return ANSIParser._STRIP_PATTERN.sub('', text)
 
+	@staticmethod
+	def stripANSIWithMarks(text: str) -> tuple[str, list[tuple[str, int]]]:
+		"""
+		Remove all ANSI escape sequences, capturing OSC 133 shell-integration marks.
+
+		OSC 133 (FinalTerm) marks are emitted by shells with shell integration
+		(Windows Terminal, WezTerm, and bash/zsh/fish/PowerShell set-ups):
+		``A`` prompt start, ``B`` command start, ``C`` output start and ``D``
+		command finished.  They are stripped like any other OSC sequence, but
+		their kind and position in the stripped text are reported.
+
+		Args:
+			text: Text containing ANSI codes
+
+		Returns:
+			tuple: (text with ANSI codes removed, list of (mark kind, offset in the stripped text))
+		"""
+		if '\x1b' not in text:
+			return text, []
+
+		pieces = []
+		marks = []
+		clean_len = 0
+		pos = 0
+		for match in ANSIParser._STRIP_PATTERN.finditer(text):
+			start = match.start()
+			if start > pos:
+				pieces.append(text[pos:start])
+				clean_len += start - pos
+			sequence = match.group()
+			if sequence.startswith('\x1b]133;') and len(sequence) > 6 and sequence[6] in 'ABCD':
+				marks.append((sequence[6], clean_len))
+			pos = match.end()
+		pieces.append(text[pos:])
+		return ''.join(pieces), marks
+
 
 class UnicodeWidthHelper:
 	"""
@@ -927,124 +1304,533 @@ class UnicodeWidthHelper:
 		return len(text)
 
 
-class BidiHelper:
+class ScreenGrid:
 	"""
-	Helper class for bidirectional text (RTL/LTR) handling.
+	Row and display-column model of a terminal buffer snapshot.
 
-	Implements Unicode Bidirectional Algorithm (UAX #9) for proper handling of
-	right-to-left text (Arabic, Hebrew) mixed with left-to-right text.
+	Each row keeps a compact column map: an ``array('i')`` holding, for
+	every display column, the string index of the character drawn there.
+	Wide (CJK) characters fill two columns with the same index; combining
+	characters take no column and stay with the cell before them.  A
+	sentinel entry equal to the line length closes the map.
 
-	Features:
-	- Automatic RTL text detection
-	- Bidirectional text reordering
-	- Arabic character reshaping
-	- Mixed RTL/LTR text support
+	Column maps are built lazily, the first time a row is accessed, so a
+	grid over a large scrollback costs one split until it is used.  After
+	that any cell or column span is an O(1) lookup with no COM calls, and
+	rectangular copy, window reading and window monitors share the same
+	column semantics.
 
 	Example usage:
-		>>> helper = BidiHelper()
-		>>>
-		>>> # Detect RTL text
-		>>> is_rtl = helper.is_rtl("مرحبا")  # Arabic "Hello"
-		>>> print(is_rtl)  # True
-		>>>
-		>>> # Process mixed RTL/LTR text
-		>>> text = "Hello مرحبا World"
-		>>> display_text = helper.process_text(text)
-		>>>
-		>>> # Extract column range with RTL awareness
-		>>> result = helper.extract_column_range_rtl(text, 1, 5)
+		>>> grid = ScreenGrid("ab\\n中文x")
+		>>> grid.cell(2, 3)  # Third column of the second row
+		'文'
+		>>> grid.span(2, 2, 5)
+		'中文x'
+		>>> grid.rect(1, 1, 2, 2)
+		['ab', '中']
+
+	Rows and columns are 1-based, like the rest of the add-on.
+	"""
 
-	Dependencies:
-		Requires optional packages:
-		- python-bidi>=0.4.2
-		- arabic-reshaper>=2.1.3
+	def __init__(self, text: str) -> None:
+		"""
+		Initialize the grid from buffer text.
 
-		Gracefully degrades if packages not available.
+		Args:
+			text: Snapshot text, one row per line
+		"""
+		self.text = text
+		self._lines = [line.rstrip('\r') for line in text.split('\n')] if text else []
+		self._maps: list[array.array | None] = [None] * len(self._lines)
 
-	Thread Safety:
-		All methods are thread-safe (no shared mutable state).
+	@property
+	def rowCount(self) -> int:
+		"""Number of rows in the snapshot."""
+		return len(self._lines)
 
-	Section Reference:
-		FUTURE_ENHANCEMENTS.md Section 4.1 (lines 465-526)
-	"""
+	def line(self, row: int) -> str:
+		"""
+		Get the text of a row.
 
-	def __init__(self):
-		"""Initialize BidiHelper with optional dependencies."""
-		try:
-			from bidi.algorithm import get_display
-			self._get_display = get_display
-			self._bidi_available = True
-		except ImportError:
-			self._bidi_available = False
+		Args:
+			row: Row number (1-based)
 
-		try:
-			import arabic_reshaper
-			self._reshaper = arabic_reshaper.reshape
-			self._reshaper_available = True
-		except ImportError:
-			self._reshaper_available = False
+		Returns:
+			str: Row text, or an empty string outside the grid
+		"""
+		if 1 <= row <= len(self._lines):
+			return self._lines[row - 1]
+		return ""
 
-	def is_available(self) -> bool:
+	def columnMap(self, row: int) -> array.array:
 		"""
-		Check if bidirectional text processing is available.
+		Get the column map for a row, building it on first access.
+
+		Args:
+			row: Row number (1-based)
 
 		Returns:
-			bool: True if bidi libraries are available
+			array: String index per display column, followed by the line length
 		"""
-		return self._bidi_available
+		if not 1 <= row <= len(self._lines):
+			return array.array('i', [0])
+		columns = self._maps[row - 1]
+		if columns is None:
+			columns = self._maps[row - 1] = self._buildColumnMap(self._lines[row - 1])
+		return columns
 
-	def is_rtl(self, text: str) -> bool:
+	@staticmethod
+	def _buildColumnMap(line: str) -> array.array:
+		"""Map each display column of a line to the index of its character."""
+		if line.isascii():
+			return array.array('i', range(len(line) + 1))
+		columns = array.array('i')
+		for index, char in enumerate(line):
+			width = UnicodeWidthHelper.getCharWidth(char)
+			if width == 0 and columns:
+				# Combining and zero-width characters stay with the previous cell
+				continue
+			columns.extend([index] * max(width, 1))
+		columns.append(len(line))
+		return columns
+
+	def rowWidth(self, row: int) -> int:
 		"""
-		Detect if text is primarily right-to-left.
+		Get the display width of a row.
 
-		Uses Unicode character properties to determine text direction.
+		Args:
+			row: Row number (1-based)
+
+		Returns:
+			int: Number of display columns in the row
+		"""
+		return len(self.columnMap(row)) - 1
+
+	@staticmethod
+	def _cellEnd(columns: array.array, column: int) -> int:
+		"""Get the string index just past the cell drawn at a 0-based column."""
+		start = columns[column]
+		column += 1
+		while columns[column] == start:
+			column += 1
+		return columns[column]
+
+	def cell(self, row: int, col: int) -> str:
+		"""
+		Get the character drawn at a cell.
 
 		Args:
-			text: Text to analyze
+			row: Row number (1-based)
+			col: Display column (1-based)
 
 		Returns:
-			bool: True if text is primarily RTL
+			str: Cell text including combining marks, or '' past the line end
 		"""
-		if not text:
-			return False
+		columns = self.columnMap(row)
+		if not 1 <= col < len(columns):
+			return ""
+		return self._lines[row - 1][columns[col - 1]:self._cellEnd(columns, col - 1)]
 
-		rtl_count = 0
-		ltr_count = 0
+	def span(self, row: int, startCol: int, endCol: int) -> str:
+		"""
+		Get the text covering a column range of a row.
 
-		# RTL Unicode ranges:
-		# Arabic: U+0600-U+06FF, U+0750-U+077F
-		# Hebrew: U+0590-U+05FF
-		for char in text:
-			code = ord(char)
-			if (0x0590 <= code <= 0x05FF or  # Hebrew
-				0x0600 <= code <= 0x06FF or  # Arabic
-				0x0750 <= code <= 0x077F):   # Arabic Supplement
-				rtl_count += 1
-			elif char.isalpha():
-				ltr_count += 1
+		A wide character that overlaps either end of the range is included,
+		matching UnicodeWidthHelper.extractColumnRange.
 
-		return rtl_count > ltr_count
+		Args:
+			row: Row number (1-based)
+			startCol: First display column (1-based)
+			endCol: Last display column (1-based, inclusive)
 
-	def process_text(self, text: str) -> str:
+		Returns:
+			str: Text in the range, or '' if the range is past the line end
 		"""
-		Process text for correct bidirectional display.
+		columns = self.columnMap(row)
+		width = len(columns) - 1
+		startCol = max(startCol, 1)
+		endCol = min(endCol, width)
+		if startCol > endCol:
+			return ""
+		return self._lines[row - 1][columns[startCol - 1]:self._cellEnd(columns, endCol - 1)]
 
-		Applies Arabic reshaping and bidirectional algorithm.
+	def rect(self, top: int, left: int, bottom: int, right: int) -> list[str]:
+		"""
+		Get the text of a rectangle, one string per row.
 
 		Args:
-			text: Input text (may contain mixed RTL/LTR)
+			top: First row (1-based)
+			left: First column (1-based)
+			bottom: Last row (1-based, inclusive); clamped to the grid
+			right: Last column (1-based, inclusive)
 
 		Returns:
-			str: Text reordered for visual display
+			list[str]: Span of each row in the rectangle
 		"""
-		if not text:
-			return text
+		return [self.span(row, left, right) for row in range(max(top, 1), min(bottom, len(self._lines)) + 1)]
 
-		# If libraries not available, return as-is
-		if not self._bidi_available:
-			return text
+	def indexAt(self, row: int, col: int) -> int:
+		"""
+		Get the string index for a display column.
 
-		# Reshape Arabic characters if available
+		Args:
+			row: Row number (1-based)
+			col: Display column (1-based)
+
+		Returns:
+			int: Index of the character at the column, or the line length past the end
+		"""
+		columns = self.columnMap(row)
+		return columns[min(max(col, 1), len(columns)) - 1]
+
+	def columnAt(self, row: int, index: int) -> int:
+		"""
+		Get the display column of a string index.
+
+		Args:
+			row: Row number (1-based)
+			index: Character index in the row (0-based)
+
+		Returns:
+			int: First display column (1-based) of the cell holding the character;
+				one past the last column at the line end
+		"""
+		columns = self.columnMap(row)
+		width = len(columns) - 1
+		if index >= columns[width]:
+			return width + 1
+		# Column maps are non-decreasing: find the cell starting at or before index
+		position = bisect.bisect_right(columns, index, 0, width)
+		if position == 0:
+			return 1
+		return bisect.bisect_left(columns, columns[position - 1], 0, width) + 1
+
+
+class TableLayout:
+	"""
+	Column layout of a block of tabular rows in a ScreenGrid.
+
+	Attributes:
+		top: First row of the block (1-based); this is the header row
+		bottom: Last row of the block (1-based, inclusive)
+		columns: (start, end) display columns of each table column (1-based, inclusive)
+		headers: Header text of each column
+	"""
+
+	__slots__ = ('top', 'bottom', 'columns', 'headers')
+
+	def __init__(self, top: int, bottom: int, columns: list[tuple[int, int]], headers: list[str]) -> None:
+		self.top = top
+		self.bottom = bottom
+		self.columns = columns
+		self.headers = headers
+
+	def columnIndex(self, col: int) -> int:
+		"""
+		Get the table column at a display column.
+
+		Args:
+			col: Display column (1-based)
+
+		Returns:
+			int: Index of the column containing col, or of the nearest column to its left
+		"""
+		index = bisect.bisect_right(self.columns, (col, MAX_WINDOW_DIMENSION)) - 1
+		return max(index, 0)
+
+	def cell(self, grid: ScreenGrid, row: int, index: int) -> str:
+		"""
+		Get the text of a cell.
+
+		Args:
+			grid: Grid the layout was detected in
+			row: Row number (1-based)
+			index: Column index
+
+		Returns:
+			str: Cell text without surrounding whitespace
+		"""
+		start, end = self.columns[index]
+		return grid.span(row, start, end).strip()
+
+	def cellStart(self, grid: ScreenGrid, row: int, index: int) -> int:
+		"""
+		Get the display column where a cell's text begins.
+
+		Args:
+			grid: Grid the layout was detected in
+			row: Row number (1-based)
+			index: Column index
+
+		Returns:
+			int: First non-blank display column of the cell, or the column start if blank
+		"""
+		start, end = self.columns[index]
+		first = grid.indexAt(row, start)
+		text = grid.line(row)[first:grid.indexAt(row, end + 1)]
+		offset = len(text) - len(text.lstrip())
+		if offset == len(text):
+			return start
+		return grid.columnAt(row, first + offset)
+
+
+class TableDetector:
+	"""
+	Infers table columns from whitespace alignment in a block of rows.
+
+	A block is the run of non-blank rows around a row, stopping at shell
+	prompts, so a table printed by ``kubectl get pods``, ``docker ps`` or
+	``ps aux`` is found without including the command line above it.  Its
+	first row is taken as the header, however long the block is.
+
+	Column boundaries come from per-column occupancy counts.  Each row is
+	turned into a byte mask (1 for a non-blank display cell), and the masks
+	are summed as big integers with one byte lane per column, so every
+	column is counted in a single C-level addition per row.  Only the
+	header and the rows after it, MAX_BLOCK_ROWS in all, are counted, so no
+	lane can overflow.  Runs of columns occupied in more than a tenth of
+	the rows become table columns; a run with nothing in the header row is
+	merged into the column before it, so values containing spaces
+	(``/sbin/init splash``) stay in one column.  Each column is then
+	widened to cover the header text above it, so a header wider than its
+	values (``READY`` over ``1/1``) is not cut.
+
+	Layouts are cached by a hash of the block's rows, so moving around a
+	table that has not changed costs a hash and a dictionary lookup.
+
+	Example usage:
+		>>> detector = TableDetector()
+		>>> layout = detector.detect(grid, row)
+		>>> if layout:
+		>>>     print(layout.headers)  # ['NAME', 'READY', 'STATUS']
+	"""
+
+	# Rows counted per block; byte lanes hold counts up to 255
+	MAX_BLOCK_ROWS = 200
+	MIN_ROWS = 2
+	MIN_COLUMNS = 2
+	CACHE_SIZE = 32
+
+	_MASK_TABLE = bytes(0 if byte in b' \t' else 1 for byte in range(256))
+	_COLUMN_RUN_RE = re.compile(rb'\x01+')
+
+	def __init__(self) -> None:
+		"""Initialize the detector with an empty layout cache."""
+		self._cache: collections.OrderedDict[int, tuple[list[tuple[int, int]], list[str]] | None] = (
+			collections.OrderedDict()
+		)
+
+	def detect(self, grid: ScreenGrid, row: int) -> TableLayout | None:
+		"""
+		Detect the table containing a row.
+
+		Args:
+			grid: Screen grid
+			row: Row number (1-based)
+
+		Returns:
+			TableLayout or None if the row is not part of a table
+		"""
+		top, bottom = self._findBlock(grid, row)
+		if bottom - top + 1 < self.MIN_ROWS:
+			return None
+		key = hash(tuple(grid.line(r) for r in range(top, bottom + 1)))
+		cache = self._cache
+		if key in cache:
+			cache.move_to_end(key)
+			layout = cache[key]
+		else:
+			layout = cache[key] = self._inferColumns(grid, top, bottom)
+			if len(cache) > self.CACHE_SIZE:
+				cache.popitem(last=False)
+		if layout is None:
+			return None
+		return TableLayout(top, bottom, *layout)
+
+	def _findBlock(self, grid: ScreenGrid, row: int) -> tuple[int, int]:
+		"""Find the rows of the tabular block around a row; empty if the row is blank."""
+		if not self._isTableRow(grid.line(row)):
+			return (row, row - 1)
+		top = bottom = row
+		while top > 1 and self._isTableRow(grid.line(top - 1)):
+			top -= 1
+		while bottom < grid.rowCount and self._isTableRow(grid.line(bottom + 1)):
+			bottom += 1
+		return (top, bottom)
+
+	@staticmethod
+	def _isTableRow(line: str) -> bool:
+		"""Check whether a row can belong to a table: not blank and not a prompt."""
+		stripped = line.strip()
+		return bool(stripped) and _match_prompt_command(stripped) is None
+
+	def _rowMask(self, grid: ScreenGrid, row: int) -> bytes:
+		"""Get a row's occupancy mask, one byte per display column."""
+		line = grid.line(row)
+		if line.isascii():
+			return line.encode('ascii').translate(self._MASK_TABLE)
+		columns = grid.columnMap(row)
+		return bytes(0 if line[columns[c]].isspace() else 1 for c in range(len(columns) - 1))
+
+	def _inferColumns(self, grid: ScreenGrid, top: int, bottom: int) -> tuple[list[tuple[int, int]], list[str]] | None:
+		"""
+		Infer the columns of a block from its first MAX_BLOCK_ROWS rows.
+
+		Returns:
+			(columns, headers) or None if fewer than MIN_COLUMNS were found
+		"""
+		last = min(bottom, top + self.MAX_BLOCK_ROWS - 1)
+		masks = [self._rowMask(grid, row) for row in range(top, last + 1)]
+		width = max(len(mask) for mask in masks)
+		total = 0
+		for mask in masks:
+			total += int.from_bytes(mask, 'little')
+		counts = total.to_bytes(width, 'little')
+
+		# Tolerate a few rows spilling into the gaps between columns
+		tolerance = len(masks) // 10
+		occupied = counts.translate(bytes(0 if count <= tolerance else 1 for count in range(256)))
+		header = masks[0]
+		columns: list[tuple[int, int]] = []
+		for match in self._COLUMN_RUN_RE.finditer(occupied):
+			start, end = match.start(), match.end()
+			if columns and not any(header[start:end]):
+				columns[-1] = (columns[-1][0], end)
+			else:
+				columns.append((start + 1, end))
+		if len(columns) < self.MIN_COLUMNS:
+			return None
+		# Widen columns over the header words they overlap, up to their neighbours
+		for match in self._COLUMN_RUN_RE.finditer(header):
+			wordStart, wordEnd = match.start() + 1, match.end()
+			for index, (start, end) in enumerate(columns):
+				if wordStart <= end and wordEnd >= start:
+					low = columns[index - 1][1] + 1 if index else 1
+					high = columns[index + 1][0] - 1 if index + 1 < len(columns) else max(end, wordEnd)
+					columns[index] = (max(min(start, wordStart), low), min(max(end, wordEnd), high))
+					break
+		headers = [grid.span(top, start, end).strip() for start, end in columns]
+		return columns, headers
+
+
+class BidiHelper:
+	"""
+	Helper class for bidirectional text (RTL/LTR) handling.
+
+	Implements Unicode Bidirectional Algorithm (UAX #9) for proper handling of
+	right-to-left text (Arabic, Hebrew) mixed with left-to-right text.
+
+	Features:
+	- Automatic RTL text detection
+	- Bidirectional text reordering
+	- Arabic character reshaping
+	- Mixed RTL/LTR text support
+
+	Example usage:
+		>>> helper = BidiHelper()
+		>>>
+		>>> # Detect RTL text
+		>>> is_rtl = helper.is_rtl("مرحبا")  # Arabic "Hello"
+		>>> print(is_rtl)  # True
+		>>>
+		>>> # Process mixed RTL/LTR text
+		>>> text = "Hello مرحبا World"
+		>>> display_text = helper.process_text(text)
+		>>>
+		>>> # Extract column range with RTL awareness
+		>>> result = helper.extract_column_range_rtl(text, 1, 5)
+
+	Dependencies:
+		Requires optional packages:
+		- python-bidi>=0.4.2
+		- arabic-reshaper>=2.1.3
+
+		Gracefully degrades if packages not available.
+
+	Thread Safety:
+		All methods are thread-safe (no shared mutable state).
+
+	Section Reference:
+		FUTURE_ENHANCEMENTS.md Section 4.1 (lines 465-526)
+	"""
+
+	def __init__(self):
+		"""Initialize BidiHelper with optional dependencies."""
+		try:
+			from bidi.algorithm import get_display
+			self._get_display = get_display
+			self._bidi_available = True
+		except ImportError:
+			self._bidi_available = False
+
+		try:
+			import arabic_reshaper
+			self._reshaper = arabic_reshaper.reshape
+			self._reshaper_available = True
+		except ImportError:
+			self._reshaper_available = False
+
+	def is_available(self) -> bool:
+		"""
+		Check if bidirectional text processing is available.
+
+		Returns:
+			bool: True if bidi libraries are available
+		"""
+		return self._bidi_available
+
+	def is_rtl(self, text: str) -> bool:
+		"""
+		Detect if text is primarily right-to-left.
+
+		Uses Unicode character properties to determine text direction.
+
+		Args:
+			text: Text to analyze
+
+		Returns:
+			bool: True if text is primarily RTL
+		"""
+		if not text:
+			return False
+
+		rtl_count = 0
+		ltr_count = 0
+
+		# RTL Unicode ranges:
+		# Arabic: U+0600-U+06FF, U+0750-U+077F
+		# Hebrew: U+0590-U+05FF
+		for char in text:
+			code = ord(char)
+			if (0x0590 <= code <= 0x05FF or  # Hebrew
+				0x0600 <= code <= 0x06FF or  # Arabic
+				0x0750 <= code <= 0x077F):   # Arabic Supplement
+				rtl_count += 1
+			elif char.isalpha():
+				ltr_count += 1
+
+		return rtl_count > ltr_count
+
+	def process_text(self, text: str) -> str:
+		"""
+		Process text for correct bidirectional display.
+
+		Applies Arabic reshaping and bidirectional algorithm.
+
+		Args:
+			text: Input text (may contain mixed RTL/LTR)
+
+		Returns:
+			str: Text reordered for visual display
+		"""
+		if not text:
+			return text
+
+		# If libraries not available, return as-is
+		if not self._bidi_available:
+			return text
+
+		# Reshape Arabic characters if available
 		processed = text
 		if self._reshaper_available and self.is_rtl(text):
 			try:
@@ -1296,32 +2082,112 @@ class WindowDefinition:
 		- 'monitor': Track changes but announce differently
 
 	Coordinate System:
-		All coordinates are 1-based (row 1, col 1 is top-left).
+		All coordinates are 1-based (row 1, col 1 is top-left).  Negative
+		values count from the end (-1 is the last row or column) and strings
+		such as "50%" are fractions of the terminal size.  Relative
+		coordinates are resolved into top/bottom/left/right by resolve();
+		until the size is known a relative window contains no position.
 	"""
 
-	__slots__ = ('name', 'top', 'bottom', 'left', 'right', 'mode', 'enabled')
+	__slots__ = ('name', 'top', 'bottom', 'left', 'right', 'mode', 'enabled', 'spec', 'relative', '_resolvedFor')
 
-	def __init__(self, name: str, top: int, bottom: int, left: int, right: int,
+	def __init__(self, name: str, top: int | str, bottom: int | str, left: int | str, right: int | str,
 				 mode: str = 'announce', enabled: bool = True) -> None:
 		"""
 		Initialize a window definition.
 
 		Args:
 			name: Window name (e.g., "main pane", "status line")
-			top: Top row (1-based)
-			bottom: Bottom row (1-based)
-			left: Left column (1-based)
-			right: Right column (1-based)
+			top: Top row (1-based, negative from the end, or "N%")
+			bottom: Bottom row (1-based, negative from the end, or "N%")
+			left: Left column (1-based, negative from the end, or "N%")
+			right: Right column (1-based, negative from the end, or "N%")
 			mode: Window mode ('announce', 'silent', 'monitor')
 			enabled: Whether window is currently active
+
+		Raises:
+			ValueError: If a coordinate is not an integer or a percentage
 		"""
 		self.name: str = name
-		self.top: int = top
-		self.bottom: int = bottom
-		self.left: int = left
-		self.right: int = right
 		self.mode: str = mode  # 'announce' = read content, 'silent' = suppress, 'monitor' = track changes
 		self.enabled: bool = enabled
+		# Coordinates as given; top/bottom/left/right hold the resolved integers
+		self.spec: tuple = tuple(self._parseCoordinate(v) for v in (top, bottom, left, right))
+		self.relative: bool = any(isinstance(v, str) or v < 0 for v in self.spec)
+		self._resolvedFor: tuple[int, int] | None = None
+		if self.relative:
+			# Empty until resolve() is given the terminal size
+			self.top, self.bottom, self.left, self.right = 0, -1, 0, -1
+		else:
+			self.top, self.bottom, self.left, self.right = self.spec
+
+	@staticmethod
+	def _parseCoordinate(value: Any) -> int | str:
+		"""
+		Validate one coordinate.
+
+		Args:
+			value: Integer, integer string or percentage string such as "50%"
+
+		Returns:
+			int | str: The integer, or the stripped percentage string
+
+		Raises:
+			ValueError: If the value is neither an integer nor a percentage
+				between 0 and 100
+		"""
+		if isinstance(value, str):
+			text = value.strip()
+			if text.endswith('%'):
+				try:
+					percent = float(text[:-1])
+				except ValueError:
+					raise ValueError(f"invalid window coordinate {value!r}") from None
+				if not 0 <= percent <= 100:
+					raise ValueError(f"window coordinate {value!r} is not between 0% and 100%")
+				return text
+			try:
+				return int(text)
+			except ValueError:
+				raise ValueError(f"invalid window coordinate {value!r}") from None
+		if isinstance(value, float) and value.is_integer():
+			return int(value)
+		if isinstance(value, bool) or not isinstance(value, int):
+			raise ValueError(f"invalid window coordinate {value!r}")
+		return value
+
+	@staticmethod
+	def _resolveCoordinate(value: int | str, size: int) -> int:
+		"""Resolve one validated coordinate against a dimension of *size* cells."""
+		if isinstance(value, str):
+			return max(1, min(size, round(size * float(value[:-1]) / 100)))
+		if value < 0:
+			return max(1, size + 1 + value)
+		return value
+
+	def resolve(self, rows: int, cols: int) -> bool:
+		"""
+		Resolve relative coordinates against the terminal size.
+
+		The result is cached per size, so calls with unchanged dimensions
+		are a tuple comparison and contains() stays plain integer checks.
+
+		Args:
+			rows: Terminal height in rows
+			cols: Terminal width in columns
+
+		Returns:
+			bool: True if the resolved bounds were recomputed
+		"""
+		if not self.relative or self._resolvedFor == (rows, cols):
+			return False
+		top, bottom, left, right = self.spec
+		self.top = self._resolveCoordinate(top, rows)
+		self.bottom = self._resolveCoordinate(bottom, rows)
+		self.left = self._resolveCoordinate(left, cols)
+		self.right = self._resolveCoordinate(right, cols)
+		self._resolvedFor = (rows, cols)
+		return True
 
 	def contains(self, row: int, col: int) -> bool:
 		"""
@@ -1340,27 +2206,39 @@ class WindowDefinition:
 
 	def toDict(self) -> dict[str, Any]:
 		"""Convert window definition to dictionary for serialization."""
+		top, bottom, left, right = self.spec if self.relative else (self.top, self.bottom, self.left, self.right)
 		return {
 			'name': self.name,
-			'top': self.top,
-			'bottom': self.bottom,
-			'left': self.left,
-			'right': self.right,
+			'top': top,
+			'bottom': bottom,
+			'left': left,
+			'right': right,
 			'mode': self.mode,
 			'enabled': self.enabled,
 		}
 
 	@classmethod
 	def fromDict(cls, data: dict[str, Any]) -> 'WindowDefinition':
-		"""Create window definition from dictionary."""
+		"""
+		Create window definition from dictionary.
+
+		An invalid coordinate, e.g. in a hand-edited profile file, is logged
+		and replaced by the window's full extent so the profile still loads.
+		"""
+		name = data.get('name', '')
+		coordinates = {}
+		for key, fallback in (('top', 1), ('bottom', -1), ('left', 1), ('right', -1)):
+			try:
+				coordinates[key] = cls._parseCoordinate(data.get(key, 0))
+			except ValueError as e:
+				import logHandler
+				logHandler.log.warning(f"Terminal Access: Window {name!r}: {e}; using {fallback} for {key}")
+				coordinates[key] = fallback
 		return cls(
-			name=data.get('name', ''),
-			top=data.get('top', 0),
-			bottom=data.get('bottom', 0),
-			left=data.get('left', 0),
-			right=data.get('right', 0),
+			name=name,
 			mode=data.get('mode', 'announce'),
 			enabled=data.get('enabled', True),
+			**coordinates,
 		)
 
 
@@ -1379,8 +2257,8 @@ class ApplicationProfile:
 		>>> vim_profile.cursorTrackingMode = CT_WINDOW  # Window-based tracking
 		>>>
 		>>> # Define screen regions
-		>>> vim_profile.addWindow('editor', 1, 9997, 1, 9999, mode='announce')
-		>>> vim_profile.addWindow('status', 9998, 9999, 1, 9999, mode='silent')
+		>>> vim_profile.addWindow('editor', 1, -3, 1, -1, mode='announce')
+		>>> vim_profile.addWindow('status', -2, -1, 1, -1, mode='silent')
 		>>>
 		>>> # Check which window cursor is in
 		>>> window = vim_profile.getWindowAtPosition(row=10, col=40)
@@ -1405,6 +2283,9 @@ class ApplicationProfile:
 		Windows are checked in order; first match wins.
 	"""
 
+	# Rows per bucket in the window interval index
+	WINDOW_BUCKET_ROWS = 32
+
 	def __init__(self, appName: str, displayName: str | None = None) -> None:
 		"""
 		Initialize an application profile.
@@ -1431,20 +2312,102 @@ class ApplicationProfile:
 
 		# Window definitions (list of WindowDefinition objects)
 		self.windows: list[WindowDefinition] = []
+		# Windows inferred at run time (not saved); checked after self.windows
+		self.transientWindows: list[WindowDefinition] = []
+		# Infer panes from box-drawing borders (see PaneLayoutAnalyzer)
+		self.autoPanes: bool = False
+		# Row-bucket index: bucket -> windows overlapping it, in list order
+		self._windowIndex: dict[int, list[WindowDefinition]] = {}
+		self._indexedWindowCount = 0
+		# Terminal size relative windows were last resolved against
+		self._windowDimensions: tuple[int, int] | None = None
 
 		# Custom gestures (dict of gesture -> function name)
 		self.customGestures: dict[str, str] = {}
 
-	def addWindow(self, name: str, top: int, bottom: int, left: int, right: int,
+		# Detection rules (dicts with optional 'app', 'title' regex and 'priority')
+		self.detectionRules: list[dict[str, Any]] = []
+
+	def addWindow(self, name: str, top: int | str, bottom: int | str, left: int | str, right: int | str,
 				  mode: str = 'announce') -> WindowDefinition:
 		"""Add a window definition to this profile."""
 		window = WindowDefinition(name, top, bottom, left, right, mode)
+		if self._windowDimensions:
+			window.resolve(*self._windowDimensions)
 		self.windows.append(window)
+		self.reindexWindows()
 		return window
 
-	def getWindowAtPosition(self, row: int, col: int) -> WindowDefinition | None:
-		"""Get the window containing the specified position."""
+	def resolveWindows(self, rows: int, cols: int) -> None:
+		"""
+		Resolve relative window coordinates for a terminal size.
+
+		Only does work when the size differs from the last call; the index
+		is rebuilt if any window's bounds moved.
+
+		Args:
+			rows: Terminal height in rows
+			cols: Terminal width in columns
+		"""
+		if self._windowDimensions == (rows, cols):
+			return
+		self._windowDimensions = (rows, cols)
+		changed = False
 		for window in self.windows:
+			changed = window.resolve(rows, cols) or changed
+		if changed:
+			self.reindexWindows()
+
+	def reindexWindows(self) -> None:
+		"""
+		Rebuild the row-bucketed interval index over self.windows.
+
+		Each bucket of WINDOW_BUCKET_ROWS rows lists the windows whose row
+		range overlaps it, in definition order, so a lookup only tests the
+		few windows near the row and first-match-wins is preserved.  Call
+		after changing a window's rows in place; additions are picked up
+		automatically.
+		"""
+		index: dict[int, list[WindowDefinition]] = {}
+		size = self.WINDOW_BUCKET_ROWS
+		for window in self.windows + self.transientWindows:
+			top = max(window.top, 0)
+			bottom = min(window.bottom, MAX_WINDOW_DIMENSION)
+			for bucket in range(top // size, bottom // size + 1) if top <= bottom else ():
+				index.setdefault(bucket, []).append(window)
+		self._windowIndex = index
+		self._indexedWindowCount = len(self.windows)
+
+	def setTransientWindows(self, windows: list[WindowDefinition]) -> None:
+		"""
+		Replace the run-time windows, such as automatically detected panes.
+
+		Transient windows are matched after the profile's own windows and
+		are not serialized.
+
+		Args:
+			windows: New transient windows
+		"""
+		if windows is self.transientWindows:
+			return
+		self.transientWindows = windows
+		if self._windowDimensions:
+			for window in windows:
+				window.resolve(*self._windowDimensions)
+		self.reindexWindows()
+
+	def getWindowAtPosition(self, row: int, col: int) -> WindowDefinition | None:
+		"""Get the first window containing the specified position."""
+		windows = self.windows
+		if not windows and not self.transientWindows:
+			return None
+		if self._indexedWindowCount != len(windows):
+			self.reindexWindows()
+		if 0 <= row <= MAX_WINDOW_DIMENSION:
+			windows = self._windowIndex.get(row // self.WINDOW_BUCKET_ROWS, ())
+		else:
+			windows = windows + self.transientWindows
+		for window in windows:
 			if window.contains(row, col):
 				return window
 		return None
@@ -1467,6 +2430,8 @@ class ApplicationProfile:
 			'indentationOnLineRead': self.indentationOnLineRead,
 			'windows': [w.toDict() for w in self.windows],
 			'customGestures': self.customGestures,
+			'detectionRules': self.detectionRules,
+			'autoPanes': self.autoPanes,
 		}
 
 	@classmethod
@@ -1488,16 +2453,349 @@ class ApplicationProfile:
 		# Restore windows
 		for winData in data.get('windows', []):
 			profile.windows.append(WindowDefinition.fromDict(winData))
+		profile.reindexWindows()
 
 		profile.customGestures = data.get('customGestures', {})
+		profile.detectionRules = list(data.get('detectionRules', []))
+		profile.autoPanes = bool(data.get('autoPanes', False))
 		return profile
 
 
-class ProfileManager:
+class PaneLayoutAnalyzer:
 	"""
-	Manager for application-specific profiles.
+	Infers rectangular panes from box-drawing borders in a terminal snapshot.
 
-	Handles profile creation, detection, loading, and application.
+	Border cells are box-drawing characters (U+2500-U+257F) and the ASCII
+	separators ``|``, ``-`` and ``+`` that tmux and TUI toolkits draw
+	between panes.  Only structural borders count: a vertical border cell
+	must continue on the row above or below, and a horizontal run must be
+	at least MIN_PANE_COLS long and reach a vertical border or the screen
+	edge at both ends, so pipes and dashes inside text are ignored.
+
+	Each row is split into runs of non-border columns.  Runs with the same
+	extent on adjacent rows are joined, and each joined group's bounding
+	box is a pane.  A full-width status line therefore stays separate from
+	the panes above it.
+
+	The layout is cached by a hash of the border skeleton (the positions of
+	border runs on every row), so snapshots whose text changes but whose
+	borders do not reuse the previous panes without recomputing them.
+
+	Example usage:
+		>>> analyzer = PaneLayoutAnalyzer()
+		>>> panes = analyzer.analyze(snapshot_text)
+		>>> [(p.name, p.top, p.bottom, p.left, p.right) for p in panes]
+	"""
+
+	# Only the last rows are analysed; a screen layout lives at the bottom
+	MAX_ROWS = 300
+	# Smallest pane kept, in rows and columns
+	MIN_PANE_ROWS = 2
+	MIN_PANE_COLS = 4
+
+	_BORDER_RUN_RE = re.compile(r'[\u2500-\u257f|+\-]+')
+	# Border characters that cannot be part of a vertical border
+	_HORIZONTAL_ONLY = frozenset(
+		'-\u2500\u2501\u2550\u2504\u2505\u2508\u2509\u254c\u254d\u2574\u2576\u2578\u257a\u257c\u257e'
+	)
+
+	def __init__(self) -> None:
+		"""Initialize with an empty layout cache."""
+		self._key: int | None = None
+		self._panes: list[WindowDefinition] = []
+
+	def analyze(self, text: str) -> list[WindowDefinition]:
+		"""
+		Get the panes of a snapshot.
+
+		Args:
+			text: Full terminal buffer text
+
+		Returns:
+			list[WindowDefinition]: Panes in reading order (empty when there
+				is no split layout); the same list object while the border
+				skeleton is unchanged
+		"""
+		lines = text.split('\n')
+		offset = max(0, len(lines) - self.MAX_ROWS)
+		lines = [line.rstrip() for line in lines[offset:]]
+		width = max(map(len, lines), default=0)
+		# Per row: border runs and the columns that can carry a vertical border
+		horizontal = self._HORIZONTAL_ONLY
+		skeleton = []
+		for line in lines:
+			spans = tuple(match.span() for match in self._BORDER_RUN_RE.finditer(line))
+			vertical = frozenset(c for a, b in spans for c in range(a, b) if line[c] not in horizontal)
+			skeleton.append((spans, vertical))
+		skeleton = tuple(skeleton)
+		key = hash((offset, width, skeleton))
+		if key != self._key:
+			self._key = key
+			self._panes = self._infer_panes(skeleton, width, offset)
+		return self._panes
+
+	def _structural_borders(self, skeleton: tuple, width: int) -> list[list[tuple[int, int]]]:
+		"""Keep only the border spans that separate panes, per row."""
+		rows = []
+		for row, (spans, verticalCols) in enumerate(skeleton):
+			above = skeleton[row - 1][1] if row > 0 else frozenset()
+			below = skeleton[row + 1][1] if row + 1 < len(skeleton) else frozenset()
+			kept = []
+			for start, end in spans:
+				vertical = [
+					c for c in range(start, end)
+					if c in verticalCols and (c in above or c in below)
+				]
+				if (end - start >= self.MIN_PANE_COLS and (start == 0 or start in vertical)
+						and (end == width or end - 1 in vertical)):
+					kept.append((start, end))
+				else:
+					kept.extend((c, c + 1) for c in vertical)
+			rows.append(kept)
+		return rows
+
+	def _infer_panes(self, skeleton: tuple, width: int, offset: int) -> list[WindowDefinition]:
+		"""Join equal non-border runs across rows and return their bounding boxes."""
+		if not any(row[0] for row in skeleton):
+			return []
+		parent: list[int] = []
+		boxes: list[list[int]] = []  # [top, bottom, left, right], 0-based inclusive
+
+		def find(i):
+			while parent[i] != i:
+				parent[i] = parent[parent[i]]
+				i = parent[i]
+			return i
+
+		previous: dict[tuple[int, int], int] = {}
+		for row, borders in enumerate(self._structural_borders(skeleton, width)):
+			current = {}
+			start = 0
+			for borderStart, borderEnd in borders + [(width, width)]:
+				if borderStart > start:
+					run = len(parent)
+					parent.append(run)
+					boxes.append([row, row, start, borderStart - 1])
+					extent = (start, borderStart - 1)
+					current[extent] = run
+					if extent in previous:
+						parent[find(previous[extent])] = run
+				start = max(start, borderEnd)
+			previous = current
+
+		merged: dict[int, list[int]] = {}
+		for run, box in enumerate(boxes):
+			target = merged.setdefault(find(run), list(box))
+			target[0] = min(target[0], box[0])
+			target[1] = max(target[1], box[1])
+
+		rects = sorted(
+			(top, left, bottom, right) for top, bottom, left, right in merged.values()
+			if bottom - top + 1 >= self.MIN_PANE_ROWS and right - left + 1 >= self.MIN_PANE_COLS
+		)
+		if len(rects) < 2:
+			return []
+		panes = []
+		for number, (top, left, bottom, right) in enumerate(rects, 1):
+			# Translators: Name of an automatically detected terminal pane
+			name = _("pane {number}").format(number=number)
+			panes.append(WindowDefinition(name, top + offset + 1, bottom + offset + 1, left + 1, right + 1))
+		return panes
+
+
+class ProfileStore:
+	"""
+	On-disk store for custom and edited application profiles.
+
+	Each profile is one JSON file in the store directory, next to a small
+	``index.json`` that maps profile names to their files and carries each
+	profile's detection rules.  Opening the store reads only the index, so
+	detection rules are registered at startup while profile files are parsed
+	only when a profile is first used.
+
+	Writes are atomic: data goes to a temporary file in the same directory,
+	is flushed to disk, and then replaces the target with ``os.replace``.
+	A crash mid-write leaves the previous file intact.
+
+	Example usage:
+		>>> store = ProfileStore.forConfigDirectory()
+		>>> manager = ProfileManager(store=store)
+		>>> manager.importProfile(data)  # Saved to disk as well
+	"""
+
+	INDEX_FILE = "index.json"
+	FORMAT_VERSION = 1
+
+	def __init__(self, directory: str) -> None:
+		"""
+		Initialize the store.
+
+		Args:
+			directory: Directory holding the profile files; created on first write
+		"""
+		self.directory = directory
+		self._index: dict[str, dict[str, Any]] | None = None
+
+	@classmethod
+	def forConfigDirectory(cls) -> 'ProfileStore | None':
+		"""
+		Open the store under the NVDA user configuration directory.
+
+		Returns:
+			ProfileStore or None if the configuration directory is unknown
+		"""
+		try:
+			import globalVars
+			configPath = globalVars.appArgs.configPath
+			if not isinstance(configPath, str) or not configPath:
+				return None
+			return cls(os.path.join(configPath, "terminalAccess", "profiles"))
+		except (ImportError, AttributeError):
+			return None
+
+	def index(self) -> dict[str, dict[str, Any]]:
+		"""
+		Get the profile index, reading it from disk on first use.
+
+		Returns:
+			dict: Profile name to index entry with 'file' and 'detectionRules'
+		"""
+		if self._index is None:
+			self._index = {}
+			data = self._readJson(os.path.join(self.directory, self.INDEX_FILE))
+			if isinstance(data, dict) and isinstance(data.get('profiles'), dict):
+				self._index = {
+					name: entry for name, entry in data['profiles'].items()
+					if isinstance(entry, dict) and isinstance(entry.get('file'), str)
+				}
+		return self._index
+
+	def load(self, name: str) -> ApplicationProfile | None:
+		"""
+		Parse one stored profile.
+
+		Args:
+			name: Profile name
+
+		Returns:
+			ApplicationProfile or None if missing or unreadable
+		"""
+		entry = self.index().get(name)
+		if entry is None:
+			return None
+		data = self._readJson(os.path.join(self.directory, entry['file']))
+		if not isinstance(data, dict):
+			return None
+		try:
+			return ApplicationProfile.fromDict(data)
+		except Exception as e:
+			import logHandler
+			logHandler.log.warning(f"Terminal Access: Ignoring invalid stored profile {name}: {e}")
+			return None
+
+	def save(self, profile: ApplicationProfile) -> bool:
+		"""
+		Write a profile and update the index.
+
+		Args:
+			profile: Profile to store
+
+		Returns:
+			bool: True if both files were written
+		"""
+		index = self.index()
+		entry = index.get(profile.appName) or {'file': self._fileName(profile.appName)}
+		try:
+			self._writeJson(os.path.join(self.directory, entry['file']), profile.toDict())
+			index[profile.appName] = {'file': entry['file'], 'detectionRules': list(profile.detectionRules)}
+			self._writeIndex()
+			return True
+		except (OSError, TypeError, ValueError) as e:
+			import logHandler
+			logHandler.log.error(f"Terminal Access: Failed to save profile {profile.appName}: {e}")
+			return False
+
+	def delete(self, name: str) -> bool:
+		"""
+		Remove a stored profile.
+
+		Args:
+			name: Profile name
+
+		Returns:
+			bool: True if the profile was stored and has been removed
+		"""
+		entry = self.index().pop(name, None)
+		if entry is None:
+			return False
+		try:
+			self._writeIndex()
+			os.remove(os.path.join(self.directory, entry['file']))
+		except OSError as e:
+			import logHandler
+			logHandler.log.warning(f"Terminal Access: Failed to delete stored profile {name}: {e}")
+		return True
+
+	@staticmethod
+	def _fileName(name: str) -> str:
+		"""Derive a file name that is safe on Windows and unique per profile name."""
+		safe = re.sub(r'[^\w.-]', '_', name).strip('.') or 'profile'
+		if safe != name:
+			safe = f"{safe}-{zlib.crc32(name.encode('utf-8')):08x}"
+		return f"{safe}.json"
+
+	def _writeIndex(self) -> None:
+		"""Write the index atomically."""
+		self._writeJson(
+			os.path.join(self.directory, self.INDEX_FILE),
+			{'version': self.FORMAT_VERSION, 'profiles': self._index or {}},
+		)
+
+	def _writeJson(self, path: str, data: Any) -> None:
+		"""
+		Write JSON atomically via a temporary file and ``os.replace``.
+
+		Args:
+			path: Target file
+			data: JSON-serializable data
+
+		Raises:
+			OSError, TypeError, ValueError: If the data could not be written
+		"""
+		os.makedirs(self.directory, exist_ok=True)
+		tempPath = f"{path}.tmp"
+		try:
+			with open(tempPath, 'w', encoding='utf-8') as f:
+				json.dump(data, f, indent=2, ensure_ascii=False)
+				f.flush()
+				os.fsync(f.fileno())
+			os.replace(tempPath, path)
+		except BaseException:
+			try:
+				os.remove(tempPath)
+			except OSError:
+				pass
+			raise
+
+	@staticmethod
+	def _readJson(path: str) -> Any:
+		"""Read a JSON file, returning None if it is missing or corrupt."""
+		try:
+			with open(path, 'r', encoding='utf-8') as f:
+				return json.load(f)
+		except FileNotFoundError:
+			return None
+		except (OSError, ValueError) as e:
+			import logHandler
+			logHandler.log.warning(f"Terminal Access: Ignoring unreadable profile file {path}: {e}")
+			return None
+
+
+class ProfileManager:
+	"""
+	Manager for application-specific profiles.
+
+	Handles profile creation, detection, loading, and application.
 
 	Example usage:
 		>>> # Initialize with default profiles (vim, tmux, htop, etc.)
@@ -1543,13 +2841,78 @@ class ProfileManager:
 		1. Check app module name (focusObject.appModule.appName)
 		2. Check window title for common patterns
 		3. Return 'default' if no match found
+
+	Persistence:
+		With a ProfileStore, added and imported profiles are saved to disk
+		and removed profiles are deleted.  Stored profiles are listed and
+		their detection rules registered at startup, but each is parsed only
+		when getProfile first asks for it.  A stored profile with a built-in
+		name replaces the built-in one when loaded.
 	"""
 
-	def __init__(self) -> None:
-		"""Initialize the profile manager with default profiles."""
+	# Bounded memo of detection results per (appName, title)
+	DETECTION_CACHE_SIZE = 128
+	# Numbered backreference (\1 to \9) whose backslash is not itself escaped
+	_BACKREFERENCE_RE = re.compile(r'(?<!\\)(?:\\\\)*\\[1-9]')
+
+	def __init__(self, store: ProfileStore | None = None) -> None:
+		"""
+		Initialize the profile manager with default profiles.
+
+		Args:
+			store: Optional on-disk store for custom profiles
+		"""
 		self.profiles: dict[str, ApplicationProfile] = {}
+		self._store = store
+		# Stored profiles whose files have not been parsed yet
+		self._pendingProfiles: set[str] = set()
 		self.activeProfile: ApplicationProfile | None = None
+		# Detection rules: (priority, sequence, profile name, app name, title regex, built-in)
+		self._detectionRules: list[tuple[int, int, str, str | None, str | None, bool]] = []
+		self._ruleSequence = 0
+		self._appRules: dict[str, str] = {}
+		self._titleMatcher: re.Pattern[str] | None = None
+		self._titleGroups: dict[str, str] = {}
+		self._detectionCache: collections.OrderedDict[tuple[str, str], str] = collections.OrderedDict()
+		for priority, name, pattern in _BUILTIN_DETECTION_RULES:
+			self.addDetectionRule(name, title=pattern, priority=priority, builtin=True)
 		self._initializeDefaultProfiles()
+		if store is not None:
+			self._registerStoredProfiles()
+
+	def _registerStoredProfiles(self) -> None:
+		"""List stored profiles and register their detection rules without parsing them."""
+		for name, entry in self._store.index().items():
+			if not isinstance(name, str) or not isinstance(entry, dict):
+				continue
+			self._pendingProfiles.add(name)
+			rules = entry.get('detectionRules')
+			self._addProfileRules(name, rules if isinstance(rules, list) else [])
+
+	def _addProfileRules(self, profileName: str, rules: list[dict[str, Any]]) -> None:
+		"""
+		Register a profile's own detection rules, replacing earlier ones.
+
+		Rules may come from hand-edited files, so each one is type-checked
+		and a bad rule is skipped with a warning instead of raising.
+		"""
+		self.removeDetectionRules(profileName, includeBuiltin=False)
+		for rule in rules:
+			try:
+				title = rule.get('title')
+				app = rule.get('app')
+				priority = rule.get('priority', 0)
+				if (
+					not isinstance(title, (str, type(None)))
+					or not isinstance(app, (str, type(None)))
+					or not isinstance(priority, int) or isinstance(priority, bool)
+				):
+					raise TypeError("title and app must be strings and priority an integer")
+				if not self.addDetectionRule(profileName, title=title, app=app, priority=priority):
+					raise ValueError("empty rule or invalid title pattern")
+			except Exception as e:
+				import logHandler
+				logHandler.log.warning(f"Terminal Access: Ignoring detection rule {rule!r} of profile {profileName}: {e}")
 
 	def _initializeDefaultProfiles(self) -> None:
 		"""Create default profiles for popular terminal applications."""
@@ -1559,25 +2922,27 @@ class ProfileManager:
 		vim.punctuationLevel = PUNCT_MOST  # More punctuation for code
 		vim.cursorTrackingMode = CT_WINDOW  # Use window tracking
 		# Silence bottom two lines (status line and command line)
-		vim.addWindow('editor', 1, 9999, 1, 9999, mode='announce')
-		vim.addWindow('status', 9999, 9999, 1, 9999, mode='silent')
+		vim.addWindow('editor', 1, -3, 1, -1, mode='announce')
+		vim.addWindow('status', -2, -1, 1, -1, mode='silent')
 		self.profiles['vim'] = vim
 		self.profiles['nvim'] = vim  # Same profile for neovim
 
 		# tmux profile
 		tmux = ApplicationProfile('tmux', 'tmux (Terminal Multiplexer)')
-		tmux.cursorTrackingMode = CT_STANDARD
+		# Window tracking over panes inferred from the split borders
+		tmux.cursorTrackingMode = CT_WINDOW
+		tmux.autoPanes = True
 		# Status bar at bottom (typically last line)
-		tmux.addWindow('status', 9999, 9999, 1, 9999, mode='silent')
+		tmux.addWindow('status', -1, -1, 1, -1, mode='silent')
 		self.profiles['tmux'] = tmux
 
 		# htop profile
 		htop = ApplicationProfile('htop', 'htop (Process Viewer)')
 		htop.repeatedSymbols = False  # Lots of repeated characters in bars
 		# Header area (first ~4 lines with CPU/Memory meters)
-		htop.addWindow('header', 1, 4, 1, 9999, mode='announce')
+		htop.addWindow('header', 1, 4, 1, -1, mode='announce')
 		# Process list (main area)
-		htop.addWindow('processes', 5, 9999, 1, 9999, mode='announce')
+		htop.addWindow('processes', 5, -1, 1, -1, mode='announce')
 		self.profiles['htop'] = htop
 
 		# less/more pager profile
@@ -1597,8 +2962,8 @@ class ProfileManager:
 		nano = ApplicationProfile('nano', 'GNU nano')
 		nano.cursorTrackingMode = CT_STANDARD
 		# Silence bottom two lines (status and shortcuts)
-		nano.addWindow('editor', 1, 9997, 1, 9999, mode='announce')
-		nano.addWindow('shortcuts', 9998, 9999, 1, 9999, mode='silent')
+		nano.addWindow('editor', 1, -3, 1, -1, mode='announce')
+		nano.addWindow('shortcuts', -2, -1, 1, -1, mode='silent')
 		self.profiles['nano'] = nano
 
 		# irssi (IRC client) profile
@@ -1606,7 +2971,7 @@ class ProfileManager:
 		irssi.punctuationLevel = PUNCT_SOME  # Basic punctuation for chat
 		irssi.linePause = False  # Fast reading for chat
 		# Status bar at bottom
-		irssi.addWindow('status', 9999, 9999, 1, 9999, mode='silent')
+		irssi.addWindow('status', -1, -1, 1, -1, mode='silent')
 		self.profiles['irssi'] = irssi
 
 		# Section 5.1: Third-party terminal profiles (v1.0.26+)
@@ -1745,8 +3110,8 @@ class ProfileManager:
 		claude.linePause = False  # Fast reading for streaming responses
 		claude.keyEcho = False  # Don't echo typing during input
 		# Silence bottom status bar region
-		claude.addWindow('conversation', 1, 9997, 1, 9999, mode='announce')
-		claude.addWindow('statusbar', 9998, 9999, 1, 9999, mode='silent')
+		claude.addWindow('conversation', 1, -3, 1, -1, mode='announce')
+		claude.addWindow('statusbar', -2, -1, 1, -1, mode='silent')
 		self.profiles['claude'] = claude
 
 		# lazygit profile
@@ -1756,7 +3121,7 @@ class ProfileManager:
 		lazygit.keyEcho = False  # Single-key shortcuts
 		lazygit.cursorTrackingMode = CT_WINDOW
 		# Panel layout: announce all content
-		lazygit.addWindow('main', 1, 9999, 1, 9999, mode='announce')
+		lazygit.addWindow('main', 1, -1, 1, -1, mode='announce')
 		self.profiles['lazygit'] = lazygit
 
 		# btop/btm profile (system monitor)
@@ -1765,8 +3130,8 @@ class ProfileManager:
 		btop.keyEcho = False  # Single-key navigation
 		btop.linePause = False  # Fast refresh rates
 		# Header with CPU/memory meters
-		btop.addWindow('header', 1, 6, 1, 9999, mode='announce')
-		btop.addWindow('processes', 7, 9999, 1, 9999, mode='announce')
+		btop.addWindow('header', 1, 6, 1, -1, mode='announce')
+		btop.addWindow('processes', 7, -1, 1, -1, mode='announce')
 		self.profiles['btop'] = btop
 		self.profiles['btm'] = btop  # bottom uses same profile
 
@@ -1786,10 +3151,115 @@ class ProfileManager:
 		k9s.linePause = False  # Fast status updates
 		self.profiles['k9s'] = k9s
 
+	def addDetectionRule(self, profileName: str, title: str | None = None,
+			app: str | None = None, priority: int = 0, builtin: bool = False) -> bool:
+		"""
+		Add a rule mapping an application or window title to a profile.
+
+		NVDA's app name is the process executable name, so an app rule also
+		serves as a process rule.
+
+		Args:
+			profileName: Profile to select when the rule matches
+			title: Case-insensitive regex searched in the window title
+			app: Exact app (process) name, case-insensitive
+			priority: Higher priorities win among matching title rules
+			builtin: Mark the rule as one of the add-on's own, kept when a
+				custom profile of the same name is removed
+
+		Returns:
+			bool: True if added, False if the rule was empty or the regex invalid
+		"""
+		if not title and not app:
+			return False
+		if title:
+			# Titles are matched inside a named lookahead in one combined
+			# pattern: inline global flags are rejected there, and group
+			# numbers shift, so named groups and backreferences are refused
+			if self._BACKREFERENCE_RE.search(title):
+				return False
+			try:
+				if re.compile(f"(?=.*?(?P<r0>{title}))", re.IGNORECASE | re.DOTALL).groupindex.keys() != {"r0"}:
+					return False
+			except re.error:
+				return False
+		rule = (priority, self._ruleSequence, profileName, app and app.lower(), title, builtin)
+		self._detectionRules.append(rule)
+		self._ruleSequence += 1
+		try:
+			self._compileDetectionRules()
+		except re.error:
+			self._detectionRules.remove(rule)
+			self._compileDetectionRules()
+			return False
+		return True
+
+	def removeDetectionRules(self, profileName: str, includeBuiltin: bool = True) -> None:
+		"""
+		Remove the detection rules that select *profileName*.
+
+		Args:
+			profileName: Profile whose rules to remove
+			includeBuiltin: Also remove the built-in title rules
+		"""
+		self._detectionRules = [
+			rule for rule in self._detectionRules
+			if rule[2] != profileName or (rule[5] and not includeBuiltin)
+		]
+		self._compileDetectionRules()
+
+	def _compileDetectionRules(self) -> None:
+		"""
+		Compile title rules into one regex with a named group per rule.
+
+		Each rule is a lookahead alternative in priority order, so the first
+		alternative that matches anywhere in the title wins regardless of
+		where in the title the other rules would match.
+		"""
+		self._appRules = {}
+		self._titleGroups = {}
+		alternatives = []
+		for priority, sequence, name, app, title, _builtin in sorted(self._detectionRules, key=lambda r: (-r[0], r[1])):
+			if app:
+				self._appRules.setdefault(app, name)
+			if title:
+				group = f"r{sequence}"
+				self._titleGroups[group] = name
+				alternatives.append(f"(?=.*?(?P<{group}>{title}))")
+		self._titleMatcher = re.compile("|".join(alternatives), re.IGNORECASE | re.DOTALL) if alternatives else None
+		self._detectionCache.clear()
+
+	def _matchApplication(self, appName: str, title: str) -> str:
+		"""
+		Run the detection rules for an app name and title.
+
+		Args:
+			appName: Lowercased app name
+			title: Window title
+
+		Returns:
+			str: Profile name or 'default'
+		"""
+		# A profile named after the app itself wins over every rule
+		if self.hasProfile(appName):
+			return appName
+		if appName in self._appRules:
+			return self._appRules[appName]
+		if self._titleMatcher is not None and title:
+			match = self._titleMatcher.match(title)
+			if match:
+				for group, value in match.groupdict().items():
+					if value is not None:
+						return self._titleGroups[group]
+		return 'default'
+
 	def detectApplication(self, focusObject: Any) -> str:
 		"""
 		Detect the current terminal application.
 
+		Results are memoized per (appName, title), so refocusing the same
+		window does not run the matchers again.
+
 		Args:
 			focusObject: NVDA focus object
 
@@ -1797,72 +3267,90 @@ class ProfileManager:
 			str: Application name or 'default'
 		"""
 		try:
-			# Try to get app name from app module
-			if hasattr(focusObject, 'appModule') and hasattr(focusObject.appModule, 'appName'):
-				appName = focusObject.appModule.appName.lower()
-
-				# Check if we have a profile for this app
-				if appName in self.profiles:
-					return appName
-
-			# Try to detect from window title
-			if hasattr(focusObject, 'name'):
-				title = focusObject.name.lower()
-
-				# Check for common patterns
-				# Note: more specific matches (lazygit) must come before
-				# less specific ones (git) to avoid false positives.
-				if 'vim' in title or 'nvim' in title:
-					return 'vim'
-				elif 'tmux' in title:
-					return 'tmux'
-				elif 'btop' in title or 'btm' in title:
-					return 'btop'
-				elif 'htop' in title:
-					return 'htop'
-				elif 'less' in title or 'more' in title:
-					return 'less'
-				elif 'lazygit' in title:
-					return 'lazygit'
-				elif 'git' in title:
-					return 'git'
-				elif 'nano' in title:
-					return 'nano'
-				elif 'irssi' in title:
-					return 'irssi'
-				# TUI applications (detected by window title)
-				elif 'claude' in title:
-					return 'claude'
-				elif 'yazi' in title:
-					return 'yazi'
-				elif 'k9s' in title:
-					return 'k9s'
+			appName = focusObject.appModule.appName
+			appName = appName.lower() if isinstance(appName, str) else ""
+		except AttributeError:
+			appName = ""
+		try:
+			title = focusObject.name
+			title = title if isinstance(title, str) else ""
+		except AttributeError:
+			title = ""
+
+		key = (appName, title)
+		cache = self._detectionCache
+		detected = cache.get(key)
+		if detected is not None:
+			cache.move_to_end(key)
+			return detected
 
+		try:
+			detected = self._matchApplication(appName, title)
 		except Exception:
-			pass
-
-		return 'default'
+			detected = 'default'
+		cache[key] = detected
+		if len(cache) > self.DETECTION_CACHE_SIZE:
+			cache.popitem(last=False)
+		return detected
 
 	def getProfile(self, appName: str) -> ApplicationProfile | None:
-		"""Get profile for specified application."""
+		"""
+		Get profile for specified application, loading it from the store on first use.
+
+		A stored profile whose file is missing or unreadable is dropped for
+		this session, with its detection rules; a built-in profile of the
+		same name stays available.
+		"""
+		if appName in self._pendingProfiles:
+			self._pendingProfiles.discard(appName)
+			profile = self._store.load(appName)
+			if profile is not None:
+				self.addProfile(profile, persist=False)
+			else:
+				self.removeDetectionRules(appName, includeBuiltin=False)
 		return self.profiles.get(appName)
 
+	def hasProfile(self, appName: str) -> bool:
+		"""Check whether a profile exists, without loading it."""
+		return appName in self.profiles or appName in self._pendingProfiles
+
+	def profileNames(self) -> list[str]:
+		"""Get the names of all loaded and stored profiles."""
+		return list(self.profiles) + sorted(self._pendingProfiles.difference(self.profiles))
+
 	def setActiveProfile(self, appName: str) -> None:
 		"""Set the currently active profile."""
-		self.activeProfile = self.profiles.get(appName)
+		self.activeProfile = self.getProfile(appName)
+
+	def addProfile(self, profile: ApplicationProfile, persist: bool = True) -> None:
+		"""
+		Add or update a profile, registering its detection rules.
 
-	def addProfile(self, profile: ApplicationProfile) -> None:
-		"""Add or update a profile."""
+		Args:
+			profile: Profile to add
+			persist: Whether to save the profile to the store, if there is one
+		"""
 		self.profiles[profile.appName] = profile
+		self._pendingProfiles.discard(profile.appName)
+		# Replace any rules from an earlier version of this profile
+		self._addProfileRules(profile.appName, profile.detectionRules)
+		if persist and self._store is not None:
+			self._store.save(profile)
+		SettingsResolver.invalidate()
 
 	def removeProfile(self, appName: str) -> None:
-		"""Remove a profile."""
-		if appName in self.profiles and appName not in _BUILTIN_PROFILE_NAMES:
-			del self.profiles[appName]
+		"""Remove a profile, its detection rules and its stored file."""
+		if self.hasProfile(appName) and appName not in _BUILTIN_PROFILE_NAMES:
+			self.profiles.pop(appName, None)
+			self._pendingProfiles.discard(appName)
+			self.removeDetectionRules(appName)
+			if self._store is not None:
+				self._store.delete(appName)
+			SettingsResolver.invalidate()
 
 	def exportProfile(self, appName: str) -> dict[str, Any] | None:
 		"""Export profile to dictionary."""
-		profile = self.profiles.get(appName)
+		profile = self.getProfile(appName)
 		if profile:
 			return profile.toDict()
 		return None
@@ -2059,6 +3547,7 @@ class ConfigManager:
 				return False
 
 			config.conf["terminalAccess"][key] = validated_value
+			SettingsResolver.invalidate()
 			return True
 		except Exception as e:
 			import logHandler
@@ -2089,6 +3578,8 @@ class ConfigManager:
 		# String validations
 		elif key == "repeatedSymbolsValues":
 			return _validateString(value, MAX_REPEATED_SYMBOLS_LENGTH, "-_=!", key)
+		elif key == "wordCharacters":
+			return _validateString(value, MAX_WORD_CHARACTERS_LENGTH, DEFAULT_WORD_CHARACTERS, key)
 
 		# Boolean values - no validation needed
 		elif key in ["cursorTracking", "keyEcho", "linePause", "repeatedSymbols",
@@ -2118,6 +3609,7 @@ class ConfigManager:
 
 		# Validate string settings
 		self.set("repeatedSymbolsValues", self.get("repeatedSymbolsValues", "-_=!"))
+		self.set("wordCharacters", self.get("wordCharacters", DEFAULT_WORD_CHARACTERS))
 
 	def reset_to_defaults(self) -> None:
 		"""Reset all configuration values to their defaults."""
@@ -2128,6 +3620,7 @@ class ConfigManager:
 		config.conf["terminalAccess"]["punctuationLevel"] = PUNCT_MOST
 		config.conf["terminalAccess"]["repeatedSymbols"] = False
 		config.conf["terminalAccess"]["repeatedSymbolsValues"] = "-_=!"
+		config.conf["terminalAccess"]["wordCharacters"] = DEFAULT_WORD_CHARACTERS
 		config.conf["terminalAccess"]["cursorDelay"] = 20
 		config.conf["terminalAccess"]["quietMode"] = False
 		config.conf["terminalAccess"]["verboseMode"] = False
@@ -2141,6 +3634,134 @@ class ConfigManager:
 		config.conf["terminalAccess"]["newOutputCoalesceMs"] = 200
 		config.conf["terminalAccess"]["newOutputMaxLines"] = 20
 		config.conf["terminalAccess"]["stripAnsiInOutput"] = True
+		SettingsResolver.invalidate()
+
+
+class EffectiveSettings:
+	"""
+	Immutable, flat view of the Terminal Access settings in effect.
+
+	Built by SettingsResolver from the global configuration with the active
+	profile's non-None overrides applied, so hot paths read plain attributes
+	instead of several config lookups per keystroke.  The punctuation set for
+	the resolved level is precomputed (None means all punctuation).
+	"""
+
+	# Resolved settings and the confspec defaults used when a key is missing
+	DEFAULTS = {
+		"cursorTracking": True,
+		"cursorTrackingMode": CT_STANDARD,
+		"keyEcho": True,
+		"linePause": True,
+		"punctuationLevel": PUNCT_MOST,
+		"repeatedSymbols": False,
+		"repeatedSymbolsValues": "-_=!",
+		"cursorDelay": 20,
+		"quietMode": False,
+		"verboseMode": False,
+		"indentationOnLineRead": False,
+		"wordCharacters": DEFAULT_WORD_CHARACTERS,
+		"announceNewOutput": False,
+		"stripAnsiInOutput": True,
+	}
+	KEYS = tuple(DEFAULTS)
+
+	# Profile attributes that override the global setting of the same name
+	PROFILE_OVERRIDES = (
+		"punctuationLevel", "cursorTrackingMode", "keyEcho", "linePause",
+		"repeatedSymbols", "repeatedSymbolsValues", "cursorDelay", "quietMode",
+		"indentationOnLineRead",
+	)
+
+	__slots__ = KEYS + ("punctuationSet",)
+
+	def __init__(self, values: dict[str, Any]) -> None:
+		"""
+		Initialize from resolved values.
+
+		Args:
+			values: Mapping with an entry for every name in KEYS
+		"""
+		for key in self.KEYS:
+			object.__setattr__(self, key, values[key])
+		object.__setattr__(self, "punctuationSet", PUNCTUATION_SETS.get(values["punctuationLevel"], set()))
+
+	def __setattr__(self, name, value):
+		raise AttributeError("EffectiveSettings is immutable")
+
+	def get(self, key: str, default: Any = None) -> Any:
+		"""Get a setting by name, like a config section."""
+		return getattr(self, key, default) if key in self.KEYS else default
+
+	def __getitem__(self, key: str) -> Any:
+		if key not in self.KEYS:
+			raise KeyError(key)
+		return getattr(self, key)
+
+
+class SettingsResolver:
+	"""
+	Resolves and caches EffectiveSettings per profile.
+
+	The merged settings object is rebuilt only when a different profile is
+	passed in or after invalidate() signals a configuration change (settings
+	panel, toggle scripts, ConfigManager.set, profile edits, NVDA config
+	profile switches).  Otherwise resolve() is two identity comparisons.
+
+	Example usage:
+		>>> resolver = SettingsResolver()
+		>>> settings = resolver.resolve(vim_profile)
+		>>> settings.punctuationLevel  # vim override, not the global value
+	"""
+
+	# Bumped on every signalled configuration change; shared by all resolvers
+	_revision = 0
+
+	def __init__(self) -> None:
+		"""Initialize an empty resolver."""
+		self._settings: EffectiveSettings | None = None
+		self._profile = None
+		self._built_revision = -1
+
+	@classmethod
+	def invalidate(cls, *args, **kwargs) -> None:
+		"""Signal that configuration changed; accepts and ignores extension point arguments."""
+		cls._revision += 1
+
+	def resolve(self, profile: ApplicationProfile | None = None) -> EffectiveSettings:
+		"""
+		Get the settings in effect for *profile*.
+
+		Args:
+			profile: Active application profile, or None for global settings
+
+		Returns:
+			EffectiveSettings: Cached unless the profile or configuration changed
+		"""
+		settings = self._settings
+		if settings is not None and self._profile is profile and self._built_revision == SettingsResolver._revision:
+			return settings
+		self._built_revision = SettingsResolver._revision
+		self._profile = profile
+		self._settings = settings = EffectiveSettings(self._merge(profile))
+		return settings
+
+	@staticmethod
+	def _merge(profile: ApplicationProfile | None) -> dict[str, Any]:
+		"""Merge the profile's overrides over the global configuration."""
+		conf = config.conf["terminalAccess"]
+		values = {}
+		for key in EffectiveSettings.KEYS:
+			try:
+				values[key] = conf[key]
+			except KeyError:
+				values[key] = EffectiveSettings.DEFAULTS[key]
+		if profile is not None:
+			for key in EffectiveSettings.PROFILE_OVERRIDES:
+				override = getattr(profile, key, None)
+				if override is not None:
+					values[key] = override
+		return values
 
 
 class WindowManager:
@@ -2320,62 +3941,286 @@ class WindowManager:
 		self._start_set = False
 
 
-class PositionCalculator:
+class LineReadAheadCache:
 	"""
-	Centralized position calculation for terminal coordinates.
+	Texts of the rows around the review cursor, read in one range fetch.
 
-	Handles calculation of (row, col) coordinates from TextInfo objects,
-	with performance optimization through caching and incremental tracking.
+	Line navigation reads neighbouring rows from this window instead of
+	expanding a TextInfo for every keypress.  A fill reads RADIUS rows on
+	each side of a row with a single TextInfo range.  The window is used
+	until a row outside it is requested, until the content generation
+	shows a change at or above its last row, or for at most
+	CACHE_TIMEOUT_S, since full-screen programs redraw without caret events.
 
 	Example usage:
-		>>> calc = PositionCalculator()
-		>>>
-		>>> # Calculate position from TextInfo
-		>>> row, col = calc.calculate(textInfo, terminal)
-		>>> print(f"Position: row {row}, col {col}")
-		>>>
-		>>> # Position is automatically cached for fast repeat access
-		>>> row2, col2 = calc.calculate(textInfo, terminal)  # Returns cached
-		>>>
-		>>> # Clear cache when terminal content changes
-		>>> calc.clear_cache()
-
-	Performance:
-		- First calculation: O(n) where n = row number
-		- Cached calculation: O(1)
-		- Incremental calculation: O(k) where k = distance moved
-
-	Thread Safety:
-		All operations are thread-safe through PositionCache locking.
-
-	Caching Strategy:
-		- Cache entries expire after 1000ms
-		- Maximum 100 cached positions
-		- Automatic invalidation on content changes
+		>>> cache = LineReadAheadCache(generation)
+		>>> text = cache.get(row)
+		>>> if text is None:
+		>>>     cache.fill(reviewInfo, row)
+		>>>     text = cache.get(row)
 	"""
 
-	def __init__(self) -> None:
-		"""Initialize the position calculator with empty cache."""
-		self._cache = PositionCache()
-		self._last_known_position: tuple[Any, int, int] | None = None
+	RADIUS = 20
+	CACHE_TIMEOUT_S: float = 1.0
 
-	def calculate(self, textInfo: Any, terminal: Any) -> tuple[int, int]:
+	def __init__(self, generation: ContentGeneration | None = None) -> None:
 		"""
-		Calculate row and column coordinates from TextInfo.
+		Initialize an empty cache.
 
-		Uses multi-tiered approach:
-		1. Check position cache (1000ms timeout)
-		2. Try incremental tracking from last position
-		3. Fall back to full calculation from buffer start
+		Args:
+			generation: Optional content generation authority; without one
+				a filled window stays valid until refilled
+		"""
+		self._generation = generation
+		self._firstRow = 0
+		self._lines: list[str] = []
+		self._filledAt = -1
+		self._filledTime = 0.0
+		self._atTop = False
+		self._atBottom = False
+
+	def get(self, row: int) -> str | None:
+		"""
+		Get the text of a row from the window.
 
 		Args:
-			textInfo: TextInfo object to calculate position for
-			terminal: Terminal object for context
+			row: Row number (1-based)
 
 		Returns:
-			Tuple of (row, col) as 1-based integers, or (0, 0) on error
+			str | None: Row text without line ending, or None if not cached or stale
 		"""
-		if not terminal:
+		index = row - self._firstRow
+		if not 0 <= index < len(self._lines):
+			return None
+		lastRow = self._firstRow + len(self._lines) - 1
+		if (
+			time.time() - self._filledTime >= self.CACHE_TIMEOUT_S
+			or (self._generation is not None and not self._generation.is_row_current(lastRow - 1, self._filledAt))
+		):
+			self._lines = []
+			return None
+		return self._lines[index]
+
+	def isBeyondBuffer(self, row: int) -> bool:
+		"""
+		Check whether a row lies past a buffer edge the window reaches.
+
+		Args:
+			row: Row number (1-based)
+
+		Returns:
+			bool: True if the row does not exist, so refilling cannot help
+		"""
+		if not self._lines:
+			return False
+		if row < self._firstRow:
+			return self._atTop
+		return row >= self._firstRow + len(self._lines) and self._atBottom
+
+	def fill(self, info: Any, row: int) -> None:
+		"""
+		Read the rows around a position.
+
+		Args:
+			info: TextInfo anywhere on the row
+			row: Row number of info (1-based)
+		"""
+		start = info.copy()
+		start.expand(textInfos.UNIT_LINE)
+		start.collapse()
+		end = start.copy()
+		above = abs(start.move(textInfos.UNIT_LINE, -self.RADIUS) or 0)
+		below = end.move(textInfos.UNIT_LINE, self.RADIUS + 1) or 0
+		if below < self.RADIUS + 1:
+			# The buffer ends inside the window: include the last line
+			end.expand(textInfos.UNIT_LINE)
+			end.collapse(end=True)
+		start.setEndPoint(end, "endToEnd")
+		filledAt = self._generation.value if self._generation is not None else 0
+		lines = start.text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+		if len(lines) > 1 and lines[-1] == '':
+			lines.pop()
+		self._lines = lines
+		self._firstRow = row - above
+		self._filledAt = filledAt
+		self._filledTime = time.time()
+		self._atTop = above < self.RADIUS
+		self._atBottom = below < self.RADIUS + 1
+
+	def clear(self) -> None:
+		"""Drop the cached window."""
+		self._lines = []
+
+
+class WordSegmenter:
+	"""
+	Terminal-aware word boundaries for lines of terminal text.
+
+	A word is a run of letters, digits and the configured word characters,
+	so paths (``/usr/local/bin``), URLs and options (``--no-cache-dir``)
+	are single words.  Any other run of punctuation (``&&``, ``|``, ``(``)
+	is a word of its own, and whitespace separates words.
+
+	Boundaries are computed once per line with one regular expression scan
+	and cached by line text, so moving through a line again costs a hash
+	lookup and a bisect.  Changing the word characters clears the cache.
+
+	Example usage:
+		>>> segmenter = WordSegmenter()
+		>>> starts, ends = segmenter.segment("pip install --no-cache-dir x")
+		>>> starts
+		(0, 4, 12, 27)
+	"""
+
+	CACHE_SIZE = 256
+
+	def __init__(self, wordCharacters: str = DEFAULT_WORD_CHARACTERS) -> None:
+		"""
+		Initialize the segmenter.
+
+		Args:
+			wordCharacters: Characters that join letters and digits into one word
+		"""
+		self._cache: collections.OrderedDict[str, tuple[tuple[int, ...], tuple[int, ...]]] = (
+			collections.OrderedDict()
+		)
+		self._wordCharacters = None
+		self.setWordCharacters(wordCharacters)
+
+	def setWordCharacters(self, wordCharacters: str) -> None:
+		"""
+		Set the characters that belong to words, clearing the cache if they change.
+
+		Args:
+			wordCharacters: Characters that join letters and digits into one word
+		"""
+		if wordCharacters == self._wordCharacters:
+			return
+		self._wordCharacters = wordCharacters
+		charClass = r'\w' + ''.join(re.escape(char) for char in wordCharacters)
+		self._wordRe = re.compile(rf'[{charClass}]+|[^\s{charClass}]+')
+		self._cache.clear()
+
+	def segment(self, line: str) -> tuple[tuple[int, ...], tuple[int, ...]]:
+		"""
+		Get the word boundaries of a line.
+
+		Args:
+			line: Line text
+
+		Returns:
+			(starts, ends): String indices where each word starts and ends (exclusive)
+		"""
+		cache = self._cache
+		spans = cache.get(line)
+		if spans is not None:
+			cache.move_to_end(line)
+			return spans
+		bounds = [match.span() for match in self._wordRe.finditer(line)]
+		spans = cache[line] = (
+			tuple(start for start, _end in bounds),
+			tuple(end for _start, end in bounds),
+		)
+		if len(cache) > self.CACHE_SIZE:
+			cache.popitem(last=False)
+		return spans
+
+	def wordIndex(self, line: str, index: int) -> tuple[int, bool]:
+		"""
+		Find the word at or before a character.
+
+		Args:
+			line: Line text
+			index: Character index in the line
+
+		Returns:
+			(word, inside): Index of the last word starting at or before the
+				character (-1 if none), and whether the character is inside it
+		"""
+		starts, ends = self.segment(line)
+		word = bisect.bisect_right(starts, index) - 1
+		return word, word >= 0 and index < ends[word]
+
+	def wordAt(self, line: str, index: int) -> str:
+		"""
+		Get the word containing a character.
+
+		Args:
+			line: Line text
+			index: Character index in the line
+
+		Returns:
+			str: The word, or '' if the index is on whitespace or past the end
+		"""
+		starts, ends = self.segment(line)
+		word, inside = self.wordIndex(line, index)
+		return line[starts[word]:ends[word]] if inside else ""
+
+
+class PositionCalculator:
+	"""
+	Centralized position calculation for terminal coordinates.
+
+	Handles calculation of (row, col) coordinates from TextInfo objects,
+	with performance optimization through caching and incremental tracking.
+
+	Example usage:
+		>>> calc = PositionCalculator()
+		>>>
+		>>> # Calculate position from TextInfo
+		>>> row, col = calc.calculate(textInfo, terminal)
+		>>> print(f"Position: row {row}, col {col}")
+		>>>
+		>>> # Position is automatically cached for fast repeat access
+		>>> row2, col2 = calc.calculate(textInfo, terminal)  # Returns cached
+		>>>
+		>>> # Clear cache when terminal content changes
+		>>> calc.clear_cache()
+
+	Performance:
+		- First calculation: O(n) where n = row number
+		- Cached calculation: O(1)
+		- Incremental calculation: O(k) where k = distance moved
+
+	Thread Safety:
+		All operations are thread-safe through PositionCache locking.
+
+	Caching Strategy:
+		- Cache entries expire after 1000ms, or with a ContentGeneration,
+		  when content at or above their row changes
+		- Maximum 100 cached positions
+		- Automatic invalidation on content changes
+	"""
+
+	def __init__(self, generation: ContentGeneration | None = None) -> None:
+		"""
+		Initialize the position calculator with empty cache.
+
+		Args:
+			generation: Optional content generation authority for invalidation
+		"""
+		self._cache = PositionCache(generation)
+		self._generation = generation
+		self._last_known_position: tuple[Any, int, int] | None = None
+		self._last_known_generation = 0
+
+	def calculate(self, textInfo: Any, terminal: Any) -> tuple[int, int]:
+		"""
+		Calculate row and column coordinates from TextInfo.
+
+		Uses multi-tiered approach:
+		1. Check position cache (1000ms timeout)
+		2. Try incremental tracking from last position
+		3. Fall back to full calculation from buffer start
+
+		Args:
+			textInfo: TextInfo object to calculate position for
+			terminal: Terminal object for context
+
+		Returns:
+			Tuple of (row, col) as 1-based integers, or (0, 0) on error
+		"""
+		if not terminal:
 			return (0, 0)
 
 		try:
@@ -2386,6 +4231,15 @@ class PositionCalculator:
 			if cached is not None:
 				return cached
 
+			# Incremental tracking is only valid while the rows up to the
+			# last known position are unchanged
+			if (
+				self._last_known_position is not None
+				and self._generation is not None
+				and not self._generation.is_row_current(self._last_known_position[1] - 1, self._last_known_generation)
+			):
+				self._last_known_position = None
+
 			# Try incremental tracking
 			if self._last_known_position is not None:
 				result = self._try_incremental_calculation(
@@ -2435,7 +4289,7 @@ class PositionCalculator:
 					row, col = result
 					# Cache and store
 					self._cache.set(bookmark, row, col)
-					self._last_known_position = (bookmark, row, col)
+					self._remember_position(bookmark, row, col)
 					return (row, col)
 
 		except Exception:
@@ -2559,10 +4413,16 @@ class PositionCalculator:
 
 		# Cache and store
 		self._cache.set(bookmark, row, col)
-		self._last_known_position = (bookmark, row, col)
+		self._remember_position(bookmark, row, col)
 
 		return (row, col)
 
+	def _remember_position(self, bookmark: Any, row: int, col: int) -> None:
+		"""Store the starting point for incremental calculation."""
+		self._last_known_position = (bookmark, row, col)
+		if self._generation is not None:
+			self._last_known_generation = self._generation.value
+
 	def clear_cache(self) -> None:
 		"""Clear all cached positions."""
 		self._cache.clear()
@@ -2814,6 +4674,8 @@ class NewOutputAnnouncer:
 		# on every content update.  The running timer checks the deadline when
 		# it fires and reschedules itself if the deadline was pushed forward.
 		self._coalesce_deadline: float = 0.0
+		# Content generation authority, advanced by polled snapshots
+		self.generation: ContentGeneration | None = None
 
 	def feed(self, text: str) -> None:
 		"""
@@ -2998,8 +4860,10 @@ class NewOutputAnnouncer:
 				# Get terminal content and feed to announcer
 				if self._terminal_obj is not None:
 					try:
-						info = self._terminal_obj.makeTextInfo(textInfos.POSITION_ALL)
-						self.feed(info.text)
+						text = self._terminal_obj.makeTextInfo(textInfos.POSITION_ALL).text
+						if self.generation is not None:
+							self.generation.observe(text)
+						self.feed(text)
 					except Exception:
 						# Terminal object may be invalid, ignore
 						pass
@@ -3039,16 +4903,19 @@ class WindowMonitor:
 		>>> monitor.stop_monitoring()
 	"""
 
-	def __init__(self, terminal_obj, position_calculator):
+	def __init__(self, terminal_obj, position_calculator, generation: ContentGeneration | None = None):
 		"""
 		Initialize the WindowMonitor.
 
 		Args:
 			terminal_obj: Terminal TextInfo object for content extraction
 			position_calculator: PositionCalculator instance for coordinate mapping
+			generation: Optional content generation authority; windows whose
+				rows are unchanged since their last check are not re-extracted
 		"""
 		self._terminal = terminal_obj
 		self._position_calculator = position_calculator
+		self._generation = generation
 		self._monitors = []  # List of monitor configurations
 		self._last_content = {}  # window_name -> content mapping
 		self._last_announcement = {}  # window_name -> timestamp of last announcement
@@ -3056,6 +4923,7 @@ class WindowMonitor:
 		self._monitoring_active = False
 		self._lock = threading.Lock()
 		self._min_announcement_interval = 2000  # Minimum 2 seconds between announcements (rate limiting)
+		self._grid: ScreenGrid | None = None  # Grid of the last extracted snapshot
 
 	def add_monitor(self, name: str, window_bounds: tuple, interval_ms: int = 500, mode: str = 'changes'):
 		"""
@@ -3088,6 +4956,7 @@ class WindowMonitor:
 				'last_check': 0,
 				'enabled': True,
 				'differ': TextDiffer(),  # Per-monitor differ for change detection
+				'generation': -1,  # Content generation at the last extraction
 			}
 			self._monitors.append(monitor)
 			self._last_content[name] = None
@@ -3177,21 +5046,31 @@ class WindowMonitor:
 
 				current_time = time.time() * 1000  # Convert to milliseconds
 
-				# Check each monitor
-				for monitor in self._monitors:
-					if not monitor['enabled']:
-						continue
+				# Monitors whose polling interval has elapsed
+				due = [
+					monitor for monitor in self._monitors
+					if monitor['enabled'] and current_time - monitor['last_check'] >= monitor['interval']
+				]
+				# With a generation authority, read the buffer once per tick
+				all_text = self._snapshot_text() if due and self._generation is not None else None
 
-					# Check if it's time to poll this monitor
-					time_since_check = current_time - monitor['last_check']
-					if time_since_check >= monitor['interval']:
-						self._check_window(monitor, current_time)
-						monitor['last_check'] = current_time
+				for monitor in due:
+					self._check_window(monitor, current_time, all_text)
+					monitor['last_check'] = current_time
 
 			# Sleep briefly to avoid busy-waiting
 			time.sleep(0.1)
 
-	def _check_window(self, monitor: dict, current_time: float) -> None:
+	def _snapshot_text(self) -> str | None:
+		"""Read the buffer once and advance the content generation from it."""
+		try:
+			text = self._terminal.makeTextInfo(textInfos.POSITION_ALL).text
+		except Exception:
+			return None
+		self._generation.observe(text)
+		return text
+
+	def _check_window(self, monitor: dict, current_time: float, all_text: str | None = None) -> None:
 		"""
 		Check if window content changed using TextDiffer.
 
@@ -3202,10 +5081,17 @@ class WindowMonitor:
 		Args:
 			monitor: Monitor configuration dictionary
 			current_time: Current timestamp in milliseconds
+			all_text: Buffer snapshot shared by this polling tick, if any
 		"""
 		try:
+			if all_text is not None and self._generation is not None:
+				# Skip extraction when no row up to the window's bottom changed
+				if self._generation.is_row_current(monitor['bounds'][2] - 1, monitor.get('generation', -1)):
+					return
+				monitor['generation'] = self._generation.value
+
 			# Extract window content
-			content = self._extract_window_content(monitor['bounds'])
+			content = self._extract_window_content(monitor['bounds'], all_text)
 			name = monitor['name']
 
 			# Use per-monitor TextDiffer for change detection
@@ -3239,12 +5125,13 @@ class WindowMonitor:
 			# Silently ignore errors to avoid disrupting monitoring
 			pass
 
-	def _extract_window_content(self, bounds: tuple) -> str:
+	def _extract_window_content(self, bounds: tuple, all_text: str | None = None) -> str:
 		"""
 		Extract text content from window bounds.
 
 		Args:
 			bounds: Tuple of (top, left, bottom, right) coordinates
+			all_text: Buffer text already read; fetched if None
 
 		Returns:
 			str: Window content as text
@@ -3256,21 +5143,14 @@ class WindowMonitor:
 		lines = []
 
 		try:
-			# Get terminal dimensions
-			info = self._terminal.makeTextInfo(textInfos.POSITION_ALL)
-			all_text = info.text
-
-			# Split into lines
-			all_lines = all_text.split('\n')
+			if all_text is None:
+				all_text = self._terminal.makeTextInfo(textInfos.POSITION_ALL).text
 
-			# Extract lines within bounds (convert from 1-based to 0-based)
-			for row_idx in range(top - 1, min(bottom, len(all_lines))):
-				if row_idx < len(all_lines):
-					line = all_lines[row_idx]
-					# Extract columns within bounds (1-based to 0-based)
-					col_start = max(0, left - 1)
-					col_end = min(len(line), right)
-					lines.append(line[col_start:col_end])
+			# Monitors checked in the same tick share one grid
+			grid = self._grid
+			if grid is None or grid.text is not all_text:
+				grid = self._grid = ScreenGrid(all_text)
+			lines = grid.rect(top, left, bottom, right)
 
 			return '\n'.join(lines)
 
@@ -3325,6 +5205,26 @@ class WindowMonitor:
 			]
 
 
+class TabState:
+	"""
+	Per-tab state container held by TabManager.
+
+	Section 9: Tab Management Functionality (v1.0.39+)
+
+	Bookmarks are read and written in place.  Search results and command
+	history are parked here by their managers when focus leaves the tab
+	and restored when it returns, so switching back costs nothing.
+	"""
+
+	__slots__ = ('bookmarks', 'search', 'history')
+
+	def __init__(self):
+		"""Initialize an empty tab state."""
+		self.bookmarks: dict = {}  # name -> bookmark
+		self.search: dict | None = None  # parked OutputSearchManager state
+		self.history: dict | None = None  # parked CommandHistoryManager state
+
+
 class TabManager:
 	"""
 	Manage terminal tabs for quick navigation and state tracking.
@@ -3338,7 +5238,8 @@ class TabManager:
 	Features:
 	- Tab detection using window properties and content heuristics
 	- Tab navigation with keyboard shortcuts
-	- Per-tab state isolation for bookmarks, searches, and command history
+	- Per-tab state isolation for bookmarks, searches, and command history,
+	  held in a bounded LRU of TabState containers
 	- Tab listing and enumeration
 	- Support for multiple terminal applications
 
@@ -3349,6 +5250,10 @@ class TabManager:
 		>>> manager.switch_to_tab(1)
 	"""
 
+	# Maximum number of tabs whose state is retained; least recently
+	# used tabs are evicted beyond this
+	MAX_TABS: int = 32
+
 	def __init__(self, terminal_obj):
 		"""
 		Initialize the TabManager.
@@ -3358,15 +5263,46 @@ class TabManager:
 		"""
 		self._terminal = terminal_obj
 		self._tabs = {}  # tab_id -> tab_info mapping
+		# tab_id -> TabState, least recently used first
+		self._states: collections.OrderedDict[str, TabState] = collections.OrderedDict()
+		# (window handle, UIA runtime id) -> tab_id
+		self._identity_cache: dict[tuple, str] = {}
 		self._current_tab_id = None
 		self._last_window_title = None
 		self._update_current_tab()
 
+	@staticmethod
+	def _identity_key(terminal_obj) -> tuple | None:
+		"""
+		Get the stable identity of a terminal control.
+
+		Args:
+			terminal_obj: Terminal TextInfo object
+
+		Returns:
+			tuple: (window handle, UIA runtime id), or None when the object
+			has no UIA runtime id
+		"""
+		try:
+			runtime_id = terminal_obj.UIAElement.GetRuntimeId()
+			if runtime_id is None:
+				return None
+			if isinstance(runtime_id, list):
+				runtime_id = tuple(runtime_id)
+			key = (getattr(terminal_obj, 'windowHandle', None), runtime_id)
+			hash(key)
+			return key
+		except Exception:
+			return None
+
 	def _generate_tab_id(self, terminal_obj) -> str:
 		"""
 		Generate a unique tab identifier based on terminal properties.
 
-		Uses window handle, title, and content hash to create a unique ID.
+		UIA terminals are identified by window handle and runtime id; the
+		id is cached on that key, so a focus change between known tabs is a
+		dictionary lookup.  Other terminals fall back to hashing the window
+		handle, title and object ID.
 
 		Args:
 			terminal_obj: Terminal TextInfo object
@@ -3374,6 +5310,13 @@ class TabManager:
 		Returns:
 			str: Unique tab identifier
 		"""
+		key = self._identity_key(terminal_obj)
+		if key is not None:
+			tab_id = self._identity_cache.get(key)
+			if tab_id is None:
+				tab_id = self._identity_cache[key] = f"{hash(key) & 0xFFFFFFFFFFFF:012x}"
+			return tab_id
+
 		try:
 			# Try to get window properties
 			components = []
@@ -3396,12 +5339,8 @@ class TabManager:
 				except Exception:
 					pass
 
-			# Create hash from components
-			import hashlib
-			tab_str = "|".join(components)
-			tab_hash = hashlib.md5(tab_str.encode()).hexdigest()[:12]
-
-			return tab_hash
+			# Non-cryptographic hash; ids only live for this NVDA session
+			return f"{hash('|'.join(components)) & 0xFFFFFFFFFFFF:012x}"
 
 		except Exception:
 			# Fallback to simple counter-based ID
@@ -3412,7 +5351,8 @@ class TabManager:
 		try:
 			tab_id = self._generate_tab_id(self._terminal)
 
-			# Register tab if it's new
+			# Register tab if it's new; known tabs keep their cached title
+			# until a name change is reported
 			if tab_id not in self._tabs:
 				self._tabs[tab_id] = {
 					'id': tab_id,
@@ -3422,9 +5362,10 @@ class TabManager:
 				}
 
 			self._current_tab_id = tab_id
+			self.get_tab_state(tab_id)
 
 			# Update title cache
-			self._last_window_title = self._get_tab_title()
+			self._last_window_title = self._tabs[tab_id]['title']
 
 		except Exception:
 			pass
@@ -3454,6 +5395,41 @@ class TabManager:
 		"""
 		return self._current_tab_id
 
+	def get_tab_state(self, tab_id: str | None = None, create: bool = True) -> TabState | None:
+		"""
+		Get a tab's state container, marking it most recently used.
+
+		Creating a container may evict the least recently used tab,
+		together with its tab info, once MAX_TABS is exceeded.
+
+		Args:
+			tab_id: Tab identifier (default: current tab)
+			create: Create the container if the tab has none
+
+		Returns:
+			TabState, or None if there is no such tab
+		"""
+		tab_id = tab_id or self._current_tab_id
+		if tab_id is None:
+			return None
+		state = self._states.get(tab_id)
+		if state is not None:
+			self._states.move_to_end(tab_id)
+			return state
+		if not create:
+			return None
+		state = self._states[tab_id] = TabState()
+		while len(self._states) > self.MAX_TABS:
+			evicted, _ = self._states.popitem(last=False)
+			self._forget_tab(evicted)
+		return state
+
+	def _forget_tab(self, tab_id: str) -> None:
+		"""Drop a tab's info and cached identity."""
+		self._tabs.pop(tab_id, None)
+		for key in [key for key, value in self._identity_cache.items() if value == tab_id]:
+			del self._identity_cache[key]
+
 	def list_tabs(self) -> list:
 		"""
 		Get list of all known tabs.
@@ -3489,6 +5465,29 @@ class TabManager:
 		# Return True if tab changed
 		return self._current_tab_id != old_tab_id
 
+	def on_name_change(self, terminal_obj) -> bool:
+		"""
+		Re-validate the current tab after a name-change event.
+
+		The cached title is refreshed.  Tabs identified by title rather
+		than UIA runtime id are re-identified, since their id depends on it.
+
+		Args:
+			terminal_obj: Terminal object whose name changed
+
+		Returns:
+			bool: True if the current tab changed
+		"""
+		if terminal_obj is not self._terminal:
+			return False
+		if self._identity_key(terminal_obj) is None:
+			return self.update_terminal(terminal_obj)
+		title = self._get_tab_title()
+		self._last_window_title = title
+		if self._current_tab_id in self._tabs:
+			self._tabs[self._current_tab_id]['title'] = title
+		return False
+
 	def has_tab_changed(self) -> bool:
 		"""
 		Check if the tab has changed since last check.
@@ -3516,17 +5515,87 @@ class TabManager:
 		Returns:
 			bool: True if tab was removed
 		"""
+		self._states.pop(tab_id, None)
 		if tab_id in self._tabs:
-			del self._tabs[tab_id]
+			self._forget_tab(tab_id)
 			return True
 		return False
 
 	def clear_all_tabs(self):
 		"""Clear all tab information."""
 		self._tabs.clear()
+		self._states.clear()
+		self._identity_cache.clear()
 		self._current_tab_id = None
 
 
+class BookmarkAnchor:
+	"""
+	Content anchor for one bookmark.
+
+	Section 8.3: Bookmark/Marker Functionality (v1.0.54+)
+
+	The raw TextInfo bookmark is kept only as a hint.  The bookmarked row is
+	identified by a hash of its line and the lines just above it, which stays
+	valid while output scrolls the row upward or appends below it.
+	"""
+
+	__slots__ = ('hint', 'row', 'column', 'context_hash')
+
+	# Lines ending at the bookmarked row that make up its content hash
+	CONTEXT_LINES: int = 3
+
+	def __init__(self, hint, row: int = 0, column: int = 0, context_hash: int | None = None):
+		"""
+		Initialize the anchor.
+
+		Args:
+			hint: Raw TextInfo bookmark at the time the bookmark was set
+			row: 0-based row the bookmark was last found at
+			column: Character offset within the row
+			context_hash: Content hash of the row, or None if unknown
+		"""
+		self.hint = hint
+		self.row = row
+		self.column = column
+		self.context_hash = context_hash
+
+	@classmethod
+	def context_hash_at(cls, lines: list[str], row: int) -> int:
+		"""
+		Hash *row* together with the lines just above it.
+
+		Args:
+			lines: Buffer lines
+			row: Row the context ends at
+
+		Returns:
+			Content hash
+		"""
+		return _context_hash(lines, row, cls.CONTEXT_LINES)
+
+	def find_row(self, lines: list[str]) -> int:
+		"""
+		Search outward from the last known row for the anchored content.
+
+		Rows above are tried before rows below at each distance, since
+		scrolling moves content upward.
+
+		Args:
+			lines: Current buffer lines
+
+		Returns:
+			Matching row, or -1 if the content is gone
+		"""
+		count = len(lines)
+		start = min(self.row, count - 1)
+		for distance in range(max(start + 1, count - start)):
+			for row in (start - distance, start + distance):
+				if 0 <= row < count and self.context_hash_at(lines, row) == self.context_hash:
+					return row
+		return -1
+
+
 class BookmarkManager:
 	"""
 	Manage bookmarks/markers in terminal output for quick navigation.
@@ -3546,6 +5615,7 @@ class BookmarkManager:
 	- List all bookmarks
 	- Remove bookmarks
 	- Persistent across terminal sessions (position-relative)
+	- Content-anchored: relocated after scrolling or new output
 
 	Example usage:
 		>>> manager = BookmarkManager(terminal_obj)
@@ -3567,7 +5637,6 @@ class BookmarkManager:
 		self._terminal = terminal_obj
 		self._tab_manager = tab_manager
 		self._bookmarks = {}  # name -> bookmark mapping (legacy single-tab mode)
-		self._tab_bookmarks = {}  # tab_id -> {name -> bookmark} mapping (multi-tab mode)
 		self._max_bookmarks = 50  # Maximum number of bookmarks per tab
 
 	def _get_current_tab_id(self) -> str:
@@ -3580,10 +5649,8 @@ class BookmarkManager:
 		"""Get the appropriate bookmark dictionary for the current context."""
 		tab_id = self._get_current_tab_id()
 		if tab_id:
-			# Multi-tab mode: use per-tab storage
-			if tab_id not in self._tab_bookmarks:
-				self._tab_bookmarks[tab_id] = {}
-			return self._tab_bookmarks[tab_id]
+			# Multi-tab mode: use the tab's state container
+			return self._tab_manager.get_tab_state(tab_id).bookmarks
 		else:
 			# Legacy mode: use shared storage
 			return self._bookmarks
@@ -3618,12 +5685,127 @@ class BookmarkManager:
 				return False
 
 			# Store bookmark
-			bookmarks[name] = pos.bookmark
+			bookmarks[name] = self._make_anchor(pos)
 			return True
 
 		except Exception:
 			return False
 
+	def _row_of(self, pos) -> tuple[int, int]:
+		"""
+		Find the row and column of a position.
+
+		Args:
+			pos: TextInfo position in the terminal
+
+		Returns:
+			tuple: (row, column), 0-based
+
+		Raises:
+			TypeError: If the terminal does not report text
+		"""
+		before = self._terminal.makeTextInfo(textInfos.POSITION_FIRST)
+		before.setEndPoint(pos, "endToStart")
+		prefix = before.text
+		if not isinstance(prefix, str):
+			raise TypeError("terminal text unavailable")
+		return prefix.count('\n'), len(prefix) - prefix.rfind('\n') - 1
+
+	def _get_lines(self) -> list[str]:
+		"""Get the current buffer lines."""
+		text = self._terminal.makeTextInfo(textInfos.POSITION_ALL).text
+		if not isinstance(text, str):
+			raise TypeError("terminal text unavailable")
+		return text.split('\n')
+
+	@staticmethod
+	def _context_lines_at(pos) -> list[str]:
+		"""
+		Read the row of a position and the rows just above it in one range read.
+
+		Args:
+			pos: TextInfo position in the terminal
+
+		Returns:
+			Up to BookmarkAnchor.CONTEXT_LINES lines, ending with the position's row
+
+		Raises:
+			TypeError: If the terminal does not report text
+		"""
+		context = pos.copy()
+		context.expand(textInfos.UNIT_LINE)
+		start = context.copy()
+		start.collapse()
+		start.move(textInfos.UNIT_LINE, 1 - BookmarkAnchor.CONTEXT_LINES)
+		context.setEndPoint(start, "startToStart")
+		text = context.text
+		if not isinstance(text, str):
+			raise TypeError("terminal text unavailable")
+		if text.endswith('\n'):
+			text = text[:-1]
+		return text.split('\n')
+
+	def _make_anchor(self, pos) -> BookmarkAnchor:
+		"""
+		Anchor a position by content, keeping its raw bookmark as a hint.
+
+		Args:
+			pos: Review position to bookmark
+
+		Returns:
+			BookmarkAnchor (hint only if the buffer text cannot be read)
+		"""
+		anchor = BookmarkAnchor(pos.bookmark)
+		try:
+			row, column = self._row_of(pos)
+			lines = self._context_lines_at(pos)
+			anchor.row = row
+			anchor.column = column
+			anchor.context_hash = BookmarkAnchor.context_hash_at(lines, len(lines) - 1)
+		except Exception:
+			pass
+		return anchor
+
+	def _resolve_anchor(self, anchor: BookmarkAnchor):
+		"""
+		Find the bookmarked position in the current buffer.
+
+		The hint is tried first and accepted if its row still holds the
+		anchored content, which reads only the few rows of the context.
+		Otherwise the buffer is fetched once and the content is searched
+		for outward from the last known row.
+
+		Args:
+			anchor: Bookmark anchor
+
+		Returns:
+			TextInfo at the bookmark, or None if its content is gone
+		"""
+		if anchor.context_hash is None:
+			return self._terminal.makeTextInfo(anchor.hint)
+
+		try:
+			pos = self._terminal.makeTextInfo(anchor.hint)
+			context = self._context_lines_at(pos)
+			if BookmarkAnchor.context_hash_at(context, len(context) - 1) == anchor.context_hash:
+				return pos
+		except Exception:
+			pass
+
+		row = anchor.find_row(self._get_lines())
+		if row < 0:
+			return None
+		pos = self._terminal.makeTextInfo(textInfos.POSITION_FIRST)
+		pos.move(textInfos.UNIT_LINE, row)
+		if anchor.column:
+			pos.move(textInfos.UNIT_CHARACTER, anchor.column)
+		anchor.row = row
+		try:
+			anchor.hint = pos.bookmark
+		except Exception:
+			pass
+		return pos
+
 	def jump_to_bookmark(self, name: str) -> bool:
 		"""
 		Jump to named bookmark.
@@ -3639,8 +5821,12 @@ class BookmarkManager:
 			return False
 
 		try:
-			# Restore position from bookmark
-			pos = self._terminal.makeTextInfo(bookmarks[name])
+			# Relocate the bookmarked content
+			pos = self._resolve_anchor(bookmarks[name])
+			if pos is None:
+				# The bookmarked lines are no longer in the buffer
+				self.remove_bookmark(name)
+				return False
 			if pos:
 				api.setReviewPosition(pos)
 				return True
@@ -3722,11 +5908,311 @@ class BookmarkManager:
 		self._tab_manager = tab_manager
 
 
-class OutputSearchManager:
+class IncrementalSearchSession:
 	"""
-	Search and filter terminal output with pattern matching.
+	Search-as-you-type state over a single buffer snapshot.
 
-	Section 8.2: Output Filtering and Search (v1.0.30+)
+	Section 8.2: Output Filtering and Search (v1.0.54+)
+
+	Each query that extends the previous one filters the previous candidate
+	line set instead of rescanning the buffer, so per-keystroke cost scales
+	with the number of lines still matching.  Every narrowing step is kept on
+	a stack; deleting characters pops back to the cached earlier set.
+
+	Example usage:
+		>>> session = IncrementalSearchSession(["make", "error: x", "ok"])
+		>>> session.update("e")
+		>>> session.update("er")
+		>>> session.candidates
+		[1]
+		>>> session.update("e")  # backspace restores the cached set
+	"""
+
+	def __init__(
+		self, lines: list[str], case_sensitive: bool = False, generation: int | None = None
+	) -> None:
+		"""
+		Initialize the session.
+
+		Args:
+			lines: ANSI-stripped snapshot lines to search
+			case_sensitive: Match case exactly
+			generation: Content generation the snapshot was read at, if known
+		"""
+		self.lines = lines
+		self.generation = generation
+		self._case_sensitive = case_sensitive
+		# Lines are folded once up front so narrowing is a plain substring
+		# test; casefold matches the committed search in OutputSearchManager.
+		self._folded = lines if case_sensitive else [line.casefold() for line in lines]
+		# Stack of (query, candidate line indices); the root holds every line.
+		self._stack: list[tuple[str, list[int]]] = [("", list(range(len(lines))))]
+
+	@property
+	def query(self) -> str:
+		"""The query the current candidate set was built for."""
+		return self._stack[-1][0]
+
+	@property
+	def candidates(self) -> list[int]:
+		"""0-based indices of lines matching the current query."""
+		return self._stack[-1][1]
+
+	def update(self, query: str) -> list[int]:
+		"""
+		Move the session to *query* and return its candidate lines.
+
+		Args:
+			query: Full text currently in the search field
+
+		Returns:
+			0-based indices of matching lines
+		"""
+		# Pop cached sets until the top query is a prefix of the new one;
+		# the root ("") is a prefix of everything, so this always terminates.
+		while len(self._stack) > 1 and not query.startswith(self._stack[-1][0]):
+			self._stack.pop()
+
+		top_query, top_candidates = self._stack[-1]
+		if query == top_query:
+			return top_candidates
+
+		needle = query if self._case_sensitive else query.casefold()
+		folded = self._folded
+		narrowed = [i for i in top_candidates if needle in folded[i]]
+		self._stack.append((query, narrowed))
+		return narrowed
+
+	def match_count(self) -> int:
+		"""
+		Count occurrences of the current query across candidate lines.
+
+		Returns:
+			Number of occurrences (0 for an empty query)
+		"""
+		query = self.query
+		if not query:
+			return 0
+		needle = query if self._case_sensitive else query.casefold()
+		folded = self._folded
+		return sum(folded[i].count(needle) for i in self.candidates)
+
+	def first_match(self) -> tuple[int, str] | None:
+		"""
+		Get the first matching line.
+
+		Returns:
+			(0-based line index, line text) or None if nothing matches
+		"""
+		if not self.query or not self.candidates:
+			return None
+		index = self.candidates[0]
+		return index, self.lines[index]
+
+
+class FuzzyLineFinder:
+	"""
+	Rank buffer lines against a loosely remembered query.
+
+	Section 8.2: Output Filtering and Search (v1.0.54+)
+
+	The query is split into whitespace-separated tokens.  A token found as a
+	substring scores highest (with a bonus at a word start); a token whose
+	characters appear in order within one word ("refsd" in "refused") scores
+	lower; a missing token scores nothing.  Only the best ``max_results``
+	lines are kept, in a bounded min-heap, so memory stays constant on large
+	buffers.
+
+	Lines are scanned newest-first and ties favour newer lines.  Once the
+	heap holds only perfect scores, no older line can displace them and the
+	scan stops early.  Ranking can run on a worker thread; starting a new
+	query cancels the previous one.
+
+	Example usage:
+		>>> finder = FuzzyLineFinder()
+		>>> finder.rank(["ok", "connect: Connection refused port 5432"], "conn refused 5432")
+		[(51, 1, 0)]
+	"""
+
+	MAX_RESULTS: int = 20
+	_SUBSTRING_WEIGHT: int = 3
+	_WORD_START_BONUS: int = 2
+	_WORD_GAP_RE: re.Pattern[str] = re.compile(r'\s')
+
+	def __init__(self, max_results: int = MAX_RESULTS) -> None:
+		"""
+		Initialize the finder.
+
+		Args:
+			max_results: Number of top-ranked lines to keep
+		"""
+		self._max_results = max_results
+		self._lock = threading.Lock()
+		self._cancel_event: threading.Event | None = None
+
+	@staticmethod
+	def _compile_tokens(query: str) -> list[str]:
+		"""
+		Split a query into lowercased tokens.
+
+		Args:
+			query: Raw query text
+
+		Returns:
+			List of tokens
+		"""
+		return query.lower().split()
+
+	@classmethod
+	def _find_subsequence(cls, token: str, folded: str) -> int:
+		"""
+		Find a word containing the token's characters in order.
+
+		Each word is scanned once, greedily, with str.find bounded by the
+		word's end, so the cost is linear in the line length.  A regular
+		expression with lazy gaps between the characters would backtrack
+		exponentially on lines such as long runs of one letter.
+
+		Args:
+			token: Lowercased token
+			folded: Lowercased line text
+
+		Returns:
+			int: Offset of the token's first character in the first matching word, or -1
+		"""
+		first = token[0]
+		start = folded.find(first)
+		while start >= 0:
+			gap = cls._WORD_GAP_RE.search(folded, start)
+			word_end = gap.start() if gap else len(folded)
+			pos = start
+			for ch in token[1:]:
+				pos = folded.find(ch, pos + 1, word_end)
+				if pos < 0:
+					break
+			else:
+				return start
+			start = folded.find(first, word_end)
+		return -1
+
+	@classmethod
+	def _score_line(cls, tokens: list[str], line: str) -> tuple[int, int]:
+		"""
+		Score one line against query tokens.
+
+		Args:
+			tokens: Output of _compile_tokens
+			line: Line text
+
+		Returns:
+			(score, character offset of the best token hit); score 0 means no match
+		"""
+		folded = line.lower()
+		score = 0
+		offset = -1
+		for token in tokens:
+			pos = folded.find(token)
+			if pos >= 0:
+				score += cls._SUBSTRING_WEIGHT * len(token)
+				if pos == 0 or not folded[pos - 1].isalnum():
+					score += cls._WORD_START_BONUS
+				if offset < 0:
+					offset = pos
+				continue
+			pos = cls._find_subsequence(token, folded)
+			if pos >= 0:
+				score += len(token)
+				if offset < 0:
+					offset = pos
+		return score, max(offset, 0)
+
+	def rank(
+		self,
+		lines: list[str],
+		query: str,
+		cancel_event: threading.Event | None = None,
+	) -> list[tuple[int, int, int]]:
+		"""
+		Rank *lines* against *query* and return the best matches.
+
+		Args:
+			lines: Snapshot lines to search
+			query: Loosely remembered text, e.g. "conn refused 5432"
+			cancel_event: Optional event; when set the scan stops and returns []
+
+		Returns:
+			List of (score, 0-based line index, character offset), best first
+		"""
+		tokens = self._compile_tokens(query)
+		if not tokens:
+			return []
+
+		perfect = sum(self._SUBSTRING_WEIGHT * len(t) + self._WORD_START_BONUS for t in tokens)
+		limit = self._max_results
+		heap: list[tuple[int, int, int]] = []
+		score_line = self._score_line
+
+		for index in range(len(lines) - 1, -1, -1):
+			if cancel_event is not None and cancel_event.is_set():
+				return []
+			score, offset = score_line(tokens, lines[index])
+			if score <= 0:
+				continue
+			if len(heap) < limit:
+				heapq.heappush(heap, (score, index, offset))
+			elif score > heap[0][0]:
+				heapq.heapreplace(heap, (score, index, offset))
+			# Newest-first scan: ties never displace a kept line, so a heap
+			# full of perfect scores cannot improve any further.
+			if len(heap) == limit and heap[0][0] >= perfect:
+				break
+
+		return sorted(heap, key=lambda item: (-item[0], -item[1]))
+
+	def find_async(self, lines: list[str], query: str, callback) -> None:
+		"""
+		Rank on a worker thread and deliver results to *callback*.
+
+		Any ranking still running is cancelled first; a cancelled run never
+		invokes its callback.
+
+		Args:
+			lines: Snapshot lines to search
+			query: Query text
+			callback: Called with the result list from rank() on the worker thread
+		"""
+		cancel_event = threading.Event()
+		with self._lock:
+			if self._cancel_event is not None:
+				self._cancel_event.set()
+			self._cancel_event = cancel_event
+
+		def _worker():
+			try:
+				results = self.rank(lines, query, cancel_event)
+			except Exception as e:
+				import logHandler
+				logHandler.log.error(f"Terminal Access: Fuzzy line search failed: {e}")
+				results = []
+			if not cancel_event.is_set():
+				callback(results)
+
+		thread = threading.Thread(target=_worker, daemon=True)
+		thread.start()
+
+	def cancel(self) -> None:
+		"""Cancel any ranking in progress."""
+		with self._lock:
+			if self._cancel_event is not None:
+				self._cancel_event.set()
+				self._cancel_event = None
+
+
+class OutputSearchManager:
+	"""
+	Search and filter terminal output with pattern matching.
+
+	Section 8.2: Output Filtering and Search (v1.0.30+)
 
 	This class enables users to search through terminal output using text patterns
 	or regular expressions, navigate between matches, and filter output. Useful for:
@@ -3752,24 +6238,31 @@ class OutputSearchManager:
 		>>> manager.get_match_count()  # Get total matches
 	"""
 
-	def __init__(self, terminal_obj, tab_manager=None):
+	def __init__(self, terminal_obj, tab_manager=None, generation: ContentGeneration | None = None):
 		"""
 		Initialize the OutputSearchManager.
 
 		Args:
 			terminal_obj: Terminal TextInfo object for searching
 			tab_manager: Optional TabManager for tab-aware search storage
+			generation: Optional content generation authority; results are
+				re-run when content at or above a match changes
 		"""
 		self._terminal = terminal_obj
 		self._tab_manager = tab_manager
+		self._generation = generation
+		self._search_generation = 0
 		# Legacy single-tab storage
 		self._pattern = None
 		self._matches = []  # List of (bookmark, line_text, line_num) tuples
 		self._current_match_index = -1
 		self._case_sensitive = False
 		self._use_regex = False
-		# Per-tab storage
-		self._tab_searches = {}  # tab_id -> {pattern, matches, index, case_sensitive, use_regex}
+		# Tab whose search the fields above hold; other tabs' searches are
+		# parked in their TabState
+		self._state_tab_id = self._get_current_tab_id()
+		# Fuzzy line finder (runs on a worker thread)
+		self._fuzzy_finder = FuzzyLineFinder()
 
 	def _get_current_tab_id(self) -> str:
 		"""Get current tab ID, or None if no tab manager."""
@@ -3778,51 +6271,63 @@ class OutputSearchManager:
 		return None
 
 	def _get_search_state(self):
-		"""Get the appropriate search state dict for the current context."""
-		tab_id = self._get_current_tab_id()
-		if tab_id:
-			# Multi-tab mode: use per-tab storage
-			if tab_id not in self._tab_searches:
-				self._tab_searches[tab_id] = {
-					'pattern': None,
-					'matches': [],
-					'current_match_index': -1,
-					'case_sensitive': False,
-					'use_regex': False
-				}
-			return self._tab_searches[tab_id]
-		else:
-			# Legacy mode: use instance variables
-			return {
-				'pattern': self._pattern,
-				'matches': self._matches,
-				'current_match_index': self._current_match_index,
-				'case_sensitive': self._case_sensitive,
-				'use_regex': self._use_regex
-			}
+		"""Get the current search state as a dict."""
+		return {
+			'pattern': self._pattern,
+			'matches': self._matches,
+			'current_match_index': self._current_match_index,
+			'case_sensitive': self._case_sensitive,
+			'use_regex': self._use_regex,
+			'generation': self._search_generation
+		}
 
 	def _save_search_state(self, state):
-		"""Save search state to the appropriate storage."""
+		"""Make a search state dict the current search (None clears it)."""
+		if state is None:
+			self.clear_search()
+			return
+		self._pattern = state['pattern']
+		self._matches = state['matches']
+		self._current_match_index = state['current_match_index']
+		self._case_sensitive = state['case_sensitive']
+		self._use_regex = state['use_regex']
+		self._search_generation = state.get('generation', -1)
+
+	def _switch_tab_state(self) -> None:
+		"""Park the current search in its tab's container and restore the focused tab's."""
 		tab_id = self._get_current_tab_id()
-		if tab_id:
-			# Multi-tab mode
-			self._tab_searches[tab_id] = state
-		else:
-			# Legacy mode
-			self._pattern = state['pattern']
-			self._matches = state['matches']
-			self._current_match_index = state['current_match_index']
-			self._case_sensitive = state['case_sensitive']
-			self._use_regex = state['use_regex']
-
-	def search(self, pattern: str, case_sensitive: bool = False, use_regex: bool = False) -> int:
+		if tab_id == self._state_tab_id:
+			return
+		previous = self._tab_manager.get_tab_state(self._state_tab_id, create=False) if self._state_tab_id else None
+		if previous is not None:
+			previous.search = self._get_search_state()
+		state = self._tab_manager.get_tab_state(tab_id)
+		self._save_search_state(state.search if state else None)
+		self._state_tab_id = tab_id
+
+	def search(
+		self,
+		pattern: str,
+		case_sensitive: bool = False,
+		use_regex: bool = False,
+		lines: list[str] | None = None,
+		generation: int | None = None,
+	) -> int:
 		"""
 		Search for pattern in terminal output.
 
+		Case-insensitive plain-text searches compare casefolded text, as
+		IncrementalSearchSession does, so the counts announced while typing
+		match the committed results.
+
 		Args:
 			pattern: Search pattern (text or regex)
 			case_sensitive: Case sensitive search
 			use_regex: Use regular expression
+			lines: Pre-fetched ANSI-stripped snapshot lines (for example from
+				an incremental search session); fetched from the terminal if None
+			generation: Content generation *lines* were read at; results are
+				treated as stale from then on
 
 		Returns:
 			int: Number of matches found
@@ -3830,67 +6335,57 @@ class OutputSearchManager:
 		if not self._terminal or not pattern:
 			return 0
 
-		def _store_match(line_info, line_text, line_num, char_offset):
+		def _store_line_matches(line_info, line_text, line_num, offsets):
 			"""
-			Store a search match with a bookmark and fallback position.
+			Store one search match per occurrence on a line.
 
-			Fallback is needed when bookmarks aren't supported by the TextInfo implementation.
-			char_offset is the character position within the line where the match starts.
+			All occurrences on the line share one bookmark and one fallback
+			position (needed when bookmarks aren't supported by the TextInfo
+			implementation); each carries its own character offset.
 			"""
 			bookmark = getattr(line_info, "bookmark", None)
 			try:
 				fallback_pos = line_info.copy()
 			except Exception:
 				fallback_pos = line_info
-			self._matches.append((bookmark, line_text, line_num, fallback_pos, char_offset))
-
-		def _find_match_offset(line_text, pattern, case_sensitive, use_regex):
-			"""Find the character offset of the first match in the line."""
-			if use_regex:
-				flags = 0 if case_sensitive else re.IGNORECASE
-				match = re.search(pattern, line_text, flags)
-				return match.start() if match else 0
-			else:
-				search_pattern = pattern if case_sensitive else pattern.lower()
-				search_text = line_text if case_sensitive else line_text.lower()
-				offset = search_text.find(search_pattern)
-				return offset if offset >= 0 else 0
+			for char_offset in offsets:
+				self._matches.append((bookmark, line_text, line_num, fallback_pos, char_offset))
 
 		self._pattern = pattern
 		self._case_sensitive = case_sensitive
 		self._use_regex = use_regex
 		self._matches = []
 		self._current_match_index = -1
+		# Taken before the snapshot so changes during the search count as stale
+		if self._generation is not None:
+			self._search_generation = (
+				generation if lines is not None and generation is not None else self._generation.value
+			)
 
 		try:
-			# Get all terminal content
-			info = self._terminal.makeTextInfo(textInfos.POSITION_ALL)
-			all_text = info.text
-
-			if not all_text:
+			if lines is None:
+				lines = self._get_snapshot_lines()
+			if not lines:
 				return 0
 
-			# Strip ANSI escape sequences that some terminals leave in the
-			# text buffer.  Without this, embedded formatting codes can
-			# break substring matching for terms the user can clearly see.
-			all_text = ANSIParser._STRIP_PATTERN.sub('', all_text)
-
-			# Split into lines and build a set of matching line numbers first
-			# (0-indexed internally, converted to 1-indexed for storage).
-			lines = all_text.split('\n')
-
-			if use_regex:
-				flags = 0 if case_sensitive else re.IGNORECASE
-				compiled = re.compile(pattern, flags)
-				matching_indices = [i for i, line in enumerate(lines) if compiled.search(line)]
+			# Collect the column of every occurrence with a single finditer
+			# pass per line (0-indexed internally, converted to 1-indexed
+			# for storage).
+			line_offsets = {}
+			if use_regex or case_sensitive:
+				compiled = _get_search_pattern(pattern, case_sensitive, use_regex)
+				for i, line in enumerate(lines):
+					offsets = self._find_match_offsets(compiled, line)
+					if offsets:
+						line_offsets[i] = offsets
 			else:
-				search_pattern = pattern if case_sensitive else pattern.lower()
-				matching_indices = [
-					i for i, line in enumerate(lines)
-					if search_pattern in (line if case_sensitive else line.lower())
-				]
+				needle = pattern.casefold()
+				for i, line in enumerate(lines):
+					offsets = self._find_folded_offsets(needle, line)
+					if offsets:
+						line_offsets[i] = offsets
 
-			if not matching_indices:
+			if not line_offsets:
 				return 0
 
 			# Single forward pass from POSITION_FIRST: walk line by line,
@@ -3899,11 +6394,10 @@ class OutputSearchManager:
 			# single O(total_lines) walk for the entire search.
 			try:
 				cursor = self._terminal.makeTextInfo(textInfos.POSITION_FIRST)
-				match_set = set(matching_indices)
 				for line_index in range(len(lines) - 1 if lines[-1] == '' else len(lines)):
-					if line_index in match_set:
-						char_offset = _find_match_offset(lines[line_index], pattern, case_sensitive, use_regex)
-						_store_match(cursor, lines[line_index], line_index + 1, char_offset)
+					offsets = line_offsets.get(line_index)
+					if offsets:
+						_store_line_matches(cursor, lines[line_index], line_index + 1, offsets)
 					if line_index < len(lines) - 1:
 						moved = cursor.move(textInfos.UNIT_LINE, 1)
 						if not moved:
@@ -3911,12 +6405,11 @@ class OutputSearchManager:
 			except Exception:
 				# Fall back to per-match walk if single-pass fails.
 				self._matches = []
-				for i in matching_indices:
+				for i, offsets in line_offsets.items():
 					try:
 						line_info = self._terminal.makeTextInfo(textInfos.POSITION_FIRST)
 						line_info.move(textInfos.UNIT_LINE, i)
-						char_offset = _find_match_offset(lines[i], pattern, case_sensitive, use_regex)
-						_store_match(line_info, lines[i], i + 1, char_offset)
+						_store_line_matches(line_info, lines[i], i + 1, offsets)
 					except Exception:
 						pass
 
@@ -3925,6 +6418,95 @@ class OutputSearchManager:
 		except Exception:
 			return 0
 
+	def _get_snapshot_lines(self) -> list[str]:
+		"""
+		Fetch the terminal buffer as ANSI-stripped lines.
+
+		Returns:
+			List of lines (empty if the buffer is empty)
+		"""
+		all_text = self._terminal.makeTextInfo(textInfos.POSITION_ALL).text
+		if not all_text:
+			return []
+		# Strip ANSI escape sequences that some terminals leave in the
+		# text buffer.  Without this, embedded formatting codes can
+		# break substring matching for terms the user can clearly see.
+		return ANSIParser._STRIP_PATTERN.sub('', all_text).split('\n')
+
+	def begin_incremental_search(self, case_sensitive: bool = False) -> IncrementalSearchSession | None:
+		"""
+		Snapshot the buffer once and start a search-as-you-type session.
+
+		Args:
+			case_sensitive: Match case exactly
+
+		Returns:
+			IncrementalSearchSession, or None if the buffer cannot be read
+		"""
+		if not self._terminal:
+			return None
+		generation = self._generation.value if self._generation is not None else None
+		try:
+			return IncrementalSearchSession(self._get_snapshot_lines(), case_sensitive, generation)
+		except Exception:
+			return None
+
+	@staticmethod
+	def _find_folded_offsets(needle: str, line_text: str) -> list[int]:
+		"""
+		Find the start column of every occurrence of a casefolded needle in a line.
+
+		Casefolding can lengthen a character (``ß`` becomes ``ss``), so
+		offsets in the folded line are mapped back to the original line.
+
+		Args:
+			needle: Casefolded search text
+			line_text: Line to scan
+
+		Returns:
+			Sorted list of 0-based character offsets (empty when no match)
+		"""
+		folded = line_text.casefold()
+		start = folded.find(needle)
+		if start < 0:
+			return []
+		offsets = []
+		while start >= 0:
+			offsets.append(start)
+			start = folded.find(needle, start + len(needle))
+		if len(folded) != len(line_text):
+			ends = list(itertools.accumulate(len(char.casefold()) for char in line_text))
+			offsets = [bisect.bisect_right(ends, offset) for offset in offsets]
+		return offsets
+
+	@staticmethod
+	def _find_match_offsets(compiled: re.Pattern[str], line_text: str) -> list[int]:
+		"""
+		Find the start column of every occurrence of *compiled* in a line.
+
+		Zero-width matches (``^``, ``\\b``, ``x*``) are collapsed to a single
+		hit per line so that anchors still locate lines without producing
+		one match per character.
+
+		Args:
+			compiled: Compiled search pattern
+			line_text: Line to scan
+
+		Returns:
+			Sorted list of 0-based character offsets (empty when no match)
+		"""
+		offsets = []
+		empty_offset = -1
+		for match in compiled.finditer(line_text):
+			start = match.start()
+			if match.end() > start:
+				offsets.append(start)
+			elif empty_offset < 0:
+				empty_offset = start
+		if not offsets and empty_offset >= 0:
+			offsets.append(empty_offset)
+		return offsets
+
 	def next_match(self) -> bool:
 		"""
 		Jump to next match.
@@ -3995,13 +6577,44 @@ class OutputSearchManager:
 		Returns:
 			bool: True if jump successful
 		"""
+		self._refresh_if_stale()
 		if not self._matches or self._current_match_index < 0:
 			return False
 
+		return self._jump_to_match(self._matches[self._current_match_index])
+
+	def _refresh_if_stale(self) -> None:
+		"""
+		Re-run the search if content at or above the last match has changed.
+
+		Changes only below every match leave the results valid, so they are
+		kept.  After a re-run the match index is kept, clamped to the new
+		result count.
+		"""
+		if self._generation is None or not self._matches:
+			return
+		first_row = self._generation.first_changed_row_since(self._search_generation)
+		if first_row is None or first_row >= self._matches[-1][2]:
+			return
+		index = self._current_match_index
+		if self.search(self._pattern, self._case_sensitive, self._use_regex):
+			self._current_match_index = min(index, len(self._matches) - 1)
+
+	def _jump_to_match(self, match) -> bool:
+		"""
+		Resolve a match tuple to a position and move the review cursor there.
+
+		The bookmark is tried first, then the stored fallback position; the
+		cursor is then advanced to the match's character offset.
+
+		Args:
+			match: Match tuple in any format accepted by _unpack_match
+
+		Returns:
+			bool: True if jump successful
+		"""
 		try:
-			bookmark, line_text, line_num, pos_info, char_offset = self._unpack_match(
-				self._matches[self._current_match_index]
-			)
+			bookmark, line_text, line_num, pos_info, char_offset = self._unpack_match(match)
 
 			pos = None
 			if bookmark is not None:
@@ -4032,6 +6645,57 @@ class OutputSearchManager:
 
 		return False
 
+	def jump_to_line(self, line_num: int, char_offset: int = 0) -> bool:
+		"""
+		Jump the review cursor to a line outside the current search results.
+
+		Uses the same resolution path as search matches.
+
+		Args:
+			line_num: 1-based line number
+			char_offset: Character offset within the line
+
+		Returns:
+			bool: True if jump successful
+		"""
+		if not self._terminal or line_num < 1:
+			return False
+		try:
+			pos = self._terminal.makeTextInfo(textInfos.POSITION_FIRST)
+			if line_num > 1:
+				pos.move(textInfos.UNIT_LINE, line_num - 1)
+		except Exception:
+			return False
+		return self._jump_to_match((None, "", line_num, pos, char_offset))
+
+	def fuzzy_find(self, query: str, callback) -> bool:
+		"""
+		Start a fuzzy line search over a fresh snapshot.
+
+		Ranking runs on a worker thread.  *callback* is invoked there with a
+		list of (line_num, char_offset, line_text) tuples, best first, and
+		line_num 1-based as in search matches.
+
+		Args:
+			query: Loosely remembered text
+			callback: Receives the ranked result list
+
+		Returns:
+			bool: True if the search was started
+		"""
+		if not self._terminal or not query.strip():
+			return False
+		try:
+			lines = self._get_snapshot_lines()
+		except Exception:
+			return False
+
+		def _deliver(ranked):
+			callback([(index + 1, offset, lines[index]) for _, index, offset in ranked])
+
+		self._fuzzy_finder.find_async(lines, query, _deliver)
+		return True
+
 	def get_match_count(self) -> int:
 		"""
 		Get total number of matches.
@@ -4071,8 +6735,12 @@ class OutputSearchManager:
 			terminal_obj: New terminal TextInfo object
 		"""
 		self._terminal = terminal_obj
-		# Clear search results when terminal changes
-		self.clear_search()
+		if self._get_current_tab_id():
+			# Keep each tab's results across focus switches
+			self._switch_tab_state()
+		else:
+			# Clear search results when terminal changes
+			self.clear_search()
 
 	def set_tab_manager(self, tab_manager):
 		"""
@@ -4082,6 +6750,137 @@ class OutputSearchManager:
 			tab_manager: TabManager instance
 		"""
 		self._tab_manager = tab_manager
+		self._state_tab_id = self._get_current_tab_id()
+
+
+class CommandBlockIndex:
+	"""
+	Compact index of command blocks built while scanning for prompts.
+
+	Section 8.1: Command History Navigation (v1.0.54+)
+
+	Each block is (prompt row, command text, output start row, output end
+	row).  Rows are kept in parallel ``array('i')`` columns, so jumping to a
+	command's output is an index lookup rather than a walk through lines.
+	A block's output ends on the row before the next prompt; the newest
+	block's output grows as more output is scanned.  An empty output has an
+	end row before its start row.
+
+	Indexing returns a block tuple, so the index can be used like a sequence
+	of (prompt_row, command, output_start, output_end).
+	"""
+
+	def __init__(self, max_blocks: int = 100) -> None:
+		"""
+		Initialize an empty index.
+
+		Args:
+			max_blocks: Maximum number of blocks kept; the oldest are dropped first
+		"""
+		self._max_blocks = max_blocks
+		self._prompt_rows = array.array('i')
+		self._output_starts = array.array('i')
+		self._output_ends = array.array('i')
+		self._commands: list[str] = []
+		# Set once the newest block's end is known exactly (shell integration)
+		self._last_closed = False
+
+	def __len__(self) -> int:
+		return len(self._commands)
+
+	def __getitem__(self, index: int) -> tuple[int, str, int, int]:
+		return (
+			self._prompt_rows[index],
+			self._commands[index],
+			self._output_starts[index],
+			self._output_ends[index],
+		)
+
+	def __iter__(self):
+		return zip(self._prompt_rows, self._commands, self._output_starts, self._output_ends)
+
+	def append(self, prompt_row: int, command: str, output_start: int | None = None) -> None:
+		"""
+		Add a block and close the previous block's output at this prompt.
+
+		Args:
+			prompt_row: Row of the prompt line
+			command: Command text
+			output_start: First output row (default: the row after the prompt)
+		"""
+		if self._commands and not self._last_closed:
+			self._output_ends[-1] = max(prompt_row - 1, self._output_starts[-1] - 1)
+		self._last_closed = False
+		start = prompt_row + 1 if output_start is None else output_start
+		self._prompt_rows.append(prompt_row)
+		self._commands.append(command)
+		self._output_starts.append(start)
+		self._output_ends.append(start - 1)
+		if len(self._commands) > self._max_blocks:
+			self._drop_front(1)
+
+	def extend_last_output(self, end_row: int) -> None:
+		"""
+		Extend the newest block's output through *end_row*.
+
+		Args:
+			end_row: Last scanned output row
+		"""
+		if self._commands and not self._last_closed and end_row > self._output_ends[-1]:
+			self._output_ends[-1] = end_row
+
+	def set_last_output_start(self, start_row: int) -> None:
+		"""
+		Set where the newest block's output begins.
+
+		Args:
+			start_row: First output row
+		"""
+		if self._commands:
+			self._output_starts[-1] = start_row
+			self._output_ends[-1] = max(self._output_ends[-1], start_row - 1)
+
+	def close_last_output(self, end_row: int) -> None:
+		"""
+		Fix the newest block's last output row; later scans will not extend it.
+
+		Args:
+			end_row: Last output row
+		"""
+		if self._commands and not self._last_closed:
+			self._output_ends[-1] = max(end_row, self._output_starts[-1] - 1)
+			self._last_closed = True
+
+	def shift(self, offset: int) -> None:
+		"""
+		Move all rows up after *offset* lines rolled off the buffer top.
+
+		Blocks whose prompt scrolled away are dropped.
+
+		Args:
+			offset: Number of lines removed from the top
+		"""
+		dropped = 0
+		while dropped < len(self._prompt_rows) and self._prompt_rows[dropped] < offset:
+			dropped += 1
+		self._drop_front(dropped)
+		for column in (self._prompt_rows, self._output_starts, self._output_ends):
+			for i in range(len(column)):
+				column[i] -= offset
+
+	def _drop_front(self, count: int) -> None:
+		"""Remove the *count* oldest blocks."""
+		if count <= 0:
+			return
+		del self._prompt_rows[:count]
+		del self._output_starts[:count]
+		del self._output_ends[:count]
+		del self._commands[:count]
+
+	def clear(self) -> None:
+		"""Remove all blocks."""
+		self._drop_front(len(self._commands))
+		self._last_closed = False
 
 
 class CommandHistoryManager:
@@ -4103,6 +6902,11 @@ class CommandHistoryManager:
 	  * WSL: Linux prompts
 	- Navigate through command history (previous/next)
 	- Jump to specific command
+	- Block index: jump to, read or copy a command's output by row lookup
+	- OSC 133 shell-integration marks give exact command and output
+	  boundaries; prompt patterns are only a fallback
+	- Custom prompts (starship, powerlevel10k, ...) are learned from the
+	  text before the caret when typing starts, per profile
 	- List command history
 	- Configurable history size
 
@@ -4114,6 +6918,18 @@ class CommandHistoryManager:
 		>>> manager.list_history()
 	"""
 
+	# Number of trailing scanned lines whose content hash anchors the scan position
+	_ANCHOR_LINES: int = 3
+	# Characters from the end of the buffer compared to skip unchanged snapshots
+	_TAIL_CHECK_LEN: int = 256
+	# Bare prompt samples kept per profile for prompt learning
+	_PROMPT_SAMPLES: int = 8
+	# Attributes making up one tab's history, parked in its TabState on tab switch
+	_TAB_STATE_FIELDS: tuple[str, ...] = (
+		'_history', '_lines', '_current_index', '_scan_anchor',
+		'_last_text_len', '_last_text_tail', '_shell_integration',
+	)
+
 	def __init__(self, terminal_obj, max_history=100, tab_manager=None):
 		"""
 		Initialize the CommandHistoryManager.
@@ -4126,22 +6942,37 @@ class CommandHistoryManager:
 		self._terminal = terminal_obj
 		self._max_history = max_history
 		self._tab_manager = tab_manager
-		# Legacy single-tab storage (deque for O(1) pop-from-front when limiting size)
-		self._history: collections.deque = collections.deque(maxlen=max_history)
+		# Legacy single-tab storage: block index of
+		# (prompt_row, command_text, output_start, output_end)
+		self._history = CommandBlockIndex(max_history)
+		# Lines of the most recently ingested snapshot, for reading output
+		self._lines: list[str] = []
+		# True once OSC 133 shell-integration marks have been seen; prompt
+		# regexes are then no longer consulted.
+		self._shell_integration = False
+		# Prompts learned from typing activity, per profile: recent bare
+		# prompt samples and the pattern built from them
+		self._prompt_scope = "default"
+		self._prompt_samples: dict[str, collections.deque] = {}
+		self._learned_prompts: dict[str, re.Pattern] = {}
 		self._current_index = -1  # Current position in history (-1 = not navigating)
-		self._last_scan_line = 0  # Last line scanned for commands
-		# Per-tab storage
-		self._tab_histories = {}  # tab_id -> {history, current_index, last_scan_line}
-
-		# Use module-level compiled prompt patterns
-		self._prompt_patterns = _PROMPT_PATTERNS
+		# Scan position anchored by content: (row of the last non-blank
+		# scanned line, hash of that line and the lines just above it), or
+		# None before the first scan.  Survives scrollback rollover, unlike a raw row index.
+		self._scan_anchor: tuple[int, int] | None = None
+		# Cheap change check for automatic ingestion
+		self._last_text_len = -1
+		self._last_text_tail = ""
+		# Tab whose history the fields above hold; other tabs' histories are
+		# parked in their TabState
+		self._state_tab_id = self._get_current_tab_id()
 
 	def detect_and_store_commands(self) -> int:
 		"""
 		Scan terminal output for new commands and store them.
 
-		Uses a single forward walk from POSITION_FIRST to collect bookmarks,
-		avoiding repeated POSITION_ALL + per-command O(line_num) walks.
+		Only lines appended since the previous scan are examined; see
+		ingest_text().
 
 		Returns:
 			Number of new commands detected
@@ -4150,79 +6981,303 @@ class CommandHistoryManager:
 			return 0
 
 		try:
-			# Get all terminal content
 			info = self._terminal.makeTextInfo(textInfos.POSITION_ALL)
-			content = info.text
-
-			if not content:
-				return 0
+			return self.ingest_text(info.text, force=True)
+		except Exception:
+			return 0
 
-			# Strip ANSI escape sequences that some terminals leave in the
-			# text buffer so prompt patterns match cleanly.
-			content = ANSIParser._STRIP_PATTERN.sub('', content)
+	def ingest_text(self, text: str, force: bool = False) -> int:
+		"""
+		Ingest a buffer snapshot, detecting commands in newly appended lines.
 
-			lines = content.split('\n')
-			new_commands = 0
-			scan_start = self._last_scan_line
-			scan_end = len(lines)
+		Called automatically whenever new output is seen.  The scan position
+		is anchored by the content hash of the last scanned lines, so when
+		the buffer scrolls (lines roll off the top) the anchor is found
+		higher up and stored rows are shifted, and when the buffer is
+		cleared the anchor is gone and stale entries are dropped.  Neither
+		case triggers a rescan of lines already seen.
 
-			if scan_start >= scan_end:
-				return 0
+		The live row, the last non-blank one, is never ingested: it may be a
+		prompt that is still being typed, or a line still being written.
+		When it is a prompt it also ends the output of the previous command,
+		and the scan anchor stays on the rows above it, so typing at the
+		prompt does not move the anchor.
 
-			# Single forward walk: start at POSITION_FIRST, advance to
-			# scan_start, then walk through new lines collecting bookmarks
-			# only for matching lines.  This is O(total_new_lines) COM calls
-			# instead of O(sum_of_line_numbers) for the old per-command walk.
-			try:
-				cursor = self._terminal.makeTextInfo(textInfos.POSITION_FIRST)
-				# Skip to scan_start position
-				if scan_start > 0:
-					cursor.move(textInfos.UNIT_LINE, scan_start)
-
-				for line_num in range(scan_start, scan_end):
-					line = lines[line_num].strip()
-
-					if line:
-						# Try to match against prompt patterns
-						for pat in self._prompt_patterns:
-							match = pat.match(line)
-							if match:
-								command_text = match.group(1).strip()
-
-								# Ignore empty commands or very short ones
-								if len(command_text) < 2:
-									continue
-
-								# Check if this is a duplicate of last command
-								if self._history and self._history[-1][1] == command_text:
-									continue
-
-								# Grab bookmark from the cursor at current position
-								try:
-									bookmark = cursor.bookmark
-									self._history.append((line_num, command_text, bookmark))
-									new_commands += 1
-								except Exception:
-									pass
-
-								break  # Found a match, no need to try other patterns
-
-					# Advance cursor to next line
-					if line_num < scan_end - 1:
-						if not cursor.move(textInfos.UNIT_LINE, 1):
-							break
-			except Exception:
-				# Cursor walk failed — fall back silently
-				pass
+		Args:
+			text: Full terminal buffer text
+			force: Ingest even if the snapshot looks unchanged
+
+		Returns:
+			Number of new commands detected
+		"""
+		if not text:
+			return 0
+
+		tail = text[-self._TAIL_CHECK_LEN:]
+		if not force and len(text) == self._last_text_len and tail == self._last_text_tail:
+			return 0
+		self._last_text_len = len(text)
+		self._last_text_tail = tail
+
+		lines = text.split('\n')
+		self._lines = lines
+		complete = self._complete_rows(lines)
+		new_commands = self._scan_rows(lines, self._locate_scan_start(lines, complete), complete)
+
+		if complete > 0:
+			self._history.extend_last_output(complete - 1)
+			# Anchor on content: blank padding rows below the output would
+			# still match after new output fills the rows above them
+			anchor_row = complete - 1
+			while anchor_row >= 0 and not lines[anchor_row].strip():
+				anchor_row -= 1
+			self._scan_anchor = (anchor_row, _context_hash(lines, anchor_row, self._ANCHOR_LINES)) if anchor_row >= 0 else None
+		return new_commands
+
+	def _complete_rows(self, lines: list[str]) -> int:
+		"""
+		Count the rows before the live row that can be scanned.
+
+		Args:
+			lines: Buffer lines
+
+		Returns:
+			Number of leading rows that are complete
+		"""
+		live = len(lines) - 1
+		while live >= 0 and not lines[live].strip():
+			live -= 1
+		if live < 0:
+			return 0
+		if self._is_prompt_row(lines[live]):
+			return live
+		# Output: the last line may still be written, blank padding below it is skipped
+		return min(live + 1, len(lines) - 1)
+
+	def _is_prompt_row(self, line: str) -> bool:
+		"""
+		Check whether a row is a prompt, bare or with a command being typed.
+
+		Args:
+			line: Raw buffer line
+
+		Returns:
+			True for a prompt row
+		"""
+		if '\x1b' in line:
+			line, marks = ANSIParser.stripANSIWithMarks(line)
+			if marks:
+				return marks[-1][0] in 'AB'
+		# A placeholder command makes bare and partly typed prompts match alike
+		line = f"{line.strip()} x"
+		if _match_prompt_command(line) is not None:
+			return True
+		learned = self._learned_prompts.get(self._prompt_scope)
+		return learned is not None and learned.match(line) is not None
+
+	def _scan_rows(self, lines: list[str], start: int, end: int) -> int:
+		"""
+		Detect commands on rows *start* to *end* (exclusive).
+
+		Args:
+			lines: Buffer lines
+			start: First row to scan
+			end: Row to stop before
+
+		Returns:
+			Number of commands stored
+		"""
+		new_commands = 0
+		for row in range(start, end):
+			line = lines[row]
+			marks = None
+			if '\x1b' in line:
+				# Strip ANSI escape sequences that some terminals leave in
+				# the text buffer, keeping any shell-integration marks.
+				line, marks = ANSIParser.stripANSIWithMarks(line)
+			if marks:
+				self._shell_integration = True
+				new_commands += self._ingest_marked_line(row, line, marks)
+			elif not self._shell_integration:
+				new_commands += self._ingest_prompt_line(row, line)
+		return new_commands
+
+	def _ingest_prompt_line(self, row: int, line: str) -> int:
+		"""
+		Detect a command on a line by prompt pattern (fallback without marks).
+
+		The built-in prompt rules are tried first, then the prompt learned
+		for the current profile, if any.
+
+		Args:
+			row: 0-based buffer row
+			line: ANSI-stripped line text
+
+		Returns:
+			1 if a command was stored, else 0
+		"""
+		line = line.strip()
+		command_text = _match_prompt_command(line)
+		if command_text is None:
+			learned = self._learned_prompts.get(self._prompt_scope)
+			match = learned.match(line) if learned is not None else None
+			command_text = match.group(1).strip() if match else None
+
+		# Ignore non-prompts, very short commands and repeats
+		# of the last command
+		if (
+			not command_text
+			or len(command_text) < 2
+			or (self._history and self._history[-1][1] == command_text)
+		):
+			return 0
+		self._history.append(row, command_text)
+		return 1
+
+	def set_prompt_scope(self, scope: str) -> None:
+		"""
+		Select which learned prompt pattern applies (one per profile).
+
+		Args:
+			scope: Profile or application name
+		"""
+		scope = scope or "default"
+		if scope != self._prompt_scope:
+			previous = self._learned_prompts.get(self._prompt_scope)
+			self._prompt_scope = scope
+			if self._learned_prompts.get(scope) is not previous:
+				self._rescan()
+
+	def observe_prompt(self, prompt_text: str) -> bool:
+		"""
+		Learn from the bare prompt shown just before the user starts typing.
+
+		Prompts the built-in patterns already recognise are ignored.  Other
+		samples are kept (the last few per profile) and, once at least two
+		have been seen, turned into one anchored pattern that is tried
+		after the built-in patterns for this profile.  A single stray
+		sample, such as a REPL prompt, is not learned.  When the pattern
+		changes the last snapshot is rescanned.
+
+		Args:
+			prompt_text: Line text from the line start up to the caret
+
+		Returns:
+			True if the learned pattern changed
+		"""
+		sample = ANSIParser.stripANSI(prompt_text).rstrip()
+		if not sample.strip() or _match_prompt_command(f"{sample} x") is not None:
+			return False
 
-			# Update last scan position
-			self._last_scan_line = scan_end
+		samples = self._prompt_samples.setdefault(
+			self._prompt_scope, collections.deque(maxlen=self._PROMPT_SAMPLES)
+		)
+		samples.append(sample)
+		if len(samples) < 2:
+			return False
+		pattern = _learn_prompt_pattern(samples)
+		if pattern is None or pattern is self._learned_prompts.get(self._prompt_scope):
+			return False
+		self._learned_prompts[self._prompt_scope] = pattern
+		self._rescan()
+		return True
 
-			return new_commands
+	def _rescan(self) -> None:
+		"""
+		Rebuild the block index from the last snapshot for a changed prompt pattern.
 
+		The rebuilt index replaces the current one only once it is complete,
+		so blocks found by the built-in patterns are kept throughout.
+		"""
+		lines = self._lines
+		if self._shell_integration or not lines:
+			return
+		history = self._history
+		self._history = CommandBlockIndex(self._max_history)
+		try:
+			complete = self._complete_rows(lines)
+			self._scan_rows(lines, 0, complete)
+			if complete > 0:
+				self._history.extend_last_output(complete - 1)
 		except Exception:
+			self._history = history
+			return
+		self._current_index = -1
+
+	def _ingest_marked_line(self, row: int, line: str, marks: list[tuple[str, int]]) -> int:
+		"""
+		Build blocks from OSC 133 marks on one line.
+
+		``A`` (prompt start) and ``D`` (command finished) close the previous
+		block's output, ``B`` (command start) begins a block whose command
+		is the text after the mark, and ``C`` (output start) sets where its
+		output begins.
+
+		Args:
+			row: 0-based buffer row
+			line: ANSI-stripped line text
+			marks: (kind, offset in *line*) pairs from stripANSIWithMarks
+
+		Returns:
+			Number of commands stored
+		"""
+		stored = 0
+		for i, (kind, offset) in enumerate(marks):
+			if kind in 'AD':
+				self._history.close_last_output(row - 1 if offset == 0 else row)
+			elif kind == 'B':
+				# The command runs to the next mark on this line, if any
+				end = marks[i + 1][1] if i + 1 < len(marks) else len(line)
+				command_text = line[offset:end].strip()
+				if command_text:
+					self._history.append(row, command_text)
+					stored += 1
+			elif kind == 'C' and self._history:
+				self._history.set_last_output_start(row + 1 if offset >= len(line) else row)
+		return stored
+
+	def _locate_scan_start(self, lines: list[str], complete: int) -> int:
+		"""
+		Find the first row not yet scanned, re-anchoring after scroll or clear.
+
+		Args:
+			lines: Buffer lines
+			complete: Number of complete (scannable) lines
+
+		Returns:
+			Row to start scanning from
+		"""
+		if self._scan_anchor is None:
 			return 0
 
+		row, anchor = self._scan_anchor
+		# Common case: nothing rolled off the top, anchor is where we left it
+		if row < complete and _context_hash(lines, row, self._ANCHOR_LINES) == anchor:
+			return row + 1
+
+		# Rollover moves content up, so search upward from the old row
+		for candidate in range(min(row, complete) - 1, -1, -1):
+			if _context_hash(lines, candidate, self._ANCHOR_LINES) == anchor:
+				self._shift_rows(row - candidate)
+				return candidate + 1
+
+		# Anchor gone: the buffer was cleared (or scrolled past it entirely)
+		self._history.clear()
+		self._current_index = -1
+		return 0
+
+	def _shift_rows(self, offset: int) -> None:
+		"""
+		Move stored command rows up after lines rolled off the buffer top.
+
+		Commands whose rows scrolled away are dropped.
+
+		Args:
+			offset: Number of lines removed from the top
+		"""
+		self._history.shift(offset)
+		self._current_index = -1
+
 	def navigate_history(self, direction: int) -> bool:
 		"""
 		Navigate through command history.
@@ -4270,21 +7325,118 @@ class CommandHistoryManager:
 		if index < 0 or index >= len(self._history):
 			return False
 
-		try:
-			line_num, command_text, bookmark = self._history[index]
+		prompt_row, command_text, _start, _end = self._history[index]
+		if not self._jump_to_row(prompt_row):
+			return False
 
-			# Move to the bookmark
-			info = self._terminal.makeTextInfo(bookmark)
-			api.setReviewPosition(info)
+		# Announce the command
+		ui.message(f"Command {index + 1} of {len(self._history)}: {command_text}")
+		return True
+
+	def _jump_to_row(self, row: int) -> bool:
+		"""
+		Move the review cursor to a buffer row.
 
-			# Announce the command
-			ui.message(f"Command {index + 1} of {len(self._history)}: {command_text}")
+		Rows are kept current across scrolling, so a row resolves with a
+		single move from the start of the buffer.
 
-			return True
+		Args:
+			row: 0-based buffer row
 
+		Returns:
+			True if jump successful, False otherwise
+		"""
+		try:
+			info = self._terminal.makeTextInfo(textInfos.POSITION_FIRST)
+			if row > 0:
+				info.move(textInfos.UNIT_LINE, row)
+			api.setReviewPosition(info)
+			return True
 		except Exception:
 			return False
 
+	def _resolve_block_index(self, index: int | None) -> int:
+		"""
+		Pick the block an output operation applies to.
+
+		Args:
+			index: 0-based block index, or None for the command being
+				navigated (or the newest command when not navigating)
+
+		Returns:
+			0-based block index, or -1 if there is none
+		"""
+		if index is None:
+			index = self._current_index if self._current_index >= 0 else len(self._history) - 1
+		return index if 0 <= index < len(self._history) else -1
+
+	def get_block(self, index: int | None = None) -> tuple[int, str, int, int] | None:
+		"""
+		Get a command block.
+
+		Args:
+			index: 0-based block index (default: current or newest command)
+
+		Returns:
+			(prompt_row, command_text, output_start, output_end) or None
+		"""
+		index = self._resolve_block_index(index)
+		return self._history[index] if index >= 0 else None
+
+	def get_line_text(self, row: int) -> str:
+		"""
+		Get the ANSI-stripped text of a row from the latest snapshot.
+
+		Args:
+			row: 0-based buffer row
+
+		Returns:
+			Line text, or empty string if the row is outside the snapshot
+		"""
+		if 0 <= row < len(self._lines):
+			return ANSIParser._STRIP_PATTERN.sub('', self._lines[row])
+		return ""
+
+	def get_output_text(self, index: int | None = None) -> str | None:
+		"""
+		Get the output of a command from the latest snapshot.
+
+		Args:
+			index: 0-based block index (default: current or newest command)
+
+		Returns:
+			Output text ("" if the command produced no output), or None if
+			there is no such command
+		"""
+		block = self.get_block(index)
+		if block is None:
+			return None
+		_prompt_row, _command, start, end = block
+		if end < start:
+			return ""
+		text = '\n'.join(self._lines[start:end + 1])
+		return ANSIParser._STRIP_PATTERN.sub('', text).strip('\n')
+
+	def jump_to_output(self, at_end: bool = False, index: int | None = None) -> int:
+		"""
+		Move the review cursor to the first or last output row of a command.
+
+		Args:
+			at_end: Jump to the last output row instead of the first
+			index: 0-based block index (default: current or newest command)
+
+		Returns:
+			Row jumped to, or -1 if the command has no output or the jump failed
+		"""
+		block = self.get_block(index)
+		if block is None:
+			return -1
+		_prompt_row, _command, start, end = block
+		if end < start:
+			return -1
+		row = end if at_end else start
+		return row if self._jump_to_row(row) else -1
+
 	def jump_to_command(self, index: int) -> bool:
 		"""
 		Jump directly to a command by index (1-based).
@@ -4325,7 +7477,10 @@ class CommandHistoryManager:
 		"""Clear all command history."""
 		self._history.clear()
 		self._current_index = -1
-		self._last_scan_line = 0
+		self._scan_anchor = None
+		self._last_text_len = -1
+		self._last_text_tail = ""
+		self._shell_integration = False
 
 	def get_history_count(self) -> int:
 		"""Get number of commands in history."""
@@ -4342,8 +7497,37 @@ class CommandHistoryManager:
 			terminal_obj: New terminal TextInfo object
 		"""
 		self._terminal = terminal_obj
-		# Clear history when terminal changes
-		self.clear_history()
+		if self._get_current_tab_id():
+			# Keep each tab's history across focus switches
+			self._switch_tab_state()
+		else:
+			# Clear history when terminal changes
+			self.clear_history()
+
+	def _get_current_tab_id(self) -> str:
+		"""Get current tab ID, or None if no tab manager."""
+		if self._tab_manager:
+			return self._tab_manager.get_current_tab_id()
+		return None
+
+	def _switch_tab_state(self) -> None:
+		"""Park the current history in its tab's container and restore the focused tab's."""
+		tab_id = self._get_current_tab_id()
+		if tab_id == self._state_tab_id:
+			return
+		previous = self._tab_manager.get_tab_state(self._state_tab_id, create=False) if self._state_tab_id else None
+		if previous is not None:
+			previous.history = {name: getattr(self, name) for name in self._TAB_STATE_FIELDS}
+		state = self._tab_manager.get_tab_state(tab_id)
+		if state is not None and state.history is not None:
+			for name, value in state.history.items():
+				setattr(self, name, value)
+		else:
+			# The parked block index must not be cleared in place
+			self._history = CommandBlockIndex(self._max_history)
+			self._lines = []
+			self.clear_history()
+		self._state_tab_id = tab_id
 
 	def set_tab_manager(self, tab_manager):
 		"""
@@ -4353,6 +7537,169 @@ class CommandHistoryManager:
 			tab_manager: TabManager instance
 		"""
 		self._tab_manager = tab_manager
+		self._state_tab_id = self._get_current_tab_id()
+
+
+class FocusContext:
+	"""
+	Facts about the focused object, computed once per focus change.
+
+	Scripts and event handlers read the terminal object, app name, terminal
+	flag, tab id, active profile and settings from here instead of
+	re-resolving the foreground object and app name on every gesture.
+
+	Attributes:
+		terminal: Bound terminal object, or None when not in a terminal
+		app_name: Lowercased app name of the focused object
+		is_terminal: Whether focus is in a supported terminal; None until
+			the first focus event, meaning callers must resolve it themselves
+		tab_id: Current tab id from the TabManager, if any
+		profile: Active ApplicationProfile, if any
+		settings: EffectiveSettings in effect for this focus (see _getSettings)
+	"""
+
+	__slots__ = ('terminal', 'app_name', 'is_terminal', 'tab_id', 'profile', 'settings')
+
+	def __init__(self, terminal=None, app_name: str = "", is_terminal: bool | None = None,
+			tab_id: str | None = None, profile=None, settings=None):
+		self.terminal = terminal
+		self.app_name = app_name
+		self.is_terminal = is_terminal
+		self.tab_id = tab_id
+		self.profile = profile
+		self.settings = settings
+
+
+class TerminalEventBus:
+	"""
+	Internal publish/subscribe hub for terminal events.
+
+	Features subscribe to caret, typed-character and content-change events
+	with an activity predicate and a flag saying whether they need the
+	buffer text.  A caret event fetches the buffer at most once, and only
+	when an active subscriber of the caret or content-change event needs it;
+	content-change subscribers are then notified if the snapshot shows a
+	change.  A subscriber can also take snapshots only when another one
+	causes the fetch.  With nothing enabled that needs text, caret handling
+	makes no UIA text fetch at all.
+
+	Example usage:
+		>>> bus = TerminalEventBus(observer=generation.observe)
+		>>> bus.subscribe(TerminalEventBus.EVENT_CARET, announcer_feed,
+		...     needs_snapshot=True, is_active=lambda: announce_enabled)
+		>>> bus.publish(TerminalEventBus.EVENT_CARET, terminal_obj)
+	"""
+
+	EVENT_CARET = "caret"
+	EVENT_TYPED_CHARACTER = "typedCharacter"
+	EVENT_CONTENT_CHANGED = "contentChanged"
+
+	# Events at which a snapshot may be taken for content-change subscribers
+	SNAPSHOT_EVENTS = (EVENT_CARET,)
+
+	def __init__(self, observer=None):
+		"""
+		Initialize the bus.
+
+		Args:
+			observer: Optional callable(text) run on every snapshot, returning
+				the first changed row or None (for example ContentGeneration.observe)
+		"""
+		self._observer = observer
+		# event -> list of (callback, needs_snapshot, is_active, shares_snapshot)
+		self._subscribers: dict[str, list[tuple]] = {}
+
+	def subscribe(
+		self, event: str, callback, needs_snapshot: bool = False, is_active=None, shares_snapshot: bool = False
+	) -> None:
+		"""
+		Subscribe to an event.
+
+		Callbacks are called as ``callback(obj, text, **details)``; *text* is
+		the buffer snapshot, or None unless the subscriber needs one.
+
+		Args:
+			event: One of the EVENT_* names
+			callback: Function to call
+			needs_snapshot: Whether the callback needs the buffer text
+			is_active: Optional predicate; inactive subscribers are skipped
+				and do not cause buffer fetches
+			shares_snapshot: Run with the buffer text only when another
+				subscriber's need caused a fetch; never causes one itself
+		"""
+		self._subscribers.setdefault(event, []).append((callback, needs_snapshot, is_active, shares_snapshot))
+
+	def unsubscribe(self, event: str, callback) -> bool:
+		"""
+		Remove a subscription.
+
+		Args:
+			event: Event name
+			callback: Function passed to subscribe()
+
+		Returns:
+			bool: True if a subscription was removed
+		"""
+		subscribers = self._subscribers.get(event, [])
+		for i, subscription in enumerate(subscribers):
+			if subscription[0] == callback:
+				del subscribers[i]
+				return True
+		return False
+
+	def _active(self, event: str) -> list[tuple]:
+		"""Get the subscriptions for *event* whose predicate allows them to run."""
+		active = []
+		for subscription in self._subscribers.get(event, ()):
+			is_active = subscription[2]
+			try:
+				if is_active is None or is_active():
+					active.append(subscription)
+			except Exception:
+				pass
+		return active
+
+	@staticmethod
+	def _deliver(subscriptions: list[tuple], obj, text: str | None, details: dict) -> None:
+		"""Call each subscription, isolating failures."""
+		for callback, needs_snapshot, _, shares_snapshot in subscriptions:
+			wants_text = needs_snapshot or shares_snapshot
+			if wants_text and text is None:
+				continue
+			try:
+				callback(obj, text if wants_text else None, **details)
+			except Exception:
+				import logHandler
+				logHandler.log.debugWarning("Terminal Access: event subscriber failed", exc_info=True)
+
+	def publish(self, event: str, obj, **details) -> str | None:
+		"""
+		Deliver an event to its active subscribers.
+
+		Args:
+			event: One of the EVENT_* names
+			obj: Terminal object the event is for
+			**details: Event-specific keyword arguments (for example ``ch``)
+
+		Returns:
+			The buffer snapshot if one was fetched, else None
+		"""
+		subscribers = self._active(event)
+		watchers = self._active(self.EVENT_CONTENT_CHANGED) if event in self.SNAPSHOT_EVENTS else []
+		text = None
+		if any(subscription[1] for subscription in subscribers) or any(subscription[1] for subscription in watchers):
+			try:
+				text = obj.makeTextInfo(textInfos.POSITION_ALL).text
+			except Exception:
+				text = None
+
+		first_row = None
+		if text is not None and self._observer is not None:
+			first_row = self._observer(text)
+		self._deliver(subscribers, obj, text, details)
+		if first_row is not None:
+			self._deliver(watchers, obj, text, {'first_row': first_row})
+		return text
 
 
 class GlobalPlugin(globalPluginHandler.GlobalPlugin):
@@ -4447,21 +7794,30 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		# Initialize manager classes for configuration, windows, and position tracking
 		self._configManager = ConfigManager()
 		self._windowManager = WindowManager(self._configManager)
-		self._positionCalculator = PositionCalculator()
+		# Single authority for content changes, shared by every cache
+		self._generation = ContentGeneration()
+		self._positionCalculator = PositionCalculator(self._generation)
 
 		# Initialize state variables
 		self.lastTerminalAppName = None
 		self.announcedHelp = False
 		self.copyMode = False
-		self._boundTerminal = None
+		# Focus context (terminal, app, tab, profile), rebuilt on focus change
+		self._focusContext = FocusContext()
 		self._cursorTrackingTimer = None
 		self._lastCaretPosition = None
+		# ((windowHandle, width, height), (rows, columns)) of the last sized terminal
+		self._terminalDimensions = None
 		self._lastTypedChar = None
 		self._repeatedCharCount = 0
 
-		# Content generation counter — incremented whenever terminal content changes.
+		# Content generation counter — mirrors self._generation, which advances
+		# whenever typing or any buffer snapshot shows a change.
 		# Used to invalidate per-line TextInfo caches in _announceStandardCursor.
 		self._contentGeneration: int = 0
+		# True until the first character of a command is typed; the bare
+		# prompt is sampled then for prompt learning
+		self._awaitingPromptSample: bool = True
 
 		# Line-level TextInfo cache for _announceStandardCursor.
 		# Stores the text of the last line visited so that moving within the
@@ -4476,11 +7832,6 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		# 30-entry substring scan runs only once per unique application name.
 		self._terminalAppCache: dict[str, bool] = {}
 
-		# Cached punctuation set — avoids dict lookup on every typed character.
-		# Invalidated when the punctuation level changes.
-		self._cachedPunctLevel: int = -1
-		self._cachedPunctSet: set | None = None
-
 		# Highlight tracking state
 		self._lastHighlightedText = None
 		self._lastHighlightPosition = None
@@ -4496,14 +7847,40 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		self._operationQueue = OperationQueue()
 
 		# Application profile management
-		self._profileManager = ProfileManager()
-		self._currentProfile = None
+		self._profileManager = ProfileManager(store=ProfileStore.forConfigDirectory())
+		# Global settings merged with the active profile's overrides
+		self._settingsResolver = SettingsResolver()
+		# Pane layout inference for profiles with autoPanes
+		self._paneAnalyzer = PaneLayoutAnalyzer()
+		# Column layouts of tabular output, cached per block
+		self._tableDetector = TableDetector()
+		# Rows around the review cursor for line navigation
+		self._lineCache = LineReadAheadCache(self._generation)
+		# Terminal-aware word boundaries, cached per line
+		self._wordSegmenter = WordSegmenter()
+		# Last buffer snapshot and the content generation it was read at
+		self._screenGrid: ScreenGrid | None = None
+		self._screenGridGeneration: int | None = None
+		self._screenGridTime: float = 0.0
+		# (bookmark, row, display column, generation, time) left by the last navigation
+		self._reviewMemo: tuple | None = None
+		self._lastPane = None
+		try:
+			config.post_configProfileSwitch.register(SettingsResolver.invalidate)
+		except AttributeError:
+			pass
 
 		# Window monitor for multi-window monitoring (Section 6.1 - v1.0.28+)
 		self._windowMonitor = None  # Initialized when terminal is bound
 
 		# New output announcer for automatically speaking appended terminal output
 		self._newOutputAnnouncer = NewOutputAnnouncer()
+		self._newOutputAnnouncer.generation = self._generation
+
+		# Event bus: features subscribe to caret, typed-character and
+		# content-change events; the buffer is fetched only when needed
+		self._eventBus = TerminalEventBus(observer=self._observeSnapshot)
+		self._subscribeFeatures()
 
 		# Start polling if feature is enabled from previous session
 		try:
@@ -4520,6 +7897,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
 		# Output search manager for filtering and search (Section 8.2 - v1.0.30+)
 		self._searchManager = None  # Initialized when terminal is bound
+		self._incrementalSearchTimer = None  # Debounce timer for search-as-you-type
 
 		# Command history manager for navigation (Section 8.1 - v1.0.31+)
 		self._commandHistoryManager = None  # Initialized when terminal is bound
@@ -4610,12 +7988,60 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		if self._windowMonitor and self._windowMonitor.is_monitoring():
 			self._windowMonitor.stop_monitoring()
 
+		try:
+			config.post_configProfileSwitch.unregister(SettingsResolver.invalidate)
+		except AttributeError:
+			pass
+
 		try:
 			gui.settingsDialogs.NVDASettingsDialog.categoryClasses.remove(TerminalAccessSettingsPanel)
 		except (ValueError, AttributeError):
 			pass
 		super().terminate()
 	
+	def _getFocusContext(self) -> FocusContext:
+		"""Get the focus context, creating an empty one if needed."""
+		context = self.__dict__.get('_focusContext')
+		if context is None:
+			context = self._focusContext = FocusContext()
+		return context
+
+	@property
+	def _boundTerminal(self):
+		"""Terminal object bound at the last focus change (from the focus context)."""
+		return self._getFocusContext().terminal
+
+	@_boundTerminal.setter
+	def _boundTerminal(self, terminal):
+		self._getFocusContext().terminal = terminal
+
+	@property
+	def _currentProfile(self):
+		"""Active application profile (from the focus context)."""
+		return self._getFocusContext().profile
+
+	@_currentProfile.setter
+	def _currentProfile(self, profile):
+		self._getFocusContext().profile = profile
+
+	def _getSettings(self) -> EffectiveSettings:
+		"""
+		Get the settings in effect: global config with profile overrides.
+
+		The merged object is cached and only rebuilt when the profile changes
+		or a configuration change was signalled.
+
+		Returns:
+			EffectiveSettings: Immutable resolved settings
+		"""
+		resolver = self.__dict__.get('_settingsResolver')
+		if resolver is None:
+			resolver = self._settingsResolver = SettingsResolver()
+		context = self._getFocusContext()
+		settings = resolver.resolve(context.profile)
+		context.settings = settings
+		return settings
+
 	def isTerminalApp(self, obj=None):
 		"""
 		Check if the current application is a supported terminal.
@@ -4629,13 +8055,20 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		runs once per unique application.  The cache is a plain dict keyed
 		by the lowercased appName string.
 
+		Without an object the answer comes from the focus context built at
+		the last focus change, so scripts pay no foreground lookup.
+
 		Args:
-			obj: The object to check. If None, uses the foreground object.
+			obj: The object to check. If None, uses the focus context, or the
+				foreground object before the first focus event.
 
 		Returns:
 			bool: True if in a supported terminal application.
 		"""
 		if obj is None:
+			isTerminal = self._getFocusContext().is_terminal
+			if isTerminal is not None:
+				return isTerminal
 			obj = api.getForegroundObject()
 
 		if not obj or not obj.appModule:
@@ -4737,18 +8170,18 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		"""
 		nextHandler()
 
+		try:
+			appName = obj.appModule.appName
+		except (AttributeError, TypeError):
+			appName = ""
+
 		if not self._updateGestureBindingsForFocus(obj):
-			self._boundTerminal = None
+			self._focusContext = FocusContext(app_name=str(appName).lower(), is_terminal=False)
 			return
 
 		if self.isTerminalApp(obj):
-			try:
-				appName = obj.appModule.appName
-			except (AttributeError, TypeError):
-				return
-
 			# Store the terminal object and route the review cursor to it via the navigator
-			self._boundTerminal = obj
+			self._focusContext = FocusContext(obj, appName.lower(), True)
 			api.setNavigatorObject(obj)
 
 			# Initialize TabManager for this terminal (Section 9 - v1.0.39+)
@@ -4767,7 +8200,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
 			# Initialize OutputSearchManager for this terminal (Section 8.2 - v1.0.30+)
 			if not self._searchManager:
-				self._searchManager = OutputSearchManager(obj, self._tabManager)
+				self._searchManager = OutputSearchManager(obj, self._tabManager, self._generation)
 			else:
 				# Update terminal reference when terminal is rebound
 				self._searchManager.update_terminal(obj)
@@ -4779,26 +8212,34 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 				# Update terminal reference when terminal is rebound
 				self._commandHistoryManager.update_terminal(obj)
 
-			# Clear position cache when switching terminals
-			self._positionCalculator.clear_cache()
+			self._focusContext.tab_id = self._tabManager.get_current_tab_id()
+
+			# Cached rows and positions belong to the previous terminal or tab
+			self._invalidateTerminalCaches()
 
 			# Detect and activate application profile
 			detectedApp = self._profileManager.detectApplication(obj)
+			# Learned prompts are kept per profile
+			self._commandHistoryManager.set_prompt_scope(
+				detectedApp if detectedApp != 'default' else appName
+			)
 			if detectedApp != 'default':
 				profile = self._profileManager.getProfile(detectedApp)
+				self._currentProfile = profile
 				if profile:
-					self._currentProfile = profile
 					import logHandler
 					logHandler.log.info(f"Terminal Access: Activated profile for {profile.displayName}")
 			else:
 				# No app-specific profile detected, check for default profile setting
 				defaultProfileName = config.conf["terminalAccess"].get("defaultProfile", "")
-				if defaultProfileName and defaultProfileName in self._profileManager.profiles:
-					self._currentProfile = self._profileManager.getProfile(defaultProfileName)
+				# A stored profile can fail to load, so getProfile may return None
+				profile = self._profileManager.getProfile(defaultProfileName) if defaultProfileName else None
+				self._currentProfile = profile
+				if profile:
 					import logHandler
-					logHandler.log.info(f"Terminal Access: Using default profile {self._currentProfile.displayName}")
-				else:
-					self._currentProfile = None
+					logHandler.log.info(f"Terminal Access: Using default profile {profile.displayName}")
+
+			self._getSettings()
 
 			# Bind review cursor to the terminal; try caret first, fall back to last position
 			try:
@@ -4818,6 +8259,25 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 				# Translators: Message announced when entering a terminal application
 				ui.message(_("Terminal Access support active. Press NVDA+shift+f1 for help."))
 
+	def event_nameChange(self, obj, nextHandler):
+		"""
+		Handle name change events.
+
+		A title change in the bound terminal's window re-validates the
+		cached tab identity and title.
+		"""
+		nextHandler()
+		tabManager = getattr(self, '_tabManager', None)
+		terminal = getattr(self, '_boundTerminal', None)
+		if not tabManager or terminal is None:
+			return
+		try:
+			if obj is terminal or obj.windowHandle == terminal.windowHandle:
+				tabManager.on_name_change(terminal)
+				self._focusContext.tab_id = tabManager.get_current_tab_id()
+		except Exception:
+			pass
+
 	def _isKeyEchoActive(self) -> bool:
 		"""Check if the addon should perform its own key echo.
 
@@ -4825,9 +8285,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		or NVDA's native speak-typed-characters setting is already enabled
 		(to avoid duplicate announcements).
 		"""
-		if not config.conf["terminalAccess"]["keyEcho"]:
-			return False
-		if config.conf["terminalAccess"]["quietMode"]:
+		settings = self._getSettings()
+		if not settings.keyEcho or settings.quietMode:
 			return False
 		# When NVDA's own character echo is on, let NVDA handle it
 		# to avoid speaking every character twice.
@@ -4852,21 +8311,23 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		if not self.isTerminalApp(obj):
 			return
 
+		eventBus = getattr(self, '_eventBus', None)
+		if eventBus is not None:
+			eventBus.publish(TerminalEventBus.EVENT_TYPED_CHARACTER, obj, ch=ch)
+
 		# Don't echo if disabled, quiet, or NVDA is already echoing
 		if not self._isKeyEchoActive():
 			return
 
-		# Clear position cache on content change
-		self._positionCalculator.clear_cache()
-
-		# Increment content generation so cached line TextInfo is invalidated.
-		self._contentGeneration += 1
+		# Typing changes content; invalidate cached positions and line text.
+		self._advanceContentGeneration()
 
 		# Process the character for speech
 		if ch:
 			# Check if we should condense repeated symbols
-			if config.conf["terminalAccess"]["repeatedSymbols"]:
-				repeatedSymbolsValues = config.conf["terminalAccess"]["repeatedSymbolsValues"]
+			settings = self._getSettings()
+			if settings.repeatedSymbols:
+				repeatedSymbolsValues = settings.repeatedSymbolsValues
 
 				# Check if this character is in the list of symbols to condense
 				if ch in repeatedSymbolsValues:
@@ -4903,6 +8364,34 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			else:
 				ui.message(charToSpeak)
 
+	def _samplePromptOnTyping(self, obj, ch) -> None:
+		"""
+		Feed the bare prompt to command history when a command's first key is typed.
+
+		The text from the start of the caret line up to the caret is the
+		prompt exactly, since nothing has been typed yet.  One sample per
+		command lets custom prompts be learned.
+
+		Args:
+			obj: Terminal object that received the character
+			ch: Typed character
+		"""
+		if ch in ('\r', '\n'):
+			self._awaitingPromptSample = True
+			return
+		manager = getattr(self, '_commandHistoryManager', None)
+		if not ch or not getattr(self, '_awaitingPromptSample', True) or manager is None:
+			return
+		self._awaitingPromptSample = False
+		try:
+			caret = obj.makeTextInfo(textInfos.POSITION_CARET)
+			lineInfo = caret.copy()
+			lineInfo.expand(textInfos.UNIT_LINE)
+			lineInfo.setEndPoint(caret, "endToStart")
+			manager.observe_prompt(lineInfo.text)
+		except Exception:
+			pass
+
 	def _brailleMessage(self, text):
 		"""Show text on the Braille display.
 
@@ -4957,46 +8446,126 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		"""
 		nextHandler()
 
-		# Feed terminal content to the new output announcer when enabled.
-		# This is done before the quiet/cursorTracking guards so that the
-		# announcer's own quiet-mode check governs output independently.
 		if not self.isTerminalApp(obj):
 			return
 
-		self._feedNewOutputAnnouncer(obj)
+		# Subscribed features (new output, cursor tracking, panes) run from
+		# the bus; the buffer is fetched once if any of them needs it, and
+		# that snapshot advances the content generation from the first row
+		# that actually changed.  Command history only shares such
+		# snapshots and otherwise scans when the user navigates it.
+		self._eventBus.publish(TerminalEventBus.EVENT_CARET, obj)
+
+	def _subscribeFeatures(self) -> None:
+		"""Register the built-in features on the event bus."""
+		bus = self._eventBus
+		bus.subscribe(bus.EVENT_CARET, self._onCaretUpdateAnnouncerTerminal)
+		bus.subscribe(
+			bus.EVENT_CARET, self._onCaretNewOutput,
+			needs_snapshot=True, is_active=self._isNewOutputActive,
+		)
+		bus.subscribe(bus.EVENT_CARET, self._onCaretCursorTracking, is_active=self._isCursorTrackingActive)
+		bus.subscribe(
+			bus.EVENT_CONTENT_CHANGED, self._onContentChangedHistory,
+			is_active=self._isHistoryScanActive, shares_snapshot=True,
+		)
+		bus.subscribe(
+			bus.EVENT_CONTENT_CHANGED, self._onContentChangedPanes,
+			needs_snapshot=True, is_active=self._isPaneDetectionActive,
+		)
+		bus.subscribe(
+			bus.EVENT_TYPED_CHARACTER,
+			lambda obj, text, ch: self._samplePromptOnTyping(obj, ch),
+		)
 
-		# Only handle if cursor tracking is enabled
-		ta_conf = config.conf["terminalAccess"]
-		if not ta_conf["cursorTracking"] or ta_conf["quietMode"]:
-			return
+	def _observeSnapshot(self, text: str) -> int | None:
+		"""
+		Advance the content generation from a bus snapshot.
+
+		Args:
+			text: Full terminal buffer text
 
+		Returns:
+			First changed row, or None if unchanged
+		"""
+		firstRow = self._generation.observe(text)
+		if firstRow is not None:
+			self._contentGeneration = self._generation.value
+		return firstRow
+
+	def _isNewOutputActive(self) -> bool:
+		"""Whether new output announcement wants caret snapshots."""
+		settings = self._getSettings()
+		return bool(settings.announceNewOutput) and not settings.quietMode
+
+	def _isCursorTrackingActive(self) -> bool:
+		"""Whether cursor tracking announcements are enabled."""
+		settings = self._getSettings()
+		return bool(settings.cursorTracking) and not settings.quietMode
+
+	def _isHistoryScanActive(self) -> bool:
+		"""Whether a command history is bound to ingest new output."""
+		return self._commandHistoryManager is not None
+
+	def _isPaneDetectionActive(self) -> bool:
+		"""Whether the active profile wants panes inferred for window tracking."""
+		profile = self._currentProfile
+		if profile is None or not profile.autoPanes:
+			return False
+		settings = self._getSettings()
+		return settings.cursorTrackingMode == CT_WINDOW and not settings.quietMode
+
+	def _onContentChangedPanes(self, obj, text, first_row=0) -> None:
+		"""Refresh the detected panes; cheap unless the borders changed."""
+		profile = self._currentProfile
+		if profile is not None:
+			profile.setTransientWindows(self._paneAnalyzer.analyze(text))
+
+	def _onCaretUpdateAnnouncerTerminal(self, obj, text) -> None:
+		"""Keep the announcer's polling target current."""
+		self._newOutputAnnouncer.set_terminal(obj)
+
+	def _onCaretNewOutput(self, obj, text) -> None:
+		"""Feed a caret snapshot to the new output announcer."""
+		self._newOutputAnnouncer.feed(text)
+
+	def _onContentChangedHistory(self, obj, text, first_row=0) -> None:
+		"""Let command history ingest newly appended lines from a shared snapshot."""
+		self._commandHistoryManager.ingest_text(text)
+
+	def _onCaretCursorTracking(self, obj, text) -> None:
+		"""Schedule a debounced cursor position announcement."""
 		# Cancel any pending cursor tracking announcement
 		if self._cursorTrackingTimer:
 			self._cursorTrackingTimer.Stop()
 			self._cursorTrackingTimer = None
 
 		# Schedule announcement with delay
-		self._cursorTrackingTimer = wx.CallLater(ta_conf["cursorDelay"], self._announceCursorPosition, obj)
+		delay = self._getSettings().cursorDelay
+		self._cursorTrackingTimer = wx.CallLater(delay, self._announceCursorPosition, obj)
 
-	def _feedNewOutputAnnouncer(self, obj) -> None:
-		"""
-		Read the current terminal buffer and feed it to the new output announcer.
-
-		Also updates the terminal object reference for polling.
+	def _invalidateTerminalCaches(self) -> None:
+		"""Drop every cache of terminal content, for a switch to another terminal or tab."""
+		self._advanceContentGeneration()
+		self._positionCalculator.clear_cache()
+		self._lineCache.clear()
+		self._screenGrid = None
+		self._screenGridGeneration = None
+		self._reviewMemo = None
 
-		This is a best-effort helper: any exception is silently ignored so it
-		never disrupts normal caret handling.
+	def _advanceContentGeneration(self, firstRow: int = 0) -> None:
+		"""
+		Record a content change not seen through a buffer snapshot.
 
 		Args:
-			obj: The focused terminal object.
+			firstRow: First 0-based row that may have changed
 		"""
-		try:
-			# Update terminal object for polling (in case it changed)
-			self._newOutputAnnouncer.set_terminal(obj)
-			info = obj.makeTextInfo(textInfos.POSITION_ALL)
-			self._newOutputAnnouncer.feed(info.text)
-		except Exception:
-			pass
+		generation = getattr(self, '_generation', None)
+		if generation is not None:
+			self._contentGeneration = generation.advance(firstRow)
+		else:
+			self._positionCalculator.clear_cache()
+			self._contentGeneration += 1
 
 	def _announceCursorPosition(self, obj):
 		"""
@@ -5006,7 +8575,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			obj: The terminal object.
 		"""
 		try:
-			trackingMode = config.conf["terminalAccess"]["cursorTrackingMode"]
+			trackingMode = self._getSettings().cursorTrackingMode
 			match trackingMode:
 				case 0:  # CT_OFF
 					return
@@ -5175,8 +8744,13 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			self._lastCaretPosition = currentPos
 
 			# First, check if we have an active profile with window definitions
-			if self._currentProfile and self._currentProfile.windows:
-				window = self._currentProfile.getWindowAtPosition(currentRow, currentCol)
+			profile = self._currentProfile
+			if profile and (profile.windows or profile.transientWindows):
+				dimensions = self._getTerminalDimensions(obj)
+				if dimensions:
+					profile.resolveWindows(*dimensions)
+				window = profile.getWindowAtPosition(currentRow, currentCol)
+				self._announcePaneChange(window, profile)
 				if window:
 					if window.mode == 'silent':
 						# Silent window - don't announce
@@ -5211,6 +8785,109 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			# On error, fall back to standard tracking
 			self._announceStandardCursor(obj)
 
+	def _announcePaneChange(self, window, profile) -> None:
+		"""
+		Speak the pane name when the cursor enters a different detected pane.
+
+		Args:
+			window: Window at the cursor, or None
+			profile: Active profile
+		"""
+		if window is getattr(self, '_lastPane', None):
+			return
+		self._lastPane = window
+		if window is not None and window in profile.transientWindows:
+			ui.message(window.name)
+
+	def _getScreenGrid(self, terminal, reuse: bool = False) -> ScreenGrid:
+		"""
+		Get a grid of the terminal's current buffer.
+
+		The grid is reused while the buffer text is unchanged, so column maps
+		built by earlier commands are kept.
+
+		Args:
+			terminal: Terminal object
+			reuse: Skip the buffer fetch while no caret or content event has
+				advanced the content generation since the grid was built,
+				for at most _SCREEN_GRID_TIMEOUT_S
+
+		Returns:
+			ScreenGrid: Grid of the current snapshot
+		"""
+		grid = self._screenGrid
+		generationValue = self._generation.value
+		now = time.time()
+		if (
+			reuse and grid is not None and self._screenGridGeneration == generationValue
+			and now - self._screenGridTime < _SCREEN_GRID_TIMEOUT_S
+		):
+			return grid
+		text = terminal.makeTextInfo(textInfos.POSITION_ALL).text
+		if grid is None or grid.text != text:
+			grid = self._screenGrid = ScreenGrid(text)
+		self._screenGridGeneration = generationValue
+		self._screenGridTime = now
+		return grid
+
+	def _getTerminalDimensions(self, obj) -> tuple[int, int] | None:
+		"""
+		Get the size of the visible screen in rows and columns, cached until a resize.
+
+		A resize is detected from the object's on-screen size; only then is
+		the screen read to count rows and measure the widest line.  The
+		scrollback is not counted, so windows relative to the last row stay
+		on the visible screen.
+
+		Args:
+			obj: The terminal object.
+
+		Returns:
+			(rows, columns), or None if the size cannot be determined
+		"""
+		try:
+			location = obj.location
+			key = (obj.windowHandle, location[2], location[3])
+		except Exception:
+			return None
+		cached = self.__dict__.get('_terminalDimensions')
+		if cached is not None and cached[0] == key:
+			return cached[1]
+		try:
+			text = self._getVisibleText(obj)
+		except Exception:
+			return None
+		lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+		if len(lines) > 1 and lines[-1] == '':
+			lines.pop()
+		dimensions = (len(lines), max(max(map(len, lines)), 1))
+		self._terminalDimensions = (key, dimensions)
+		return dimensions
+
+	@staticmethod
+	def _getVisibleText(obj) -> str:
+		"""
+		Get the text of the rows shown on screen.
+
+		UIA terminals expose the whole buffer including scrollback, so their
+		visible ranges are read; legacy consoles' text is the screen buffer window.
+
+		Args:
+			obj: The terminal object.
+
+		Returns:
+			str: Visible text, one line per row
+		"""
+		try:
+			ranges = obj.UIATextPattern.GetVisibleRanges()
+			count = ranges.length
+			if count > 0:
+				return ''.join(ranges.GetElement(i).GetText(-1) for i in range(count))
+		except Exception:
+			# Not a UIA text provider, or the visible ranges are unavailable
+			pass
+		return obj.makeTextInfo(textInfos.POSITION_ALL).text
+
 	def _extractHighlightedText(self, text):
 		"""
 		Extract highlighted text from a line containing ANSI codes.
@@ -5256,7 +8933,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			gesture.send()
 			return
 		# Read line with optional indentation
-		self._readLineWithIndentation(gesture, globalCommands.commands.script_review_previousLine)
+		self._readLineWithIndentation(gesture, globalCommands.commands.script_review_previousLine, -1)
 
 	@script(
 		# Translators: Description for reading the current line
@@ -5287,7 +8964,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			gesture.send()
 			return
 		# Read line with optional indentation
-		self._readLineWithIndentation(gesture, globalCommands.commands.script_review_nextLine)
+		self._readLineWithIndentation(gesture, globalCommands.commands.script_review_nextLine, 1)
 	
 	@script(
 		# Translators: Description for reading the previous word
@@ -5299,8 +8976,9 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		if not self.isTerminalApp():
 			gesture.send()
 			return
-		# Use NVDA's built-in review cursor functionality
-		globalCommands.commands.script_review_previousWord(gesture)
+		# Terminal-aware word stops, falling back to NVDA's review cursor command
+		if not self._readReviewWord(-1):
+			globalCommands.commands.script_review_previousWord(gesture)
 
 	@script(
 		# Translators: Description for reading the current word
@@ -5312,8 +8990,9 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		if not self.isTerminalApp():
 			gesture.send()
 			return
-		# Use NVDA's built-in review cursor functionality
-		globalCommands.commands.script_review_currentWord(gesture)
+		# Terminal-aware word stops, falling back to NVDA's review cursor command
+		if not self._readReviewWord(0):
+			globalCommands.commands.script_review_currentWord(gesture)
 
 	@script(
 		# Translators: Description for spelling the current word
@@ -5325,8 +9004,9 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		if not self.isTerminalApp():
 			gesture.send()
 			return
-		# Use NVDA's built-in review cursor functionality
-		globalCommands.commands.script_review_spellingCurrentWord(gesture)
+		# Terminal-aware word stops, falling back to NVDA's review cursor command
+		if not self._readReviewWord(0, spell=True):
+			globalCommands.commands.script_review_spellingCurrentWord(gesture)
 
 	@script(
 		# Translators: Description for reading the next word
@@ -5338,8 +9018,9 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		if not self.isTerminalApp():
 			gesture.send()
 			return
-		# Use NVDA's built-in review cursor functionality
-		globalCommands.commands.script_review_nextWord(gesture)
+		# Terminal-aware word stops, falling back to NVDA's review cursor command
+		if not self._readReviewWord(1):
+			globalCommands.commands.script_review_nextWord(gesture)
 	
 	@script(
 		# Translators: Description for reading the previous character
@@ -5403,6 +9084,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		
 		currentState = config.conf["terminalAccess"]["quietMode"]
 		config.conf["terminalAccess"]["quietMode"] = not currentState
+		SettingsResolver.invalidate()
 		
 		if config.conf["terminalAccess"]["quietMode"]:
 			# Translators: Message when quiet mode is enabled
@@ -5424,6 +9106,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
 		currentState = config.conf["terminalAccess"]["announceNewOutput"]
 		config.conf["terminalAccess"]["announceNewOutput"] = not currentState
+		SettingsResolver.invalidate()
 
 		if config.conf["terminalAccess"]["announceNewOutput"]:
 			# Reset the announcer so it doesn't speak stale buffered content
@@ -5456,6 +9139,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
 		currentState = config.conf["terminalAccess"]["indentationOnLineRead"]
 		config.conf["terminalAccess"]["indentationOnLineRead"] = not currentState
+		SettingsResolver.invalidate()
 
 		if config.conf["terminalAccess"]["indentationOnLineRead"]:
 			# Translators: Message when indentation announcement is enabled
@@ -5604,6 +9288,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
 		# Update configuration
 		config.conf["terminalAccess"]["cursorTrackingMode"] = nextMode
+		SettingsResolver.invalidate()
 
 		# Announce new mode
 		modeNames = {
@@ -5702,35 +9387,12 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 				ui.message(_("Window not properly defined"))
 				return
 
-			# Extract window content line by line
-			lines = []
-			currentInfo = terminal.makeTextInfo(textInfos.POSITION_FIRST)
-
-			# Move to window top
-			currentInfo.move(textInfos.UNIT_LINE, windowTop - 1)
-
-			# Extract each line in window
-			for row in range(windowTop, windowBottom + 1):
-				lineInfo = currentInfo.copy()
-				lineInfo.expand(textInfos.UNIT_LINE)
-				lineText = lineInfo.text.rstrip('\n\r')
-
-				# Extract column range (convert to 0-based indexing)
-				startIdx = max(0, windowLeft - 1)
-				endIdx = min(len(lineText), windowRight)
-
-				if startIdx < len(lineText):
-					columnText = lineText[startIdx:endIdx]
-				else:
-					columnText = ''  # Line too short
-
-				if columnText.strip():  # Only include non-empty lines
-					lines.append(columnText)
-
-				# Move to next line
-				moved = currentInfo.move(textInfos.UNIT_LINE, 1)
-				if moved == 0:
-					break
+			# Extract window content from the grid, skipping empty lines
+			grid = self._getScreenGrid(terminal)
+			lines = [
+				columnText for columnText in grid.rect(windowTop, windowLeft, windowBottom, windowRight)
+				if columnText.strip()
+			]
 
 			# Read window content
 			windowText = ' '.join(lines)
@@ -6022,8 +9684,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
 		# Get default profile name
 		defaultProfileName = config.conf["terminalAccess"].get("defaultProfile", "")
-		if defaultProfileName and defaultProfileName in self._profileManager.profiles:
-			defaultProfile = self._profileManager.getProfile(defaultProfileName)
+		defaultProfile = self._profileManager.getProfile(defaultProfileName) if defaultProfileName else None
+		if defaultProfile is not None:
 			defaultProfileDisplay = defaultProfile.displayName
 		else:
 			# Translators: Message when no default profile is set
@@ -6046,9 +9708,13 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 				return
 
 			# Get current line text
-			info = reviewPos.copy()
-			info.expand(textInfos.UNIT_LINE)
-			lineText = info.text
+			cached = self._readAheadLine(0)
+			if cached is not None:
+				lineText = cached[0]
+			else:
+				info = reviewPos.copy()
+				info.expand(textInfos.UNIT_LINE)
+				lineText = info.text
 
 			if not lineText:
 				# Translators: Message for empty line
@@ -6146,41 +9812,253 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			# Translators: Message for space indentation
 			return _("{count} space").format(count=spaces) if spaces == 1 else _("{count} spaces").format(count=spaces)
 
-	def _readLineWithIndentation(self, gesture, moveFunction):
+	def _readLineWithIndentation(self, gesture, moveFunction, delta: int = 0):
 		"""
 		Read a line and optionally announce indentation.
 
+		The read-ahead line cache locates the line and detects the buffer
+		edges, so a keypress costs one relative move of the review cursor;
+		the line itself is reported through NVDA's speech and braille as
+		its review commands do.  NVDA's own review command is used when the
+		review row cannot be located.
+
 		Args:
 			gesture: The gesture that triggered this command
 			moveFunction: The function to call to read the line (e.g., script_review_currentLine)
+			delta: -1 for the previous line, 0 for the current line, 1 for the next line
 		"""
-		# Check if indentation should be announced
-		shouldAnnounceIndentation = config.conf["terminalAccess"]["indentationOnLineRead"]
-
-		# Get line text before reading it aloud
-		if shouldAnnounceIndentation:
-			try:
-				reviewPos = self._getReviewPosition()
-				if reviewPos:
-					info = reviewPos.copy()
-					info.expand(textInfos.UNIT_LINE)
-					lineText = info.text
-					spaces, tabs = self._getIndentationInfo(lineText)
-					indentInfo = self._formatIndentation(spaces, tabs)
-				else:
-					indentInfo = ""
-			except Exception:
-				indentInfo = ""
+		located = self._readAheadLine(delta)
+		if located is None:
+			moveFunction(gesture)
+			lineText = None
 		else:
+			lineText, atEdge = located
+			if atEdge:
+				# Translators: Message when line navigation reaches the start or end of the buffer
+				ui.message(_("Top") if delta < 0 else _("Bottom"))
+			self._speakReviewLine()
+
+		# Announce the indentation of the line that was read, if enabled
+		if not config.conf["terminalAccess"]["indentationOnLineRead"]:
+			return
+		try:
+			if lineText is None:
+				info = self._getReviewPosition().copy()
+				info.expand(textInfos.UNIT_LINE)
+				lineText = info.text
+			indentInfo = self._formatIndentation(*self._getIndentationInfo(lineText))
+		except Exception:
 			indentInfo = ""
-
-		# Read the line using NVDA's built-in functionality
-		moveFunction(gesture)
-
-		# Announce indentation after line is read, if enabled
 		if indentInfo:
 			ui.message(indentInfo)
 
+	def _speakReviewLine(self) -> None:
+		"""
+		Report the review cursor's line as NVDA's review line commands do.
+
+		Speech honours NVDA's line formatting settings; braille follows the
+		review position set by api.setReviewPosition.
+		"""
+		import controlTypes
+		info = self._getReviewPosition().copy()
+		info.expand(textInfos.UNIT_LINE)
+		speech.speakTextInfo(info, unit=textInfos.UNIT_LINE, reason=controlTypes.OutputReason.CARET)
+
+	def _locateReviewLine(self, reviewInfo, delta: int = 0) -> tuple[int, int, LineReadAheadCache] | None:
+		"""
+		Find the review cursor's row and character index, with its line cached.
+
+		Args:
+			reviewInfo: Current review position
+			delta: Row offset that must also be cached, if it exists
+
+		Returns:
+			(row, index, cache) with a 1-based row and 0-based character index, or None
+		"""
+		recalled = self._recallReviewPosition(reviewInfo)
+		if recalled is not None:
+			row, column = recalled
+		else:
+			row, column = self._positionCalculator.calculate(reviewInfo, self._boundTerminal)
+		if row <= 0:
+			return None
+		cache = self._lineCache
+		if cache.get(row) is None or (cache.get(row + delta) is None and not cache.isBeyondBuffer(row + delta)):
+			cache.fill(reviewInfo, row)
+		line = cache.get(row)
+		if line is None:
+			return None
+		# The memo keeps display columns; the calculator reports character columns
+		index = UnicodeWidthHelper.findColumnPosition(line, column) if recalled is not None else column - 1
+		return row, index, cache
+
+	def _readAheadLine(self, delta: int) -> tuple[str, bool] | None:
+		"""
+		Move the review cursor by whole lines and get the new line's text.
+
+		Args:
+			delta: Lines to move (0 reads the current line)
+
+		Returns:
+			(text, atEdge) or None if the review row cannot be located;
+			atEdge is True when the move would leave the buffer, in which
+			case the review cursor stays and the current line is returned
+		"""
+		reviewInfo = self._getReviewPosition()
+		if self._boundTerminal is None or reviewInfo is None:
+			return None
+		try:
+			located = self._locateReviewLine(reviewInfo, delta)
+			if located is None:
+				return None
+			row, index, cache = located
+			current = cache.get(row)
+			if delta == 0:
+				self._rememberReviewPosition(reviewInfo, row, UnicodeWidthHelper.getTextWidth(current[:index]) + 1)
+				return current, False
+			text = cache.get(row + delta)
+			info = reviewInfo.copy()
+			info.expand(textInfos.UNIT_LINE)
+			info.collapse()
+			if text is None or info.move(textInfos.UNIT_LINE, delta) != delta:
+				return current, True
+			api.setReviewPosition(info)
+			self._rememberReviewPosition(info, row + delta, 1)
+			return text, False
+		except Exception as e:
+			import logHandler
+			logHandler.log.debug(f"Terminal Access: line read-ahead failed: {e}")
+			return None
+
+	def _readReviewWord(self, delta: int, spell: bool = False) -> bool:
+		"""
+		Move the review cursor by terminal-aware words and read the word.
+
+		Word boundaries come from the WordSegmenter cache and line text from
+		the read-ahead line cache, so a press costs the relative review cursor
+		moves only.  Moving past the last word of a line continues on the
+		next line with words, as NVDA's word review does, reading further
+		windows of rows when the blank lines run past the cached one.
+
+		Args:
+			delta: -1 for the previous word, 0 for the current word, 1 for the next word
+			spell: Spell the word instead of speaking it
+
+		Returns:
+			bool: False if the review position cannot be located
+		"""
+		reviewInfo = self._getReviewPosition()
+		if self._boundTerminal is None or reviewInfo is None:
+			return False
+		try:
+			located = self._locateReviewLine(reviewInfo)
+			if located is None:
+				return False
+			row, index, cache = located
+			segmenter = self._wordSegmenter
+			segmenter.setWordCharacters(self._getSettings().wordCharacters)
+			target = self._findWord(segmenter, cache, reviewInfo, row, index, delta)
+			if delta == 0:
+				self._rememberReviewPosition(reviewInfo, row, UnicodeWidthHelper.getTextWidth(cache.get(row)[:index]) + 1)
+			elif target is not None and not self._moveReviewToWord(reviewInfo, row, target[0], target[1], cache):
+				target = None
+		except Exception as e:
+			import logHandler
+			logHandler.log.debug(f"Terminal Access: word navigation failed: {e}")
+			return False
+		if target is None:
+			# Translators: Message when word navigation reaches the start or end of the text
+			ui.message(_("Top") if delta < 0 else _("Bottom"))
+			return True
+		targetRow, start, end = target
+		word = cache.get(targetRow)[start:end]
+		if not word:
+			# Translators: Message when the review cursor is on whitespace
+			ui.message(_("Blank"))
+		elif spell:
+			speech.speakSpelling(word)
+		else:
+			ui.message(word)
+		return True
+
+	@staticmethod
+	def _findWord(
+		segmenter: WordSegmenter, cache: LineReadAheadCache, reviewInfo, row: int, index: int, delta: int
+	) -> tuple[int, int, int] | None:
+		"""
+		Find the word a word navigation command goes to.
+
+		Args:
+			segmenter: Word segmenter
+			cache: Line cache holding the row; refilled when the search leaves it
+			reviewInfo: Current review position, on the row
+			row: Current row (1-based)
+			index: Current character index in the row
+			delta: -1 for the previous word, 0 for the current word, 1 for the next word
+
+		Returns:
+			(row, start, end) of the word, an empty span on whitespace for the
+			current word, or None past the first or last word in the buffer
+		"""
+		line = cache.get(row)
+		starts, ends = segmenter.segment(line)
+		word, inside = segmenter.wordIndex(line, index)
+		if delta == 0:
+			return (row, starts[word], ends[word]) if inside else (row, index, index)
+		# On whitespace the previous word is the one before the cursor
+		target = word + 1 if delta > 0 else (word - 1 if inside else word)
+		if 0 <= target < len(starts):
+			return row, starts[target], ends[target]
+		current = row
+		row += delta
+		while row > 0:
+			line = cache.get(row)
+			if line is None:
+				if cache.isBeyondBuffer(row):
+					return None
+				# The row is outside the read-ahead window: read the rows around it
+				info = reviewInfo.copy()
+				info.expand(textInfos.UNIT_LINE)
+				info.collapse()
+				if info.move(textInfos.UNIT_LINE, row - current) != row - current:
+					return None
+				cache.fill(info, row)
+				line = cache.get(row)
+				if line is None:
+					return None
+			starts, ends = segmenter.segment(line)
+			if starts:
+				target = 0 if delta > 0 else len(starts) - 1
+				return row, starts[target], ends[target]
+			row += delta
+		return None
+
+	def _moveReviewToWord(self, reviewInfo, row: int, targetRow: int, start: int, cache: LineReadAheadCache) -> bool:
+		"""
+		Move the review cursor to the start of a word with relative TextInfo moves.
+
+		Args:
+			reviewInfo: Current review position
+			row: Row of the current review position (1-based)
+			targetRow: Row of the word (1-based)
+			start: Character index where the word starts
+			cache: Line cache holding the target row
+
+		Returns:
+			bool: False if the target row could not be reached
+		"""
+		info = reviewInfo.copy()
+		info.expand(textInfos.UNIT_LINE)
+		info.collapse()
+		if targetRow != row and info.move(textInfos.UNIT_LINE, targetRow - row) != targetRow - row:
+			return False
+		if start > 0:
+			info.move(textInfos.UNIT_CHARACTER, start)
+		api.setReviewPosition(info)
+		line = cache.get(targetRow)
+		self._rememberReviewPosition(info, targetRow, UnicodeWidthHelper.getTextWidth(line[:start]) + 1)
+		return True
+
 	def _readReviewCharacter(self, movement=0, phonetic=False):
 		"""
 		Read a character at the review cursor position.
@@ -6305,8 +10183,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		"""
 		Determine if a symbol should be processed/announced based on current punctuation level.
 
-		Uses a cached punctuation set so the dict lookup only occurs when the
-		level actually changes (rare), rather than on every character.
+		The punctuation set for the effective level (profile override or
+		global) is precomputed in the resolved settings.
 
 		Args:
 			char: The character to check.
@@ -6314,19 +10192,10 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		Returns:
 			bool: True if the symbol should be announced, False otherwise.
 		"""
-		level = config.conf["terminalAccess"]["punctuationLevel"]
-
-		if level == PUNCT_ALL:
+		punctuationSet = self._getSettings().punctuationSet
+		if punctuationSet is None:
 			return True
-		if level == PUNCT_NONE:
-			return False
-
-		# Refresh cached set only when the level has changed.
-		if level != self._cachedPunctLevel:
-			self._cachedPunctLevel = level
-			self._cachedPunctSet = PUNCTUATION_SETS.get(level, set())
-
-		return char in self._cachedPunctSet
+		return char in punctuationSet
 
 	def _processSymbol(self, char):
 		"""
@@ -6351,6 +10220,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		currentLevel = config.conf["terminalAccess"]["punctuationLevel"]
 		newLevel = (currentLevel - 1) % 4
 		config.conf["terminalAccess"]["punctuationLevel"] = newLevel
+		SettingsResolver.invalidate()
 
 		# Announce new level
 		levelNames = {
@@ -6375,6 +10245,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		currentLevel = config.conf["terminalAccess"]["punctuationLevel"]
 		newLevel = (currentLevel + 1) % 4
 		config.conf["terminalAccess"]["punctuationLevel"] = newLevel
+		SettingsResolver.invalidate()
 
 		# Announce new level
 		levelNames = {
@@ -6741,15 +10612,14 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			endCol: Ending column (1-based)
 			progressDialog: Optional SelectionProgressDialog for visual feedback
 		"""
-		# Extract rectangular region line by line
+		# Extract rectangular region from one snapshot; ANSI codes are stripped
+		# first so display columns are accurate
 		lines = []
-		currentInfo = terminal.makeTextInfo(textInfos.POSITION_FIRST)
-
-		# Move to start row
-		currentInfo.move(textInfos.UNIT_LINE, startRow - 1)
+		grid = ScreenGrid(ANSIParser.stripANSI(terminal.makeTextInfo(textInfos.POSITION_ALL).text))
+		endRow = min(endRow, grid.rowCount)
 
 		# Calculate total rows for progress tracking
-		totalRows = endRow - startRow + 1
+		totalRows = max(endRow - startRow + 1, 1)
 
 		# Extract each line in range
 		for idx, row in enumerate(range(startRow, endRow + 1)):
@@ -6767,22 +10637,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 					progressDialog.close()
 					return
 
-			lineInfo = currentInfo.copy()
-			lineInfo.expand(textInfos.UNIT_LINE)
-			lineText = lineInfo.text.rstrip('\n\r')
-
-			# Strip ANSI codes for accurate column extraction
-			cleanText = ANSIParser.stripANSI(lineText)
-
-			# Extract column range using Unicode-aware helper (1-based columns)
-			columnText = UnicodeWidthHelper.extractColumnRange(cleanText, startCol, endCol)
-
-			lines.append(columnText)
-
-			# Move to next line
-			moved = currentInfo.move(textInfos.UNIT_LINE, 1)
-			if moved == 0:
-				break
+			# Column range by display width (1-based columns)
+			lines.append(grid.span(row, startCol, endCol))
 
 		# Join lines and copy to clipboard
 		rectangularText = '\n'.join(lines)
@@ -6921,207 +10777,615 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			ui.message(_("Bookmark manager not available"))
 			return
 
-		bookmarks = self._bookmarkManager.list_bookmarks()
-		if bookmarks:
-			count = len(bookmarks)
-			# Translators: Message listing bookmarks
-			message = _("{count} bookmarks: {names}").format(
-				count=count,
-				names=", ".join(bookmarks)
-			)
-			ui.message(message)
-		else:
-			# Translators: Message when no bookmarks exist
-			ui.message(_("No bookmarks set"))
+		bookmarks = self._bookmarkManager.list_bookmarks()
+		if bookmarks:
+			count = len(bookmarks)
+			# Translators: Message listing bookmarks
+			message = _("{count} bookmarks: {names}").format(
+				count=count,
+				names=", ".join(bookmarks)
+			)
+			ui.message(message)
+		else:
+			# Translators: Message when no bookmarks exist
+			ui.message(_("No bookmarks set"))
+
+	# Section 9: Tab management gestures (v1.0.39+)
+
+	@scriptHandler.script(
+		# Translators: Description for creating a new terminal tab
+		description=_("Create a new tab in the terminal"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+shift+t"
+	)
+	def script_createNewTab(self, gesture):
+		"""Create a new tab in the terminal."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		# Send the standard keyboard shortcut for creating a new tab
+		# Most modern terminals use Ctrl+Shift+T
+		try:
+			import keyboardHandler
+			# Press Ctrl+Shift+T to create new tab
+			keyboardHandler.KeyboardInputGesture.fromName("control+shift+t").send()
+			# Announce that we're creating a new tab
+			# Translators: Message when creating a new tab
+			ui.message(_("Creating new tab"))
+		except Exception:
+			# Translators: Error message when tab creation fails
+			ui.message(_("Unable to create new tab"))
+
+	@scriptHandler.script(
+		# Translators: Description for listing/navigating tabs
+		description=_("List tabs or switch to tab bar"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+w"
+	)
+	def script_listTabs(self, gesture):
+		"""List all tabs or focus tab bar."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		if not self._tabManager:
+			# Translators: Error message when tab manager not initialized
+			ui.message(_("Tab manager not available"))
+			return
+
+		# Get list of known tabs
+		tabs = self._tabManager.list_tabs()
+		tab_count = self._tabManager.get_tab_count()
+		current_tab_id = self._tabManager.get_current_tab_id()
+
+		if tab_count == 0:
+			# Translators: Message when no tabs are detected
+			ui.message(_("No tabs detected"))
+		elif tab_count == 1:
+			# Only one tab, announce it
+			# Translators: Message for single tab
+			ui.message(_("Single tab: {title}").format(title=tabs[0].get('title', 'Unknown')))
+		else:
+			# Multiple tabs - show simple announcement for now
+			# (Full dialog implementation would go here)
+			# Translators: Message listing tab count
+			ui.message(_("{count} tabs detected").format(count=tab_count))
+
+			# Also send Ctrl+Tab to switch to next tab
+			try:
+				import keyboardHandler
+				keyboardHandler.KeyboardInputGesture.fromName("control+tab").send()
+				# Translators: Message when switching tabs
+				ui.message(_("Switching to next tab"))
+			except Exception:
+				pass
+
+	# Section 8.1: Command history navigation gestures (v1.0.31+)
+
+	@scriptHandler.script(
+		# Translators: Description for scanning command history
+		description=_("Scan terminal output to detect and store command history"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+shift+h"
+	)
+	def script_scanCommandHistory(self, gesture):
+		"""Scan terminal output for commands."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		if not self._commandHistoryManager:
+			# Translators: Error message when command history manager not initialized
+			ui.message(_("Command history not available"))
+			return
+
+		# Scan terminal output for commands
+		count = self._commandHistoryManager.detect_and_store_commands()
+
+		if count > 0:
+			total = self._commandHistoryManager.get_history_count()
+			# Translators: Message when commands detected
+			ui.message(_("Found {count} new commands, {total} total").format(count=count, total=total))
+		else:
+			# Translators: Message when no new commands found
+			ui.message(_("No new commands found"))
+
+	@scriptHandler.script(
+		# Translators: Description for previous command navigation
+		description=_("Navigate to previous command in history"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+h"
+	)
+	def script_previousCommand(self, gesture):
+		"""Navigate to previous command."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		if not self._commandHistoryManager:
+			# Translators: Error message when command history manager not initialized
+			ui.message(_("Command history not available"))
+			return
+
+		# Catch up on output that arrived while no snapshot was shared
+		self._commandHistoryManager.detect_and_store_commands()
+
+		if not self._commandHistoryManager.navigate_history(-1):
+			# Translators: Message when at beginning of history
+			ui.message(_("No previous command"))
+
+	@scriptHandler.script(
+		# Translators: Description for next command navigation
+		description=_("Navigate to next command in history"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+g"
+	)
+	def script_nextCommand(self, gesture):
+		"""Navigate to next command."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		if not self._commandHistoryManager:
+			# Translators: Error message when command history manager not initialized
+			ui.message(_("Command history not available"))
+			return
+
+		# Catch up on output that arrived while no snapshot was shared
+		self._commandHistoryManager.detect_and_store_commands()
+
+		if not self._commandHistoryManager.navigate_history(1):
+			# Translators: Message when at end of history
+			ui.message(_("No next command"))
+
+	@scriptHandler.script(
+		# Translators: Description for listing command history
+		description=_("List all commands in history"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+shift+l"
+	)
+	def script_listCommandHistory(self, gesture):
+		"""List all commands in history."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		if not self._commandHistoryManager:
+			# Translators: Error message when command history manager not initialized
+			ui.message(_("Command history not available"))
+			return
+
+		# Catch up on output that arrived while no snapshot was shared
+		self._commandHistoryManager.detect_and_store_commands()
+
+		history = self._commandHistoryManager.list_history()
+
+		if history:
+			count = len(history)
+			# Create a summary of recent commands (last 5)
+			recent = history[-5:] if count > 5 else history
+			commands_list = ", ".join([f"{idx}: {cmd[:30]}" for idx, cmd in recent])
+
+			# Translators: Message listing command history
+			ui.message(_("{count} commands in history. Recent: {commands}").format(
+				count=count,
+				commands=commands_list
+			))
+		else:
+			# Translators: Message when no commands in history
+			ui.message(_("No commands in history"))
+
+	def _getCommandBlockForOutput(self):
+		"""
+		Refresh command history and return the block output scripts act on.
+
+		Announces why when there is nothing to act on.
+
+		Returns:
+			(prompt_row, command_text, output_start, output_end) or None
+		"""
+		if not self._commandHistoryManager:
+			# Translators: Error message when command history manager not initialized
+			ui.message(_("Command history not available"))
+			return None
+
+		self._commandHistoryManager.detect_and_store_commands()
+		block = self._commandHistoryManager.get_block()
+		if block is None:
+			# Translators: Message when no commands in history
+			ui.message(_("No commands in history"))
+		return block
+
+	def _jumpToCommandOutput(self, atEnd):
+		"""
+		Jump to the first or last output line of the current command.
+
+		Args:
+			atEnd: Jump to the last output line instead of the first
+		"""
+		block = self._getCommandBlockForOutput()
+		if block is None:
+			return
+		row = self._commandHistoryManager.jump_to_output(at_end=atEnd)
+		if row < 0:
+			# Translators: Message when a command produced no output
+			ui.message(_("No output for {command}").format(command=block[1]))
+			return
+		line = self._commandHistoryManager.get_line_text(row)
+		# Translators: Announced for a blank line
+		ui.message(line if line.strip() else _("Blank"))
+
+	@scriptHandler.script(
+		# Translators: Description for jumping to the start of a command's output
+		description=_("Jump to the first line of the current command's output"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+alt+home"
+	)
+	def script_jumpToCommandOutputStart(self, gesture):
+		"""Jump to the first line of the current command's output."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		self._jumpToCommandOutput(atEnd=False)
+
+	@scriptHandler.script(
+		# Translators: Description for jumping to the end of a command's output
+		description=_("Jump to the last line of the current command's output"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+alt+end"
+	)
+	def script_jumpToCommandOutputEnd(self, gesture):
+		"""Jump to the last line of the current command's output."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		self._jumpToCommandOutput(atEnd=True)
+
+	@scriptHandler.script(
+		# Translators: Description for reading a command's output
+		description=_("Read the output of the current command"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+alt+o"
+	)
+	def script_readCommandOutput(self, gesture):
+		"""Read the output of the current command."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		block = self._getCommandBlockForOutput()
+		if block is None:
+			return
+		output = self._commandHistoryManager.get_output_text()
+		if not output or not output.strip():
+			# Translators: Message when a command produced no output
+			ui.message(_("No output for {command}").format(command=block[1]))
+			return
+		ui.message(output)
+
+	@scriptHandler.script(
+		# Translators: Description for copying a command's output
+		description=_("Copy the output of the current command to the clipboard"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+alt+c"
+	)
+	def script_copyCommandOutput(self, gesture):
+		"""Copy the output of the current command to the clipboard."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		block = self._getCommandBlockForOutput()
+		if block is None:
+			return
+		output = self._commandHistoryManager.get_output_text()
+		if not output or not output.strip():
+			# Translators: Message when a command produced no output
+			ui.message(_("No output for {command}").format(command=block[1]))
+			return
+		if self._copyToClipboard(output):
+			# Translators: Message after copying a command's output
+			ui.message(_("Output of {command} copied").format(command=block[1]))
+		else:
+			# Translators: Error message when unable to copy
+			ui.message(_("Unable to copy"))
+
+	@scriptHandler.script(
+		# Translators: Description for moving the review cursor up one row in the same column
+		description=_("Move the review cursor up one row, keeping the column"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+alt+upArrow"
+	)
+	def script_reviewUpSameColumn(self, gesture):
+		"""Move the review cursor up one row, keeping the column."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		self._moveReviewInColumn(-1)
+
+	@scriptHandler.script(
+		# Translators: Description for moving the review cursor down one row in the same column
+		description=_("Move the review cursor down one row, keeping the column"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+alt+downArrow"
+	)
+	def script_reviewDownSameColumn(self, gesture):
+		"""Move the review cursor down one row, keeping the column."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		self._moveReviewInColumn(1)
+
+	def _moveReviewInColumn(self, delta: int) -> None:
+		"""
+		Move the review cursor one row, staying in the same display column.
+
+		The row and column are remembered with the bookmark of the position
+		this command set, so repeated presses skip position calculation: each
+		is a column-map lookup in the screen grid and one relative TextInfo
+		move.  The column is sticky, so passing through a short row returns to
+		the same column on the next longer one.  The word under the new
+		position is read with the same boundaries as word review, or
+		"blank" between words.
+
+		Args:
+			delta: -1 to move up, 1 to move down
+		"""
+		located = self._locateReviewInGrid()
+		if located is None:
+			return
+		grid, reviewInfo, row, column = located
+		try:
+			index = self._moveReviewToCell(grid, reviewInfo, row, row + delta, column)
+		except Exception as e:
+			import logHandler
+			logHandler.log.error(f"Terminal Access: Column navigation failed - {type(e).__name__}: {e}")
+			# Translators: Message when the review cursor cannot be moved
+			ui.message(_("Unable to move review cursor"))
+			return
+		if index is None:
+			# Translators: Message when there is no row above or below the review cursor
+			ui.message(_("Top") if delta < 0 else _("Bottom"))
+			return
+
+		segmenter = self._wordSegmenter
+		segmenter.setWordCharacters(self._getSettings().wordCharacters)
+		# Translators: Announced when the review cursor lands between words
+		ui.message(segmenter.wordAt(grid.line(row + delta), index) or _("Blank"))
+
+	def _locateReviewInGrid(self):
+		"""
+		Find the review cursor in the screen grid.
+
+		The position set by the last grid move is remembered with its
+		bookmark, so consecutive grid commands need no position calculation.
+		Announces why when the position is unknown.
+
+		Returns:
+			(grid, reviewInfo, row, column) with 1-based row and display column, or None
+		"""
+		terminal = self._boundTerminal
+		reviewInfo = self._getReviewPosition()
+		if terminal is None or reviewInfo is None:
+			# Translators: Message when no review position
+			ui.message(_("No review position"))
+			return None
+		try:
+			grid = self._getScreenGrid(terminal, reuse=True)
+			recalled = self._recallReviewPosition(reviewInfo)
+			if recalled is not None:
+				return grid, reviewInfo, recalled[0], recalled[1]
+			row, charCol = self._positionCalculator.calculate(reviewInfo, terminal)
+		except Exception as e:
+			import logHandler
+			logHandler.log.error(f"Terminal Access: Unable to locate review cursor - {type(e).__name__}: {e}")
+			row = 0
+		if row == 0:
+			ui.message(_("Unable to determine position"))
+			return None
+		return grid, reviewInfo, row, grid.columnAt(row, charCol - 1)
+
+	def _moveReviewToCell(self, grid: ScreenGrid, reviewInfo, row: int, targetRow: int, column: int) -> int | None:
+		"""
+		Move the review cursor to a grid cell with relative TextInfo moves.
+
+		Args:
+			grid: Screen grid
+			reviewInfo: Current review position
+			row: Row of the current review position (1-based)
+			targetRow: Row to move to (1-based)
+			column: Display column to move to (1-based)
+
+		Returns:
+			int | None: Character index in the target row, or None if the row does not exist
+		"""
+		if not 1 <= targetRow <= grid.rowCount:
+			return None
+		info = reviewInfo.copy()
+		info.expand(textInfos.UNIT_LINE)
+		info.collapse()
+		if targetRow != row and info.move(textInfos.UNIT_LINE, targetRow - row) == 0:
+			return None
+		index = grid.indexAt(targetRow, column)
+		if index > 0:
+			info.move(textInfos.UNIT_CHARACTER, index)
+		api.setReviewPosition(info)
+		self._rememberReviewPosition(info, targetRow, column)
+		return index
+
+	def _rememberReviewPosition(self, info, row: int, column: int) -> None:
+		"""
+		Remember where a navigation command left the review cursor.
+
+		Args:
+			info: New review position
+			row: Its row (1-based)
+			column: Its display column (1-based)
+		"""
+		self._reviewMemo = (info.bookmark, row, column, self._generation.value, time.time())
+
+	def _recallReviewPosition(self, reviewInfo) -> tuple[int, int] | None:
+		"""
+		Get the remembered row and column of the review cursor.
+
+		Valid only while the review cursor is still where a navigation
+		command left it and no row at or above it has changed since.
+
+		Args:
+			reviewInfo: Current review position
 
-	# Section 9: Tab management gestures (v1.0.39+)
+		Returns:
+			(row, column) or None if the position must be calculated
+		"""
+		memo = self._reviewMemo
+		if memo is None or memo[0] != reviewInfo.bookmark:
+			return None
+		if not self._generation.is_row_current(memo[1] - 1, memo[3]):
+			return None
+		if not self._generation.is_confirmed(memo[4], PositionCache.CACHE_TIMEOUT_S):
+			return None
+		return memo[1], memo[2]
 
 	@scriptHandler.script(
-		# Translators: Description for creating a new terminal tab
-		description=_("Create a new tab in the terminal"),
+		# Translators: Description for moving to the previous cell in a table row
+		description=_("Move to the previous cell in a table row"),
 		category=SCRCAT_TERMINALACCESS,
-		gesture="kb:NVDA+shift+t"
+		gesture="kb:NVDA+control+alt+leftArrow"
 	)
-	def script_createNewTab(self, gesture):
-		"""Create a new tab in the terminal."""
+	def script_tablePreviousColumn(self, gesture):
+		"""Move to the previous cell in a table row."""
 		if not self.isTerminalApp():
 			gesture.send()
 			return
 
-		# Send the standard keyboard shortcut for creating a new tab
-		# Most modern terminals use Ctrl+Shift+T
-		try:
-			import keyboardHandler
-			# Press Ctrl+Shift+T to create new tab
-			keyboardHandler.KeyboardInputGesture.fromName("control+shift+t").send()
-			# Announce that we're creating a new tab
-			# Translators: Message when creating a new tab
-			ui.message(_("Creating new tab"))
-		except Exception:
-			# Translators: Error message when tab creation fails
-			ui.message(_("Unable to create new tab"))
+		self._moveTableCell(0, -1)
 
 	@scriptHandler.script(
-		# Translators: Description for listing/navigating tabs
-		description=_("List tabs or switch to tab bar"),
+		# Translators: Description for moving to the next cell in a table row
+		description=_("Move to the next cell in a table row"),
 		category=SCRCAT_TERMINALACCESS,
-		gesture="kb:NVDA+w"
+		gesture="kb:NVDA+control+alt+rightArrow"
 	)
-	def script_listTabs(self, gesture):
-		"""List all tabs or focus tab bar."""
+	def script_tableNextColumn(self, gesture):
+		"""Move to the next cell in a table row."""
 		if not self.isTerminalApp():
 			gesture.send()
 			return
 
-		if not self._tabManager:
-			# Translators: Error message when tab manager not initialized
-			ui.message(_("Tab manager not available"))
-			return
-
-		# Get list of known tabs
-		tabs = self._tabManager.list_tabs()
-		tab_count = self._tabManager.get_tab_count()
-		current_tab_id = self._tabManager.get_current_tab_id()
-
-		if tab_count == 0:
-			# Translators: Message when no tabs are detected
-			ui.message(_("No tabs detected"))
-		elif tab_count == 1:
-			# Only one tab, announce it
-			# Translators: Message for single tab
-			ui.message(_("Single tab: {title}").format(title=tabs[0].get('title', 'Unknown')))
-		else:
-			# Multiple tabs - show simple announcement for now
-			# (Full dialog implementation would go here)
-			# Translators: Message listing tab count
-			ui.message(_("{count} tabs detected").format(count=tab_count))
-
-			# Also send Ctrl+Tab to switch to next tab
-			try:
-				import keyboardHandler
-				keyboardHandler.KeyboardInputGesture.fromName("control+tab").send()
-				# Translators: Message when switching tabs
-				ui.message(_("Switching to next tab"))
-			except Exception:
-				pass
-
-	# Section 8.1: Command history navigation gestures (v1.0.31+)
+		self._moveTableCell(0, 1)
 
 	@scriptHandler.script(
-		# Translators: Description for scanning command history
-		description=_("Scan terminal output to detect and store command history"),
+		# Translators: Description for moving to the cell above in a table column
+		description=_("Move to the cell above in a table column"),
 		category=SCRCAT_TERMINALACCESS,
-		gesture="kb:NVDA+shift+h"
+		gesture="kb:NVDA+control+alt+upArrow"
 	)
-	def script_scanCommandHistory(self, gesture):
-		"""Scan terminal output for commands."""
+	def script_tablePreviousRow(self, gesture):
+		"""Move to the cell above in a table column."""
 		if not self.isTerminalApp():
 			gesture.send()
 			return
 
-		if not self._commandHistoryManager:
-			# Translators: Error message when command history manager not initialized
-			ui.message(_("Command history not available"))
-			return
-
-		# Scan terminal output for commands
-		count = self._commandHistoryManager.detect_and_store_commands()
-
-		if count > 0:
-			total = self._commandHistoryManager.get_history_count()
-			# Translators: Message when commands detected
-			ui.message(_("Found {count} new commands, {total} total").format(count=count, total=total))
-		else:
-			# Translators: Message when no new commands found
-			ui.message(_("No new commands found"))
+		self._moveTableCell(-1, 0)
 
 	@scriptHandler.script(
-		# Translators: Description for previous command navigation
-		description=_("Navigate to previous command in history"),
+		# Translators: Description for moving to the cell below in a table column
+		description=_("Move to the cell below in a table column"),
 		category=SCRCAT_TERMINALACCESS,
-		gesture="kb:NVDA+h"
+		gesture="kb:NVDA+control+alt+downArrow"
 	)
-	def script_previousCommand(self, gesture):
-		"""Navigate to previous command."""
+	def script_tableNextRow(self, gesture):
+		"""Move to the cell below in a table column."""
 		if not self.isTerminalApp():
 			gesture.send()
 			return
 
-		if not self._commandHistoryManager:
-			# Translators: Error message when command history manager not initialized
-			ui.message(_("Command history not available"))
-			return
-
-		# Auto-scan if history is empty
-		if self._commandHistoryManager.get_history_count() == 0:
-			self._commandHistoryManager.detect_and_store_commands()
-
-		if not self._commandHistoryManager.navigate_history(-1):
-			# Translators: Message when at beginning of history
-			ui.message(_("No previous command"))
+		self._moveTableCell(1, 0)
 
 	@scriptHandler.script(
-		# Translators: Description for next command navigation
-		description=_("Navigate to next command in history"),
+		# Translators: Description for announcing the header of the current table column
+		description=_("Announce the header of the current table column"),
 		category=SCRCAT_TERMINALACCESS,
-		gesture="kb:NVDA+g"
+		gesture="kb:NVDA+control+alt+h"
 	)
-	def script_nextCommand(self, gesture):
-		"""Navigate to next command."""
+	def script_announceColumnHeader(self, gesture):
+		"""Announce the header of the current table column."""
 		if not self.isTerminalApp():
 			gesture.send()
 			return
 
-		if not self._commandHistoryManager:
-			# Translators: Error message when command history manager not initialized
-			ui.message(_("Command history not available"))
+		located = self._locateTable()
+		if located is None:
 			return
+		layout, grid, reviewInfo, row, column = located
+		ui.message(layout.headers[layout.columnIndex(column)])
 
-		# Auto-scan if history is empty
-		if self._commandHistoryManager.get_history_count() == 0:
-			self._commandHistoryManager.detect_and_store_commands()
+	def _locateTable(self):
+		"""
+		Find the review cursor and the table around it.
 
-		if not self._commandHistoryManager.navigate_history(1):
-			# Translators: Message when at end of history
-			ui.message(_("No next command"))
+		Announces why when there is no table.
 
-	@scriptHandler.script(
-		# Translators: Description for listing command history
-		description=_("List all commands in history"),
-		category=SCRCAT_TERMINALACCESS,
-		gesture="kb:NVDA+shift+l"
-	)
-	def script_listCommandHistory(self, gesture):
-		"""List all commands in history."""
-		if not self.isTerminalApp():
-			gesture.send()
-			return
+		Returns:
+			(layout, grid, reviewInfo, row, column) or None
+		"""
+		located = self._locateReviewInGrid()
+		if located is None:
+			return None
+		grid, reviewInfo, row, column = located
+		layout = self._tableDetector.detect(grid, row)
+		if layout is None:
+			# Translators: Message when the review cursor is not in a table
+			ui.message(_("Not in a table"))
+			return None
+		return layout, grid, reviewInfo, row, column
 
-		if not self._commandHistoryManager:
-			# Translators: Error message when command history manager not initialized
-			ui.message(_("Command history not available"))
-			return
+	def _moveTableCell(self, rowDelta: int, columnDelta: int) -> None:
+		"""
+		Move the review cursor to a neighbouring table cell and read it.
 
-		# Auto-scan if history is empty
-		if self._commandHistoryManager.get_history_count() == 0:
-			self._commandHistoryManager.detect_and_store_commands()
+		The cursor is placed on the first character of the cell, so right
+		aligned numbers are reached directly.  Moving to another column reads
+		its header before the cell.
 
-		history = self._commandHistoryManager.list_history()
+		Args:
+			rowDelta: -1 for the row above, 1 for the row below, 0 to stay
+			columnDelta: -1 for the previous column, 1 for the next, 0 to stay
+		"""
+		located = self._locateTable()
+		if located is None:
+			return
+		layout, grid, reviewInfo, row, column = located
+		index = layout.columnIndex(column) + columnDelta
+		targetRow = row + rowDelta
+		if not 0 <= index < len(layout.columns):
+			# Translators: Message at the first or last column of a table
+			ui.message(_("First column") if columnDelta < 0 else _("Last column"))
+			return
+		if not layout.top <= targetRow <= layout.bottom:
+			# Translators: Message at the first or last row of a table
+			ui.message(_("Top of table") if rowDelta < 0 else _("Bottom of table"))
+			return
 
-		if history:
-			count = len(history)
-			# Create a summary of recent commands (last 5)
-			recent = history[-5:] if count > 5 else history
-			commands_list = ", ".join([f"{idx}: {cmd[:30]}" for idx, cmd in recent])
+		try:
+			self._moveReviewToCell(grid, reviewInfo, row, targetRow, layout.cellStart(grid, targetRow, index))
+		except Exception as e:
+			import logHandler
+			logHandler.log.error(f"Terminal Access: Table navigation failed - {type(e).__name__}: {e}")
+			ui.message(_("Unable to move review cursor"))
+			return
 
-			# Translators: Message listing command history
-			ui.message(_("{count} commands in history. Recent: {commands}").format(
-				count=count,
-				commands=commands_list
-			))
-		else:
-			# Translators: Message when no commands in history
-			ui.message(_("No commands in history"))
+		# Translators: Announced for an empty table cell
+		cell = layout.cell(grid, targetRow, index) or _("Blank")
+		if columnDelta:
+			# Translators: A table cell read after moving to another column, preceded by its header
+			cell = _("{header}: {cell}").format(header=layout.headers[index], cell=cell)
+		ui.message(cell)
 
 	# Section 8.2: Output search functionality gestures (v1.0.30+)
 
@@ -7142,51 +11406,125 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			ui.message(_("Search not available"))
 			return
 
-		# Prompt for search text using wx dialog
-		import wx
+		# Snapshot the buffer once; every keystroke in the dialog then
+		# narrows the previous candidate set instead of rescanning.
+		session = self._searchManager.begin_incremental_search(case_sensitive=False)
+		if session is None:
+			# Translators: Error message when search manager not initialized
+			ui.message(_("Search not available"))
+			return
 
-		def show_search_dialog():
-			"""Show search dialog."""
-			parent = gui.mainFrame
-			dlg = wx.TextEntryDialog(
-				parent,
-				# Translators: Search dialog prompt
-				_("Enter search text:"),
-				# Translators: Search dialog title
-				_("Search Terminal Output")
-			)
+		# Run dialog in main thread
+		wx.CallAfter(self._showIncrementalSearchDialog, session)
+
+	def _showIncrementalSearchDialog(self, session):
+		"""
+		Show the search-as-you-type dialog (must be called on main thread).
+
+		Args:
+			session: IncrementalSearchSession over the buffer snapshot
+		"""
+		dlg = wx.Dialog(
+			gui.mainFrame,
+			# Translators: Search dialog title
+			title=_("Search Terminal Output")
+		)
+		sHelper = guiHelper.BoxSizerHelper(dlg, orientation=wx.VERTICAL)
+		# Translators: Search dialog prompt
+		textCtrl = sHelper.addLabeledControl(_("Enter search text:"), wx.TextCtrl)
+		sHelper.addDialogDismissButtons(wx.OK | wx.CANCEL)
+		dlg.SetSizerAndFit(sHelper.sizer)
+		textCtrl.Bind(wx.EVT_TEXT, lambda evt: self._onIncrementalSearchText(session, textCtrl.GetValue()))
+		textCtrl.SetFocus()
 
+		try:
 			if dlg.ShowModal() == wx.ID_OK:
-				search_text = dlg.GetValue()
-				dlg.Destroy()
+				self._cancelIncrementalSearchAnnouncement()
+				self._commitIncrementalSearch(session, textCtrl.GetValue())
+		finally:
+			self._cancelIncrementalSearchAnnouncement()
+			dlg.Destroy()
 
-				if search_text:
-					# Perform search (case insensitive by default)
-					match_count = self._searchManager.search(search_text, case_sensitive=False)
-
-					if match_count > 0:
-						# Jump to first match
-						self._searchManager.first_match()
-
-						# Announce result
-						info = self._searchManager.get_current_match_info()
-						if info:
-							match_num, total, line_text, line_num = info
-							# Translators: Search results message
-							message = _("Found {total} matches. Match {num} of {total}: {text}").format(
-								num=match_num,
-								total=total,
-								text=line_text[:100]  # Truncate long lines
-							)
-							ui.message(message)
-					else:
-						# Translators: No matches found
-						ui.message(_("No matches found for '{pattern}'").format(pattern=search_text))
-			else:
-				dlg.Destroy()
+	def _onIncrementalSearchText(self, session, query):
+		"""
+		Narrow the candidate set for *query* and schedule a debounced announcement.
 
-		# Run dialog in main thread
-		wx.CallAfter(show_search_dialog)
+		Args:
+			session: IncrementalSearchSession over the buffer snapshot
+			query: Current contents of the search field
+		"""
+		session.update(query)
+		self._cancelIncrementalSearchAnnouncement()
+		self._incrementalSearchTimer = wx.CallLater(
+			_INCREMENTAL_SEARCH_DEBOUNCE_MS, self._announceIncrementalSearch, session
+		)
+
+	def _cancelIncrementalSearchAnnouncement(self):
+		"""Stop any pending search-as-you-type announcement."""
+		timer = self._incrementalSearchTimer
+		self._incrementalSearchTimer = None
+		if timer is not None:
+			try:
+				timer.Stop()
+			except Exception:
+				pass
+
+	def _announceIncrementalSearch(self, session):
+		"""
+		Announce the match count and first match for the current query.
+
+		Args:
+			session: IncrementalSearchSession over the buffer snapshot
+		"""
+		self._incrementalSearchTimer = None
+		if not session.query:
+			return
+		first = session.first_match()
+		if first is None:
+			# Translators: Announced while typing a search when nothing matches
+			ui.message(_("No matches"))
+			return
+		# Translators: Announced while typing a search: match count and first matching line
+		ui.message(_("{count} matches. First: {text}").format(
+			count=session.match_count(),
+			text=first[1][:100]  # Truncate long lines
+		))
+
+	def _commitIncrementalSearch(self, session, search_text):
+		"""
+		Run the final search for *search_text* and jump to the first match.
+
+		Args:
+			session: IncrementalSearchSession whose snapshot is reused
+			search_text: Final query from the search field
+		"""
+		if not search_text:
+			return
+
+		# Perform search (case insensitive by default) on the dialog's snapshot;
+		# results go stale from the moment that snapshot was read
+		match_count = self._searchManager.search(
+			search_text, case_sensitive=False, lines=session.lines, generation=session.generation
+		)
+
+		if match_count > 0:
+			# Jump to first match
+			self._searchManager.first_match()
+
+			# Announce result
+			info = self._searchManager.get_current_match_info()
+			if info:
+				match_num, total, line_text, line_num = info
+				# Translators: Search results message
+				message = _("Found {total} matches. Match {num} of {total}: {text}").format(
+					num=match_num,
+					total=total,
+					text=line_text[:100]  # Truncate long lines
+				)
+				ui.message(message)
+		else:
+			# Translators: No matches found
+			ui.message(_("No matches found for '{pattern}'").format(pattern=search_text))
 
 	@scriptHandler.script(
 		# Translators: Description for next search match
@@ -7248,6 +11586,87 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			# Translators: Error jumping to previous match
 			ui.message(_("Cannot jump to previous match"))
 
+	@scriptHandler.script(
+		# Translators: Description for the fuzzy line finder
+		description=_("Find a line in terminal output by approximate text"),
+		category=SCRCAT_TERMINALACCESS,
+		gesture="kb:NVDA+shift+f"
+	)
+	def script_fuzzyFindLine(self, gesture):
+		"""Find a line by approximate text and jump to it."""
+		if not self.isTerminalApp():
+			gesture.send()
+			return
+
+		if not self._searchManager:
+			# Translators: Error message when search manager not initialized
+			ui.message(_("Search not available"))
+			return
+
+		def show_query_dialog():
+			"""Prompt for the approximate text and start ranking."""
+			dlg = wx.TextEntryDialog(
+				gui.mainFrame,
+				# Translators: Fuzzy line finder prompt
+				_("Enter words you remember from the line:"),
+				# Translators: Fuzzy line finder dialog title
+				_("Find Line")
+			)
+			try:
+				if dlg.ShowModal() != wx.ID_OK:
+					return
+				query = dlg.GetValue()
+			finally:
+				dlg.Destroy()
+
+			if not self._searchManager.fuzzy_find(
+				query, lambda results: wx.CallAfter(self._showFuzzyFindResults, query, results)
+			):
+				# Translators: No matches found
+				ui.message(_("No matches found for '{pattern}'").format(pattern=query))
+
+		# Run dialog in main thread
+		wx.CallAfter(show_query_dialog)
+
+	def _showFuzzyFindResults(self, query, results):
+		"""
+		Present fuzzy finder results in a list and jump to the chosen line.
+
+		Args:
+			query: The query the results were ranked for
+			results: List of (line_num, char_offset, line_text), best first
+		"""
+		if not results:
+			# Translators: No matches found
+			ui.message(_("No matches found for '{pattern}'").format(pattern=query))
+			return
+
+		choices = [
+			# Translators: One entry in the fuzzy finder results list
+			_("Line {num}: {text}").format(num=line_num, text=line_text.strip()[:100])
+			for line_num, _offset, line_text in results
+		]
+		dlg = wx.SingleChoiceDialog(
+			gui.mainFrame,
+			# Translators: Fuzzy line finder results prompt
+			_("{count} best matches:").format(count=len(results)),
+			# Translators: Fuzzy line finder dialog title
+			_("Find Line"),
+			choices
+		)
+		try:
+			if dlg.ShowModal() != wx.ID_OK:
+				return
+			line_num, char_offset, line_text = results[dlg.GetSelection()]
+		finally:
+			dlg.Destroy()
+
+		if self._searchManager.jump_to_line(line_num, char_offset):
+			ui.message(line_text)
+		else:
+			# Translators: Error jumping to a line chosen in the fuzzy finder
+			ui.message(_("Cannot jump to line {num}").format(num=line_num))
+
 	def _copyToClipboard(self, text):
 		"""
 		Copy text to the Windows clipboard using NVDA's clipboard API.
@@ -7538,6 +11957,19 @@ class TerminalAccessSettingsPanel(SettingsPanel):
 			"Example: -_=! (max 50 characters)"
 		))
 
+		# Word characters text field
+		# Translators: Label for the characters kept inside words during word navigation
+		self.wordCharactersText = advancedGroup.addLabeledControl(
+			_("Characters kept inside words:"),
+			wx.TextCtrl
+		)
+		self.wordCharactersText.SetValue(config.conf["terminalAccess"]["wordCharacters"])
+		# Translators: Tooltip for word characters
+		self.wordCharactersText.SetToolTip(_(
+			"Characters that do not end a word during word navigation, so paths, URLs "
+			"and options such as --no-cache-dir are read as one word (max 50 characters)"
+		))
+
 		# === Profile Management Section (Section 3: Profile Management UI) ===
 		# Translators: Label for profile management group
 		profileGroup = guiHelper.BoxSizerHelper(self, sizer=wx.StaticBoxSizer(
@@ -7572,7 +12004,7 @@ class TerminalAccessSettingsPanel(SettingsPanel):
 		)
 		# Set current default profile selection
 		currentDefault = config.conf["terminalAccess"].get("defaultProfile", "")
-		if currentDefault and profileManager and currentDefault in profileManager.profiles:
+		if currentDefault and profileManager and profileManager.hasProfile(currentDefault):
 			# Find index (+1 because "None" is at index 0)
 			profileNames = self._getProfileNames()
 			if currentDefault in profileNames:
@@ -7675,6 +12107,7 @@ class TerminalAccessSettingsPanel(SettingsPanel):
 			config.conf["terminalAccess"]["punctuationLevel"] = PUNCT_MOST
 			config.conf["terminalAccess"]["repeatedSymbols"] = False
 			config.conf["terminalAccess"]["repeatedSymbolsValues"] = "-_=!"
+			config.conf["terminalAccess"]["wordCharacters"] = DEFAULT_WORD_CHARACTERS
 			config.conf["terminalAccess"]["cursorDelay"] = 20
 			config.conf["terminalAccess"]["quietMode"] = False
 			config.conf["terminalAccess"]["verboseMode"] = False  # Phase 6: Verbose Mode
@@ -7688,6 +12121,7 @@ class TerminalAccessSettingsPanel(SettingsPanel):
 			self.punctuationLevelChoice.SetSelection(PUNCT_MOST)
 			self.repeatedSymbolsCheckBox.SetValue(False)
 			self.repeatedSymbolsValuesText.SetValue("-_=!")
+			self.wordCharactersText.SetValue(DEFAULT_WORD_CHARACTERS)
 			self.cursorDelaySpinner.SetValue(20)
 			self.quietModeCheckBox.SetValue(False)
 			self.verboseModeCheckBox.SetValue(False)  # Phase 6: Verbose Mode
@@ -7696,6 +12130,7 @@ class TerminalAccessSettingsPanel(SettingsPanel):
 			config.conf["terminalAccess"]["newOutputCoalesceMs"] = 200
 			config.conf["terminalAccess"]["newOutputMaxLines"] = 20
 			config.conf["terminalAccess"]["stripAnsiInOutput"] = True
+			SettingsResolver.invalidate()
 			self.announceNewOutputCheckBox.SetValue(False)
 			self.newOutputCoalesceSpinner.SetValue(200)
 			self.newOutputMaxLinesSpinner.SetValue(20)
@@ -7747,6 +12182,11 @@ class TerminalAccessSettingsPanel(SettingsPanel):
 			repeatedSymbolsValue, MAX_REPEATED_SYMBOLS_LENGTH, "-_=!", "repeatedSymbolsValues"
 		)
 
+		# Validate and save word characters
+		config.conf["terminalAccess"]["wordCharacters"] = _validateString(
+			self.wordCharactersText.GetValue(), MAX_WORD_CHARACTERS_LENGTH, DEFAULT_WORD_CHARACTERS, "wordCharacters"
+		)
+
 		# Validate and save cursor delay
 		cursorDelay = self.cursorDelaySpinner.GetValue()
 		config.conf["terminalAccess"]["cursorDelay"] = _validateInteger(
@@ -7766,6 +12206,8 @@ class TerminalAccessSettingsPanel(SettingsPanel):
 			else:
 				config.conf["terminalAccess"]["defaultProfile"] = ""
 
+		SettingsResolver.invalidate()
+
 	def _getProfileManager(self):
 		"""Return the shared ProfileManager from the running global plugin, if available."""
 		try:
@@ -7789,7 +12231,7 @@ class TerminalAccessSettingsPanel(SettingsPanel):
 			for plugin in globalPluginHandler.runningPlugins:
 				if isinstance(plugin, terminalAccess.GlobalPlugin):
 					if hasattr(plugin, '_profileManager') and plugin._profileManager:
-						names = list(plugin._profileManager.profiles.keys())
+						names = plugin._profileManager.profileNames()
 						# Sort with default profiles first, then custom profiles
 						default_profiles = ['vim', 'nvim', 'tmux', 'htop', 'less', 'more', 'git', 'nano', 'irssi']
 						defaults = [n for n in names if n in default_profiles]
@@ -98,6 +98,7 @@ scriptHandler_mock.getLastScriptRepeatCount = _get_last_script_repeat_count
 sys.modules['scriptHandler'] = scriptHandler_mock
 sys.modules['globalCommands'] = MagicMock()
 sys.modules['speech'] = MagicMock()
+sys.modules['controlTypes'] = MagicMock()
 sys.modules['logHandler'] = MagicMock()
 sys.modules['wx'] = MagicMock()
 
@@ -121,6 +122,7 @@ conf_dict = {
         "quietMode": False,
         "verboseMode": False,  # Added verboseMode
         "indentationOnLineRead": False,
+        "wordCharacters": "-_./\\:~@%+=?&",
         "windowTop": 0,
         "windowBottom": 0,
         "windowLeft": 0,
@@ -183,6 +185,7 @@ def reset_config():
         "quietMode": False,
         "verboseMode": False,
         "indentationOnLineRead": False,
+        "wordCharacters": "-_./\\:~@%+=?&",
         "windowTop": 0,
         "windowBottom": 0,
         "windowLeft": 0,
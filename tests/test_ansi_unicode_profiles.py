@@ -136,6 +136,67 @@ class TestUnicodeWidthHelper(unittest.TestCase):
 		self.assertEqual(index, 2)
 
 
+class TestScreenGrid(unittest.TestCase):
+	"""Test the ScreenGrid display-column model."""
+
+	def setUp(self):
+		"""Import ScreenGrid for testing."""
+		from globalPlugins.terminalAccess import ScreenGrid, UnicodeWidthHelper
+		self.ScreenGrid = ScreenGrid
+		self.UnicodeWidthHelper = UnicodeWidthHelper
+
+	def test_wide_characters_fill_two_columns(self):
+		"""Cells and spans are addressed by display column."""
+		grid = self.ScreenGrid("ab\n\u4e2d\u6587x")
+		self.assertEqual(grid.rowWidth(2), 5)
+		self.assertEqual(grid.cell(2, 1), "\u4e2d")
+		self.assertEqual(grid.cell(2, 2), "\u4e2d")
+		self.assertEqual(grid.cell(2, 5), "x")
+		self.assertEqual(grid.cell(2, 6), "")
+		self.assertEqual(grid.rect(1, 1, 9, 2), ["ab", "\u4e2d"])
+		self.assertEqual([grid.columnAt(2, i) for i in range(4)], [1, 3, 5, 6])
+
+	def test_span_matches_extract_column_range(self):
+		"""Spans agree with the column-walking helper."""
+		for text in ("Hello World", "a\u4e2d\u4e2db", "\u4e2d"):
+			grid = self.ScreenGrid(text)
+			for start in range(1, 8):
+				for end in range(start, 8):
+					self.assertEqual(
+						grid.span(1, start, end),
+						self.UnicodeWidthHelper.extractColumnRange(text, start, end),
+					)
+
+	def test_column_maps_built_lazily(self):
+		"""Only rows that are accessed get a column map."""
+		grid = self.ScreenGrid("one\ntwo\nthree")
+		grid.cell(2, 1)
+		self.assertEqual([m is not None for m in grid._maps], [False, True, False])
+		self.assertIs(grid.columnMap(2), grid._maps[1])
+
+	def test_combining_mark_stays_with_base(self):
+		"""Zero-width characters belong to the preceding cell."""
+		grid = self.ScreenGrid("e\u0301z")
+		self.assertEqual(grid.rowWidth(1), 2)
+		self.assertEqual(grid.cell(1, 1), "e\u0301")
+		self.assertEqual(grid.cell(1, 2), "z")
+
+	def test_rectangular_copy_uses_one_snapshot(self):
+		"""Rectangular copy reads the buffer once and slices display columns."""
+		import textInfos
+		from globalPlugins.terminalAccess import GlobalPlugin
+
+		plugin = GlobalPlugin.__new__(GlobalPlugin)
+		plugin._copyToClipboard = Mock(return_value=True)
+		terminal = Mock()
+		terminal.makeTextInfo.return_value.text = "\x1b[1mNAME\x1b[0m  READY\npod-a \u4e2d1/1\n"
+
+		plugin._performRectangularCopy(terminal, 1, 2, 7, 9)
+
+		terminal.makeTextInfo.assert_called_once_with(textInfos.POSITION_ALL)
+		plugin._copyToClipboard.assert_called_once_with("REA\n\u4e2d1")
+
+
 class TestApplicationProfile(unittest.TestCase):
 	"""Test the ApplicationProfile and ProfileManager classes."""
 
@@ -234,6 +295,166 @@ class TestApplicationProfile(unittest.TestCase):
 		window = profile.getWindowAtPosition(15, 40)
 		self.assertIsNone(window)
 
+	def test_window_index_keeps_first_match(self):
+		"""Overlapping windows resolve to the first defined, as with a linear scan."""
+		profile = self.ApplicationProfile('test')
+		profile.addWindow('whole', 1, 9999, 1, 9999)
+		profile.addWindow('status', 9998, 9999, 1, 9999, mode='silent')
+		self.assertEqual(profile.getWindowAtPosition(9998, 5).name, 'whole')
+
+		profile.windows[0].enabled = False
+		self.assertEqual(profile.getWindowAtPosition(9998, 5).name, 'status')
+		self.assertIsNone(profile.getWindowAtPosition(50, 5))
+
+	def test_window_index_only_tests_nearby_windows(self):
+		"""A lookup touches only the windows in the row's bucket."""
+		profile = self.ApplicationProfile('dashboard')
+		for i in range(200):
+			profile.addWindow(f'pane{i}', i * 10 + 1, i * 10 + 10, 1, 80)
+
+		with patch.object(self.WindowDefinition, 'contains', autospec=True,
+				side_effect=lambda w, row, col: w.top <= row <= w.bottom) as contains:
+			self.assertEqual(profile.getWindowAtPosition(1505, 40).name, 'pane150')
+		self.assertLessEqual(contains.call_count, 5)
+
+	def test_window_index_rebuilt_from_dict_and_direct_append(self):
+		"""Deserialized profiles and appended windows are indexed."""
+		profile = self.ApplicationProfile('test')
+		profile.addWindow('main', 1, 10, 1, 80)
+		restored = self.ApplicationProfile.fromDict(profile.toDict())
+		self.assertEqual(restored.getWindowAtPosition(4, 4).name, 'main')
+
+		restored.windows.append(self.WindowDefinition('extra', 40, 50, 1, 80))
+		self.assertEqual(restored.getWindowAtPosition(45, 4).name, 'extra')
+		# Rows beyond the indexed range still fall back to a scan
+		restored.windows.append(self.WindowDefinition('far', 20000, 20010, 1, 80))
+		self.assertEqual(restored.getWindowAtPosition(20005, 4).name, 'far')
+
+	def test_relative_window_coordinates(self):
+		"""Negative and percentage coordinates resolve against the terminal size."""
+		window = self.WindowDefinition('status', -2, -1, '50%', -1, mode='silent')
+		self.assertTrue(window.resolve(24, 80))
+		self.assertEqual((window.top, window.bottom, window.left, window.right), (23, 24, 40, 80))
+		self.assertFalse(window.resolve(24, 80))
+		self.assertTrue(window.contains(24, 60))
+		self.assertFalse(window.contains(22, 60))
+
+		data = window.toDict()
+		self.assertEqual((data['top'], data['left']), (-2, '50%'))
+		restored = self.WindowDefinition.fromDict(data)
+		restored.resolve(50, 120)
+		self.assertEqual((restored.top, restored.left), (49, 60))
+
+	def test_relative_window_contains_nothing_until_resolved(self):
+		"""No placeholder size is assumed before the terminal size is known."""
+		window = self.WindowDefinition('half', 1, -1, '50%', -1)
+		self.assertFalse(window.contains(1, 1))
+		self.assertFalse(window.contains(9999, 9999))
+		window.resolve(24, 80)
+		self.assertTrue(window.contains(24, 80))
+
+	def test_invalid_window_coordinates(self):
+		"""Bad coordinates are rejected by the constructor and replaced on import."""
+		import logHandler
+
+		for value in ('abc', '150%', 'x%', None, 2.5, True):
+			with self.assertRaises(ValueError):
+				self.WindowDefinition('bad', value, 2, 1, 80)
+		self.assertEqual(self.WindowDefinition('text', ' 3 ', 4.0, 1, 80).spec, (3, 4, 1, 80))
+
+		logHandler.log.warning.reset_mock()
+		restored = self.WindowDefinition.fromDict(
+			{'name': 'bad', 'top': 'abc', 'bottom': '150%', 'left': 2, 'right': None}
+		)
+		self.assertEqual(restored.spec, (1, -1, 2, -1))
+		self.assertEqual(logHandler.log.warning.call_count, 3)
+		restored.resolve(24, 80)
+		self.assertEqual((restored.top, restored.bottom, restored.left, restored.right), (1, 24, 2, 80))
+
+		profile = self.ApplicationProfile.fromDict({'appName': 'x', 'windows': [{'name': 'w', 'top': 'abc'}]})
+		self.assertEqual(len(profile.windows), 1)
+
+	def test_profile_windows_follow_resize(self):
+		"""Built-in status lines stay on the last rows after a resize."""
+		vim = self.ProfileManager().getProfile('vim')
+
+		vim.resolveWindows(24, 80)
+		self.assertEqual(vim.getWindowAtPosition(23, 1).name, 'status')
+		self.assertEqual(vim.getWindowAtPosition(22, 1).name, 'editor')
+
+		vim.resolveWindows(40, 100)
+		self.assertEqual(vim.getWindowAtPosition(23, 1).name, 'editor')
+		self.assertEqual(vim.getWindowAtPosition(40, 1).name, 'status')
+
+	def test_terminal_dimensions_cached_until_resize(self):
+		"""The buffer is measured once per on-screen size."""
+		from globalPlugins.terminalAccess import GlobalPlugin
+
+		plugin = GlobalPlugin.__new__(GlobalPlugin)
+		terminal = Mock()
+		terminal.windowHandle = 1
+		terminal.location = (0, 0, 800, 600)
+		terminal.makeTextInfo.return_value.text = "ab\nabcd\n"
+
+		self.assertEqual(plugin._getTerminalDimensions(terminal), (2, 4))
+		self.assertEqual(plugin._getTerminalDimensions(terminal), (2, 4))
+		self.assertEqual(terminal.makeTextInfo.call_count, 1)
+
+		terminal.location = (0, 0, 1000, 600)
+		terminal.makeTextInfo.return_value.text = "a\nb\nc\nd"
+		self.assertEqual(plugin._getTerminalDimensions(terminal), (4, 1))
+
+	def test_terminal_dimensions_exclude_scrollback(self):
+		"""UIA terminals are measured from their visible ranges, not the whole buffer."""
+		from globalPlugins.terminalAccess import GlobalPlugin
+
+		plugin = GlobalPlugin.__new__(GlobalPlugin)
+		terminal = Mock()
+		terminal.windowHandle = 1
+		terminal.location = (0, 0, 800, 600)
+		terminal.makeTextInfo.return_value.text = "old\n" * 5000
+		ranges = terminal.UIATextPattern.GetVisibleRanges.return_value
+		ranges.length = 1
+		ranges.GetElement.return_value.GetText.return_value = "$ top\r\nload 0.5\r\nstatus\r\n"
+
+		self.assertEqual(plugin._getTerminalDimensions(terminal), (3, 8))
+		terminal.makeTextInfo.assert_not_called()
+		ranges.GetElement.assert_called_once_with(0)
+
+	def test_pane_analyzer_finds_tmux_split(self):
+		"""Box-drawing borders split the screen into panes; the layout is cached."""
+		from globalPlugins.terminalAccess import PaneLayoutAnalyzer
+
+		screen = "\n".join([
+			"$ vim main.py        \u2502$ htop",
+			"ls | grep x          \u2502cpu 5%",
+			"more --help          \u251c" + "\u2500" * 10,
+			"text                 \u2502$ tail log",
+			"more text            \u2502entry",
+		])
+		analyzer = PaneLayoutAnalyzer()
+		panes = analyzer.analyze(screen)
+		self.assertEqual(
+			[(p.top, p.bottom, p.left, p.right) for p in panes],
+			[(1, 5, 1, 21), (1, 2, 23, 32), (4, 5, 23, 32)],
+		)
+		# Same borders, different text: the previous layout is reused
+		self.assertIs(analyzer.analyze(screen.replace("cpu 5%", "cpu 9%")), panes)
+		self.assertEqual(analyzer.analyze("$ ls | grep -v x\nfile-a\nfile-b"), [])
+
+	def test_transient_windows_not_serialized(self):
+		"""Detected panes are matched after static windows and never saved."""
+		profile = self.ApplicationProfile('test')
+		profile.addWindow('status', 10, 10, 1, 80)
+		pane = self.WindowDefinition('pane 1', 1, 9, 1, 40)
+		profile.setTransientWindows([pane])
+
+		self.assertIs(profile.getWindowAtPosition(3, 5), pane)
+		self.assertEqual(profile.getWindowAtPosition(10, 5).name, 'status')
+		self.assertEqual(len(profile.toDict()['windows']), 1)
+		profile.setTransientWindows([])
+		self.assertIsNone(profile.getWindowAtPosition(3, 5))
+
 
 if __name__ == '__main__':
 	unittest.main()
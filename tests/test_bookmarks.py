@@ -110,3 +110,180 @@ def test_bookmark_manager_no_terminal():
 	assert manager.set_bookmark("1") is False
 	assert manager.jump_to_bookmark("1") is False
 	assert manager.list_bookmarks() == []
+
+
+class _OffsetInfo:
+	"""TextInfo stub addressing a shared buffer by character offset."""
+
+	def __init__(self, buffer, start, end=None):
+		self._buffer = buffer
+		self.start = start
+		self.end = len(buffer.text) if end is None else end
+
+	@property
+	def bookmark(self):
+		return self.start
+
+	@property
+	def text(self):
+		self._buffer.reads.append(self.end - self.start)
+		return self._buffer.text[self.start:self.end]
+
+	def copy(self):
+		return _OffsetInfo(self._buffer, self.start, self.end)
+
+	def expand(self, unit):
+		text = self._buffer.text
+		self.start = text.rfind('\n', 0, self.start) + 1
+		end = text.find('\n', self.start)
+		self.end = len(text) if end < 0 else end + 1
+
+	def collapse(self, end=False):
+		if end:
+			self.start = self.end
+		else:
+			self.end = self.start
+
+	def setEndPoint(self, other, which):
+		if which == "startToStart":
+			self.start = other.start
+		else:
+			self.end = other.start
+
+	def move(self, unit, count):
+		import textInfos
+		if unit == textInfos.UNIT_CHARACTER:
+			self.start += count
+			return count
+		text = self._buffer.text
+		moved = 0
+		while moved < count:
+			self.start = text.index('\n', self.start) + 1
+			moved += 1
+		while moved > count and self.start > 0:
+			self.start = text.rfind('\n', 0, self.start - 1) + 1
+			moved -= 1
+		self.end = self.start
+		return moved
+
+
+class _OffsetTerminal:
+	"""Terminal stub whose raw bookmarks are plain character offsets."""
+
+	def __init__(self, lines):
+		self.text = "\n".join(lines)
+		# Characters returned by each text read
+		self.reads = []
+		self.fullReads = 0
+
+	def makeTextInfo(self, arg):
+		import textInfos
+		if arg == textInfos.POSITION_ALL:
+			self.fullReads += 1
+			return _OffsetInfo(self, 0)
+		if arg == textInfos.POSITION_FIRST:
+			return _OffsetInfo(self, 0, 0)
+		return _OffsetInfo(self, arg, arg)
+
+
+def _bookmark_at(manager, terminal, row, column):
+	offset = sum(len(line) + 1 for line in terminal.text.split("\n")[:row]) + column
+	with patch('api.getReviewPosition', return_value=_OffsetInfo(terminal, offset, offset)):
+		assert manager.set_bookmark("1") is True
+
+
+def _setup_textinfos():
+	import textInfos
+	textInfos.POSITION_ALL = "all"
+	textInfos.POSITION_FIRST = "first"
+	textInfos.UNIT_LINE = "line"
+	textInfos.UNIT_CHARACTER = "character"
+
+
+def test_bookmark_relocated_after_scroll():
+	"""When lines roll off the top, the bookmark follows its content upward."""
+	from globalPlugins.terminalAccess import BookmarkManager
+
+	_setup_textinfos()
+	lines = [f"step {i}" for i in range(20)]
+	lines[12] = "error: link failed"
+	terminal = _OffsetTerminal(lines)
+	manager = BookmarkManager(terminal)
+	_bookmark_at(manager, terminal, 12, 7)
+
+	terminal.text = "\n".join(lines[5:] + ["step 20", "step 21"])
+	with patch('api.setReviewPosition') as mock_set_review:
+		assert manager.jump_to_bookmark("1") is True
+	pos = mock_set_review.call_args[0][0]
+	assert terminal.text[pos.start:].startswith("link failed")
+	assert manager._get_bookmark_dict()["1"].row == 7
+
+
+def test_bookmark_hint_used_when_content_unchanged():
+	"""Appended output leaves the raw hint valid, so no search is needed."""
+	from globalPlugins.terminalAccess import BookmarkAnchor, BookmarkManager
+
+	_setup_textinfos()
+	lines = [f"line {i}" for i in range(10)]
+	terminal = _OffsetTerminal(lines)
+	manager = BookmarkManager(terminal)
+	_bookmark_at(manager, terminal, 4, 0)
+	anchor = manager._get_bookmark_dict()["1"]
+
+	terminal.text += "\nmore output"
+	terminal.reads.clear()
+	terminal.fullReads = 0
+	with patch.object(BookmarkAnchor, 'find_row', side_effect=AssertionError):
+		with patch('api.setReviewPosition') as mock_set_review:
+			assert manager.jump_to_bookmark("1") is True
+	assert mock_set_review.call_args[0][0].start == anchor.hint
+	# Only the bookmarked row and the two above it were read
+	assert terminal.fullReads == 0
+	assert terminal.reads == [len("line 2\nline 3\nline 4\n")]
+
+
+def test_bookmark_relocation_reads_the_buffer_once():
+	"""A stale hint costs one buffer fetch, scanned once."""
+	from globalPlugins.terminalAccess import BookmarkManager
+
+	_setup_textinfos()
+	lines = [f"line {i}" for i in range(10)]
+	terminal = _OffsetTerminal(lines)
+	manager = BookmarkManager(terminal)
+	_bookmark_at(manager, terminal, 4, 2)
+
+	terminal.text = "\n".join(lines[1:])
+	terminal.fullReads = 0
+	with patch('api.setReviewPosition') as mock_set_review:
+		assert manager.jump_to_bookmark("1") is True
+	assert terminal.fullReads == 1
+	pos = mock_set_review.call_args[0][0]
+	assert terminal.text[pos.start:].startswith("ne 4")
+
+
+def test_bookmark_removed_when_content_cleared():
+	"""A cleared buffer no longer holds the content, so the bookmark is dropped."""
+	from globalPlugins.terminalAccess import BookmarkManager
+
+	_setup_textinfos()
+	terminal = _OffsetTerminal(["a", "b", "unique"])
+	manager = BookmarkManager(terminal)
+	_bookmark_at(manager, terminal, 2, 0)
+
+	terminal.text = "$ "
+	assert manager.jump_to_bookmark("1") is False
+	assert not manager.has_bookmark("1")
+
+
+def test_anchor_outward_search_on_large_buffer():
+	"""Relocation near the last known row is fast on a 50k-line buffer."""
+	import time
+	from globalPlugins.terminalAccess import BookmarkAnchor
+
+	lines = [f"[{i:05d}] compiling unit {i}" for i in range(50000)]
+	anchor = BookmarkAnchor(None, row=30000, context_hash=BookmarkAnchor.context_hash_at(lines, 30000))
+	scrolled = lines[100:]
+
+	start = time.perf_counter()
+	assert anchor.find_row(scrolled) == 29900
+	assert time.perf_counter() - start < 0.05
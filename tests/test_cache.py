@@ -172,5 +172,108 @@ class TestPositionCache(unittest.TestCase):
         self.assertEqual(result2, (20, 10))
 
 
+class TestContentGeneration(unittest.TestCase):
+    """Test the ContentGeneration authority and generation-aware caches."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        from globalPlugins import terminalAccess
+        self.terminalAccess = terminalAccess
+        self.generation = terminalAccess.ContentGeneration()
+
+    def test_observe_reports_first_changed_row(self):
+        """Appends, last-line rewrites and edits report where the change starts."""
+        gen = self.generation
+        self.assertEqual(gen.observe("a\nb\nc"), 0)
+        self.assertIsNone(gen.observe("a\nb\nc"))
+        self.assertEqual(gen.observe("a\nb\nc\nd"), 2)
+        self.assertEqual(gen.observe("a\nb\nc\ne"), 3)
+        self.assertEqual(gen.observe("a\nX\nc\ne"), 1)
+        self.assertEqual(gen.value, 4)
+
+    def test_rows_above_change_stay_current(self):
+        """Only rows at or below the first changed row are invalidated."""
+        gen = self.generation
+        gen.observe("one\ntwo\nthree")
+        filled_at = gen.value
+        gen.observe("one\ntwo\nthree\nfour")
+
+        self.assertTrue(gen.is_row_current(1, filled_at))
+        self.assertFalse(gen.is_row_current(2, filled_at))
+        gen.advance(0)
+        self.assertFalse(gen.is_row_current(0, filled_at))
+
+    def test_history_overflow_invalidates_everything(self):
+        """Generations older than the kept history are treated as changed from row 0."""
+        gen = self.generation
+        filled_at = gen.value
+        for _ in range(gen.HISTORY_SIZE + 1):
+            gen.advance(100)
+        self.assertEqual(gen.first_changed_row_since(filled_at), 0)
+
+    def test_position_cache_uses_generation_instead_of_timeout(self):
+        """Generation-aware entries outlive the timeout while snapshots confirm them."""
+        self.generation.observe("unchanged")
+        cache = self.terminalAccess.PositionCache(self.generation)
+        cache.set("upper", 2, 1)
+        cache.set("lower", 9, 1)
+
+        later = time.time() + 60
+        with patch('time.time', return_value=later):
+            self.generation.observe("unchanged")
+        with patch('time.time', return_value=later + 0.5):
+            self.assertEqual(cache.get("upper"), (2, 1))
+        self.generation.advance(5)
+
+        self.assertEqual(cache.get("upper"), (2, 1))
+        self.assertIsNone(cache.get("lower"))
+
+    def test_position_cache_expires_unconfirmed_entries(self):
+        """Without a snapshot to confirm the generation, entries fall back to the timeout."""
+        cache = self.terminalAccess.PositionCache(self.generation)
+        cache.set("upper", 2, 1)
+
+        with patch('time.time', return_value=time.time() + cache.CACHE_TIMEOUT_S + 1):
+            self.assertIsNone(cache.get("upper"))
+
+    def test_output_search_reruns_only_when_matches_are_stale(self):
+        """Search results are refreshed when content at or above a match changes."""
+        import textInfos
+        textInfos.POSITION_ALL = "all"
+        textInfos.POSITION_FIRST = "first"
+        textInfos.UNIT_LINE = "line"
+
+        class _Info:
+            bookmark = None
+
+            def __init__(self, text):
+                self.text = text
+
+            def move(self, unit, count):
+                return True
+
+            def copy(self):
+                return self
+
+        terminal = Mock()
+        terminal.text = "ok\nerror one\nok"
+        terminal.makeTextInfo = lambda arg: _Info(terminal.text)
+        self.generation.observe(terminal.text)
+        manager = self.terminalAccess.OutputSearchManager(terminal, generation=self.generation)
+        self.assertEqual(manager.search("error"), 1)
+
+        # New output below the match keeps the results
+        terminal.text += "\nerror two"
+        self.generation.observe(terminal.text)
+        manager.first_match()
+        self.assertEqual(manager.get_match_count(), 1)
+
+        # A change above the match re-runs the search
+        terminal.text = "error zero\n" + terminal.text
+        self.generation.observe(terminal.text)
+        manager.first_match()
+        self.assertEqual(manager.get_match_count(), 3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,471 @@
+"""Tests for column-preserving, table, line and word review navigation."""
+
+import contextlib
+import time
+from unittest.mock import Mock, patch
+
+import api
+import pytest
+import speech
+import textInfos
+import ui
+
+
+def _setup_textinfos():
+	"""Ensure textInfos constants are set."""
+	textInfos.POSITION_ALL = "all"
+	textInfos.POSITION_FIRST = "first"
+	textInfos.UNIT_LINE = "line"
+	textInfos.UNIT_CHARACTER = "character"
+
+
+class _Position:
+	"""TextInfo stub over a list of lines; a range ends before line `last`."""
+
+	def __init__(self, terminal, line=0, char=0, last=None):
+		self.terminal = terminal
+		self.line = line
+		self.char = char
+		self.last = last
+
+	@property
+	def bookmark(self):
+		return (self.line, self.char)
+
+	@property
+	def text(self):
+		if self.last is None:
+			return "\n".join(self.terminal.lines)
+		self.terminal.rangeReads += 1
+		return "".join(line + "\r\n" for line in self.terminal.lines[self.line:self.last])
+
+	def copy(self):
+		return _Position(self.terminal, self.line, self.char, self.last)
+
+	def expand(self, unit):
+		if unit == textInfos.UNIT_LINE:
+			self.char = 0
+
+	def collapse(self, end=False):
+		if end:
+			self.line, self.char = self.line + 1, 0
+		self.last = None
+
+	def setEndPoint(self, other, which):
+		self.last = other.line
+
+	def move(self, unit, count):
+		self.terminal.moves += 1
+		if unit == textInfos.UNIT_CHARACTER:
+			self.char += count
+			return count
+		target = min(max(self.line + count, 0), len(self.terminal.lines) - 1)
+		moved = target - self.line
+		self.line, self.char = target, 0
+		return moved
+
+
+class _Terminal:
+	"""Terminal stub counting buffer fetches and moves."""
+
+	def __init__(self, lines):
+		self.lines = lines
+		self.fetches = 0
+		self.moves = 0
+		self.rangeReads = 0
+
+	def makeTextInfo(self, arg):
+		if arg == textInfos.POSITION_ALL:
+			self.fetches += 1
+		return _Position(self)
+
+
+TABLE = [
+	"NAME     READY  STATUS",
+	"api-1    1/1    Running",
+	"db       0/1",
+	"中文     1/1    Pending",
+]
+
+
+def _plugin(terminal, line, char):
+	from globalPlugins.terminalAccess import (
+		ContentGeneration,
+		GlobalPlugin,
+		LineReadAheadCache,
+		TableDetector,
+		WordSegmenter,
+	)
+
+	plugin = GlobalPlugin.__new__(GlobalPlugin)
+	plugin._boundTerminal = terminal
+	plugin._generation = ContentGeneration()
+	plugin._tableDetector = TableDetector()
+	plugin._lineCache = LineReadAheadCache(plugin._generation)
+	plugin._wordSegmenter = WordSegmenter()
+	plugin._screenGrid = None
+	plugin._screenGridGeneration = None
+	plugin._screenGridTime = 0.0
+	plugin._reviewMemo = None
+	plugin._positionCalculator = Mock()
+	plugin._positionCalculator.calculate.return_value = (line + 1, char + 1)
+	api.getReviewPosition.return_value = _Position(terminal, line, char)
+	return plugin
+
+
+@contextlib.contextmanager
+def _speech():
+	"""Record ui.message texts and the lines reported through NVDA's speech, in order."""
+	spoken = []
+
+	def speakTextInfo(info, unit=None, reason=None):
+		assert unit == textInfos.UNIT_LINE
+		spoken.append(info.terminal.lines[info.line])
+
+	with patch.object(ui, "message", side_effect=spoken.append):
+		with patch.object(speech, "speakTextInfo", side_effect=speakTextInfo):
+			yield spoken
+
+
+@pytest.fixture(autouse=True)
+def review_position():
+	"""Make setReviewPosition update what getReviewPosition returns."""
+	_setup_textinfos()
+	with patch.object(api, "setReviewPosition", side_effect=lambda info: setattr(
+		api.getReviewPosition, "return_value", info
+	)):
+		yield
+
+
+def test_column_kept_across_rows_and_wide_characters():
+	"""The display column sticks through short rows and double-width text."""
+	terminal = _Terminal(TABLE)
+	plugin = _plugin(terminal, 0, 16)
+	ui.message.reset_mock()
+
+	plugin._moveReviewInColumn(1)
+	assert ui.message.call_args[0][0] == "Running"
+	plugin._moveReviewInColumn(1)
+	assert ui.message.call_args[0][0] == "Blank"
+	plugin._moveReviewInColumn(1)
+	# Two wide characters take four columns but only two string indices
+	assert api.getReviewPosition.return_value.bookmark == (3, 14)
+	assert ui.message.call_args[0][0] == "Pending"
+
+	plugin._moveReviewInColumn(1)
+	assert ui.message.call_args[0][0] == "Bottom"
+
+
+def test_repeated_moves_need_no_position_calculation():
+	"""After the first press each move is a lookup plus relative moves."""
+	terminal = _Terminal(TABLE)
+	plugin = _plugin(terminal, 0, 9)
+
+	plugin._moveReviewInColumn(1)
+	plugin._moveReviewInColumn(1)
+	plugin._moveReviewInColumn(-1)
+
+	assert plugin._positionCalculator.calculate.call_count == 1
+	assert terminal.fetches == 1
+	assert ui.message.call_args[0][0] == "1/1"
+
+
+def test_column_moves_read_terminal_words():
+	"""The word under a column move has the same boundaries as word review."""
+	terminal = _Terminal(["cat /etc/hosts|grep x", "ls  --all;echo"])
+	plugin = _plugin(terminal, 0, 5)
+	plugin._moveReviewInColumn(1)
+	assert ui.message.call_args[0][0] == "--all"
+	plugin._moveReviewInColumn(-1)
+	assert ui.message.call_args[0][0] == "/etc/hosts"
+
+	plugin = _plugin(terminal, 0, 2)
+	plugin._moveReviewInColumn(1)
+	assert ui.message.call_args[0][0] == "Blank"
+
+
+PODS = [
+	"$ kubectl get pods",
+	"NAME                     READY   STATUS    RESTARTS      AGE",
+	"api-7d9f8b6c5d-x2x9z     1/1     Running   0             3d",
+	"worker-5c8d7f9b4-abcde   0/1     Pending   5 (2m ago)    10m",
+	"",
+	"$ ps aux",
+	"USER         PID %CPU COMMAND",
+	"root           1  0.0 /sbin/init splash",
+	"root         412  1.2 [kworker/0:1H]",
+]
+
+
+def test_table_columns_from_alignment():
+	"""Columns follow whitespace alignment; the prompt above is excluded."""
+	from globalPlugins.terminalAccess import ScreenGrid, TableDetector
+
+	grid = ScreenGrid("\n".join(PODS))
+	detector = TableDetector()
+
+	layout = detector.detect(grid, 3)
+	assert (layout.top, layout.bottom) == (2, 4)
+	assert layout.headers == ["NAME", "READY", "STATUS", "RESTARTS", "AGE"]
+	assert layout.cell(grid, 4, 3) == "5 (2m ago)"
+
+	layout = detector.detect(grid, 8)
+	assert layout.headers == ["USER", "PID", "%CPU", "COMMAND"]
+	assert layout.cell(grid, 8, 3) == "/sbin/init splash"
+	# Right-aligned numbers start where their digits start
+	assert layout.cellStart(grid, 8, 1) == 16
+
+	assert detector.detect(grid, 1) is None
+	assert detector.detect(grid, 5) is None
+
+
+def test_table_headers_wider_than_values_kept_whole():
+	"""A header longer than every value under it is not cut to the values' width."""
+	from globalPlugins.terminalAccess import ScreenGrid, TableDetector
+
+	pods = [PODS[1]] + [f"api-{i:02d}                   1/1     Running   0             3d" for i in range(18)]
+	grid = ScreenGrid("\n".join(pods))
+
+	layout = TableDetector().detect(grid, 10)
+	assert layout.headers == ["NAME", "READY", "STATUS", "RESTARTS", "AGE"]
+	assert layout.cell(grid, 10, 1) == "1/1"
+	assert layout.cell(grid, 10, 3) == "0"
+
+
+def test_long_table_keeps_its_header():
+	"""Far down a long listing the first row of the block is still the header."""
+	from globalPlugins.terminalAccess import ScreenGrid, TableDetector
+
+	rows = ["$ ps aux", "USER         PID %CPU COMMAND"]
+	rows += [f"root    {pid:8d}  0.0 /usr/bin/worker --id {pid}" for pid in range(300)]
+	grid = ScreenGrid("\n".join(rows))
+
+	layout = TableDetector().detect(grid, 250)
+	assert (layout.top, layout.bottom) == (2, 302)
+	assert layout.headers == ["USER", "PID", "%CPU", "COMMAND"]
+	assert layout.cell(grid, 250, 3) == "/usr/bin/worker --id 247"
+
+
+def test_table_layout_cached_per_block():
+	"""An unchanged block reuses its inferred columns."""
+	from globalPlugins.terminalAccess import ScreenGrid, TableDetector
+
+	detector = TableDetector()
+	with patch.object(TableDetector, "_inferColumns", wraps=detector._inferColumns) as infer:
+		detector.detect(ScreenGrid("\n".join(PODS)), 2)
+		detector.detect(ScreenGrid("\n".join(PODS)), 4)
+		assert infer.call_count == 1
+		detector.detect(ScreenGrid("\n".join(PODS).replace("Pending", "Running")), 4)
+		assert infer.call_count == 2
+
+
+def test_cell_navigation_reads_header_on_column_change():
+	"""Moving across columns reads the header; moving down reads the cell."""
+	terminal = _Terminal(PODS)
+	plugin = _plugin(terminal, 2, 0)
+
+	plugin._moveTableCell(0, 1)
+	assert ui.message.call_args[0][0] == "READY: 1/1"
+	plugin._moveTableCell(1, 0)
+	assert ui.message.call_args[0][0] == "0/1"
+	plugin._moveTableCell(1, 0)
+	assert ui.message.call_args[0][0] == "Bottom of table"
+	plugin._moveTableCell(0, 2)
+	assert ui.message.call_args[0][0] == "RESTARTS: 5 (2m ago)"
+	assert plugin._positionCalculator.calculate.call_count == 1
+
+
+SOURCE = [("\t" * (i % 3)) + f"line {i}" if i % 7 else "" for i in range(100)]
+
+
+def test_line_reads_served_from_read_ahead_window(reset_config):
+	"""Neighbouring lines come from one range read; indentation is the new line's."""
+	import config
+
+	config.conf["terminalAccess"]["indentationOnLineRead"] = True
+	terminal = _Terminal(SOURCE)
+	plugin = _plugin(terminal, 50, 0)
+	review = Mock()
+	with _speech() as spoken:
+		plugin._readLineWithIndentation(Mock(), review, 0)
+		plugin._readLineWithIndentation(Mock(), review, 1)
+		plugin._readLineWithIndentation(Mock(), review, 1)
+		plugin._readLineWithIndentation(Mock(), review, -1)
+
+	review.assert_not_called()
+	assert spoken == ["\t\tline 50", "2 tabs", "line 51", "\tline 52", "1 tab", "line 51"]
+	assert api.getReviewPosition.return_value.line == 51
+	assert terminal.rangeReads == 1
+	assert plugin._positionCalculator.calculate.call_count == 1
+
+
+def test_line_cache_refilled_after_change_and_stops_at_top(reset_config):
+	"""A change above the window forces a new read; the first line reports Top."""
+	terminal = _Terminal(SOURCE)
+	plugin = _plugin(terminal, 1, 0)
+	review = Mock()
+	with _speech() as spoken:
+		plugin._readLineWithIndentation(Mock(), review, -1)
+		plugin._readLineWithIndentation(Mock(), review, -1)
+		assert spoken == ["", "Top", ""]
+		assert terminal.rangeReads == 1
+
+		terminal.lines = ["changed"] + SOURCE[1:]
+		plugin._generation.advance(0)
+		plugin._positionCalculator.calculate.return_value = (1, 1)
+		plugin._readLineWithIndentation(Mock(), review, 1)
+	assert spoken[-1] == "\tline 1"
+	assert terminal.rangeReads == 2
+	review.assert_not_called()
+
+
+def test_redraw_without_caret_events_is_read_after_timeout():
+	"""A full-screen redraw that advanced no generation is picked up once the caches expire."""
+	terminal = _Terminal(list(PODS))
+	plugin = _plugin(terminal, 2, 0)
+	plugin._moveTableCell(0, 2)
+	assert ui.message.call_args[0][0] == "STATUS: Running"
+	review = Mock()
+	plugin._readLineWithIndentation(Mock(), review, 0)
+	terminal.lines[3] = terminal.lines[3].replace("Pending", "Running")
+	terminal.lines[2] = "htop redrew this line"
+
+	plugin._moveTableCell(1, 0)
+	assert ui.message.call_args[0][0] == "Pending"
+	# The remembered review position expires too; locate the row again
+	plugin._positionCalculator.calculate.return_value = (4, 34)
+	with patch("time.time", return_value=time.time() + 60):
+		plugin._moveTableCell(0, 0)
+		assert ui.message.call_args[0][0] == "Running"
+		with _speech() as spoken:
+			plugin._readLineWithIndentation(Mock(), review, -1)
+		assert spoken == ["htop redrew this line"]
+		assert plugin._lineCache.get(3) == "htop redrew this line"
+	assert terminal.fetches == 2
+	assert terminal.rangeReads == 2
+
+
+def test_switching_terminals_drops_cached_content():
+	"""Rows cached for one terminal are not read back after focus moves to another."""
+	from globalPlugins.terminalAccess import GlobalPlugin
+
+	with patch('gui.settingsDialogs.NVDASettingsDialog'):
+		plugin = GlobalPlugin()
+	plugin.isTerminalApp = Mock(return_value=True)
+	plugin._updateGestureBindingsForFocus = Mock(return_value=True)
+	plugin._positionCalculator = Mock()
+	plugin._positionCalculator.calculate.return_value = (1, 1)
+	first = _Terminal(["first terminal", "same"])
+	second = _Terminal(["second terminal", "same"])
+	for terminal in (first, second):
+		terminal.appModule = Mock(appName="windowsterminal")
+
+	review = Mock()
+	plugin.event_gainFocus(first, Mock())
+	plugin._readLineWithIndentation(Mock(), review, 0)
+	assert plugin._lineCache.get(1) == "first terminal"
+	plugin._rememberReviewPosition(api.getReviewPosition(), 1, 1)
+
+	plugin.event_gainFocus(second, Mock())
+	assert plugin._reviewMemo is None
+	assert plugin._lineCache.get(1) is None
+	with _speech() as spoken:
+		plugin._readLineWithIndentation(Mock(), review, 0)
+	assert spoken == ["second terminal"]
+	assert plugin._lineCache.get(1) == "second terminal"
+	assert second.rangeReads == 1
+	plugin._positionCalculator.clear_cache.assert_called()
+
+
+def test_line_read_falls_back_without_position():
+	"""NVDA's review command is used when the row cannot be located."""
+	terminal = _Terminal(SOURCE)
+	plugin = _plugin(terminal, 0, 0)
+	plugin._positionCalculator.calculate.return_value = (0, 0)
+	review = Mock()
+	plugin._readLineWithIndentation(Mock(), review, 1)
+	review.assert_called_once()
+
+
+def test_word_segmentation_keeps_paths_urls_and_options():
+	"""Paths, URLs and options are single words; other punctuation stands alone."""
+	from globalPlugins.terminalAccess import WordSegmenter
+
+	segmenter = WordSegmenter()
+	line = "pip install --no-cache-dir https://x.org/a?b=1 && cat C:\\tmp\\log.txt"
+	starts, ends = segmenter.segment(line)
+	assert [line[a:b] for a, b in zip(starts, ends)] == [
+		"pip", "install", "--no-cache-dir", "https://x.org/a?b=1", "&&", "cat", "C:\\tmp\\log.txt",
+	]
+	assert segmenter.wordIndex(line, 14) == (2, True)
+	assert segmenter.wordIndex(line, 3) == (0, False)
+
+	segmenter.setWordCharacters("")
+	starts, ends = segmenter.segment("--no-cache")
+	assert [(a, b) for a, b in zip(starts, ends)] == [(0, 2), (2, 4), (4, 5), (5, 10)]
+
+
+def test_word_segmentation_cached_per_line():
+	"""A line is scanned once until the word characters change."""
+	from globalPlugins.terminalAccess import WordSegmenter
+
+	segmenter = WordSegmenter()
+	assert segmenter.segment("ls -la") is segmenter.segment("ls -la")
+	first = segmenter.segment("ls -la")
+	segmenter.setWordCharacters("")
+	assert segmenter.segment("ls -la") is not first
+
+
+SHELL = [
+	"$ git push --force-with-lease origin",
+	"",
+	"remote: see https://example.com/pr?id=7",
+]
+
+
+def test_word_navigation_crosses_lines_and_uses_cached_text():
+	"""Word moves use the line cache and continue on the next line with words."""
+	terminal = _Terminal(SHELL)
+	plugin = _plugin(terminal, 0, 6)
+	spoken = []
+	with patch.object(ui, "message", side_effect=spoken.append):
+		for delta in (0, 1, 1, 1, 1, -1, 1):
+			assert plugin._readReviewWord(delta) is True
+
+	assert spoken == [
+		"push", "--force-with-lease", "origin", "remote:", "see", "remote:", "see",
+	]
+	assert api.getReviewPosition.return_value.bookmark == (2, 8)
+	assert terminal.rangeReads == 1
+	assert plugin._positionCalculator.calculate.call_count == 1
+
+
+def test_word_navigation_reads_past_the_window_edge():
+	"""Blank rows running past the cached window are searched in further windows."""
+	terminal = _Terminal(["make all"] + [""] * 54 + ["ok done"] + [""] * 4)
+	plugin = _plugin(terminal, 0, 5)
+	spoken = []
+	with patch.object(ui, "message", side_effect=spoken.append):
+		for delta in (1, 1, 1, -1, -1):
+			assert plugin._readReviewWord(delta) is True
+
+	assert spoken == ["ok", "done", "Bottom", "ok", "all"]
+	assert api.getReviewPosition.return_value.bookmark == (0, 5)
+
+
+def test_word_navigation_edges_and_blank():
+	"""Past the last word reports Bottom; on whitespace the current word is blank."""
+	terminal = _Terminal(SHELL)
+	plugin = _plugin(terminal, 2, 9)
+	spoken = []
+	with patch.object(ui, "message", side_effect=spoken.append):
+		plugin._readReviewWord(1)
+		plugin._readReviewWord(1)
+		plugin._readReviewWord(-1)
+		plugin._readReviewWord(-1)
+	assert spoken == ["https://example.com/pr?id=7", "Bottom", "see", "remote:"]
+
+	plugin = _plugin(terminal, 0, 5)
+	ui.message.reset_mock()
+	plugin._readReviewWord(0)
+	assert ui.message.call_args[0][0] == "Blank"
@@ -0,0 +1,535 @@
+"""Tests for command history detection."""
+
+import textInfos
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class LineCursor:
+	"""TextInfo stub whose bookmark is the current line index."""
+
+	def __init__(self, line_index=0):
+		self.line_index = line_index
+
+	@property
+	def bookmark(self):
+		return self.line_index
+
+	def move(self, unit, count):
+		self.line_index += count
+		return True
+
+	def copy(self):
+		return LineCursor(self.line_index)
+
+
+class BufferTerminal:
+	"""Terminal stub over a mutable text buffer."""
+
+	def __init__(self, text):
+		self.text = text
+
+	def makeTextInfo(self, arg):
+		if arg == textInfos.POSITION_ALL:
+			info = LineCursor()
+			info.text = self.text
+			return info
+		if arg == textInfos.POSITION_FIRST:
+			return LineCursor()
+		return LineCursor(arg)
+
+
+def _setup_textinfos():
+	"""Ensure textInfos constants are set."""
+	textInfos.POSITION_ALL = "all"
+	textInfos.POSITION_FIRST = "first"
+	textInfos.UNIT_LINE = "line"
+
+
+PROMPT_SAMPLES = [
+	"user@host:~/src$ git status",
+	"root@box:/etc# vim hosts",
+	"$ ls -la",
+	"# apt update",
+	"PS C:\\Users\\me> Get-ChildItem",
+	"PS /home/me> pwsh -v",
+	"PS> dir",
+	"C:\\> dir /s",
+	"D:\\Users\\name>cd ..",
+	"mysql> SELECT 1;",
+	"irb:001> puts 1",
+	"12:00:01 INFO started",
+	"plain output line",
+	"Compiling foo v0.1.0",
+	"   indented text",
+	"",
+	"PS",
+	"a>",
+]
+
+
+# ---------------------------------------------------------------------------
+# Combined prompt matcher
+# ---------------------------------------------------------------------------
+
+def _sequential_match(line):
+	"""Reference behaviour: first of the individual patterns to match wins."""
+	from globalPlugins.terminalAccess import _PROMPT_PATTERNS
+
+	for pattern in _PROMPT_PATTERNS:
+		match = pattern.match(line)
+		if match:
+			return match.group(1).strip()
+	return None
+
+
+def test_combined_matcher_agrees_with_individual_patterns():
+	"""One alternation extracts the same command as trying each pattern in order."""
+	from globalPlugins.terminalAccess import _match_prompt_command
+
+	for sample in PROMPT_SAMPLES:
+		line = sample.strip()
+		assert _match_prompt_command(line) == _sequential_match(line), sample
+
+
+def test_prefilter_rejects_plain_output_without_regex():
+	"""Lines with no ':' or '>' before the first space never reach the regex."""
+	from globalPlugins import terminalAccess
+
+	class ExplodingPattern:
+		def match(self, line):
+			raise AssertionError(f"regex ran for {line!r}")
+
+	original = terminalAccess._PROMPT_COMBINED_RE
+	terminalAccess._PROMPT_COMBINED_RE = ExplodingPattern()
+	try:
+		for line in ("plain output line", "Compiling foo v0.1.0", "a b: c", "x -> y"):
+			assert terminalAccess._match_prompt_command(line) is None
+	finally:
+		terminalAccess._PROMPT_COMBINED_RE = original
+
+
+def test_detect_and_store_commands_uses_combined_matcher():
+	"""Detected commands carry their line numbers and skip duplicates."""
+	_setup_textinfos()
+
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	terminal = BufferTerminal("$ make\nbuilding...\n$ make\nok\nuser@h:~$ ls\nfile\n$ x")
+	manager = CommandHistoryManager(terminal)
+
+	assert manager.detect_and_store_commands() == 2
+	assert [(line, cmd) for line, cmd, *_ in manager._history] == [(0, "make"), (4, "ls")]
+
+
+# ---------------------------------------------------------------------------
+# Incremental ingestion
+# ---------------------------------------------------------------------------
+
+def _commands(manager):
+	return [(row, cmd) for row, cmd, *_ in manager._history]
+
+
+def test_ingest_scans_only_appended_lines():
+	"""A second snapshot only contributes the lines appended since the first."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	assert manager.ingest_text("$ ls\na.txt\n$ ") == 1
+
+	calls = []
+	import globalPlugins.terminalAccess as ta
+	original = ta._match_prompt_command
+
+	def _counting(line):
+		calls.append(line)
+		return original(line)
+
+	ta._match_prompt_command = _counting
+	try:
+		assert manager.ingest_text("$ ls\na.txt\n$ make\nok\n$ ") == 1
+	finally:
+		ta._match_prompt_command = original
+
+	# The live prompt row is only classified, with a placeholder command
+	assert calls == ["$ x", "$ make", "ok"]
+	assert _commands(manager) == [(0, "ls"), (2, "make")]
+
+
+def test_final_line_waits_until_complete():
+	"""A prompt still being typed is not recorded until output follows it."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	assert manager.ingest_text("$ ma") == 0
+	assert manager.ingest_text("$ make") == 0
+	assert manager.ingest_text("$ make\nbuilding") == 1
+	assert _commands(manager) == [(0, "make")]
+
+
+def test_unchanged_snapshot_is_skipped():
+	"""Identical snapshots return immediately unless forced."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	text = "$ ls\nout\n"
+	assert manager.ingest_text(text) == 1
+	manager._history.clear()
+	assert manager.ingest_text(text) == 0
+	assert manager.ingest_text(text, force=True) == 0  # Anchor prevents duplicates
+
+
+def test_scrollback_rollover_shifts_rows_without_duplicates():
+	"""Lines rolling off the top shift stored rows instead of re-detecting commands."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	lines = ["$ one", "x", "$ two", "y", "$ three", "z", ""]
+	manager.ingest_text("\n".join(lines))
+	assert _commands(manager) == [(0, "one"), (2, "two"), (4, "three")]
+
+	# Three lines scroll away while two new lines arrive
+	lines = lines[3:-1] + ["$ four", "w", ""]
+	assert manager.ingest_text("\n".join(lines)) == 1
+	assert _commands(manager) == [(1, "three"), (3, "four")]
+
+
+def test_clear_drops_stale_entries_and_scans_new_content():
+	"""After clear, old rows are gone and only the new buffer is scanned."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	manager.ingest_text("$ one\nx\n$ two\ny\n")
+	assert manager.ingest_text("$ three\nz\n") == 1
+	assert _commands(manager) == [(0, "three")]
+
+
+def test_blank_padding_rows_do_not_anchor_the_scan():
+	"""Output written into blank padding rows is scanned, not skipped."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	padding = [""] * 10
+	assert manager.ingest_text("\n".join(["$ one", "x"] + padding)) == 1
+	assert manager.ingest_text("\n".join(["$ one", "x", "$ two", "y"] + padding[2:])) == 1
+	assert _commands(manager) == [(0, "one"), (2, "two")]
+
+
+def test_typing_at_a_prompt_above_blank_rows_keeps_the_anchor():
+	"""The live prompt row is neither stored nor anchored while it is typed into."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	padding = [""] * 10
+	assert manager.ingest_text("\n".join(["$ make", "ok", "$ "] + padding)) == 1
+	anchor = manager._scan_anchor
+	manager._current_index = 0
+
+	for typed in ("m", "ma", "mak"):
+		assert manager.ingest_text("\n".join(["$ make", "ok", f"$ {typed}"] + padding)) == 0
+		assert manager._scan_anchor == anchor
+	assert _commands(manager) == [(0, "make")]
+	assert manager._current_index == 0
+
+	assert manager.ingest_text("\n".join(["$ make", "ok", "$ make", "ok", "$ "] + padding[2:])) == 0
+	assert manager.ingest_text("\n".join(["$ make", "ok", "$ make", "ok", "$ ls", "a", "$ "])) == 1
+	assert _commands(manager) == [(0, "make"), (4, "ls")]
+
+
+def test_jump_resolves_current_row():
+	"""Jumping to a command positions by its (rebased) row."""
+	_setup_textinfos()
+
+	import api
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	terminal = BufferTerminal("a\nb\n$ ls\nout\n")
+	manager = CommandHistoryManager(terminal)
+	manager.detect_and_store_commands()
+	terminal.text = "b\n$ ls\nout\nmore\n"
+	manager.detect_and_store_commands()
+
+	api.setReviewPosition.reset_mock()
+	assert manager.jump_to_command(1) is True
+	assert api.setReviewPosition.call_args[0][0].line_index == 1
+
+
+def test_caret_feed_ingests_history_automatically():
+	"""Once history is in use, caret snapshots reach the history manager."""
+	_setup_textinfos()
+
+	from unittest.mock import Mock
+	from globalPlugins.terminalAccess import (
+		CommandHistoryManager, ContentGeneration, GlobalPlugin, TerminalEventBus,
+	)
+
+	terminal = BufferTerminal("$ make\nbuilding\n")
+	plugin = GlobalPlugin.__new__(GlobalPlugin)
+	plugin._newOutputAnnouncer = Mock()
+	plugin._commandHistoryManager = CommandHistoryManager(terminal)
+	plugin._cursorTrackingTimer = None
+	plugin._generation = ContentGeneration()
+	plugin._isNewOutputActive = lambda: True
+	plugin._isCursorTrackingActive = lambda: False
+	plugin._eventBus = TerminalEventBus(observer=plugin._observeSnapshot)
+	plugin._subscribeFeatures()
+	plugin._commandHistoryManager.detect_and_store_commands()
+
+	terminal.text = "$ make\nbuilding\n$ ls\nfile\n"
+	plugin._eventBus.publish(TerminalEventBus.EVENT_CARET, terminal)
+
+	plugin._newOutputAnnouncer.feed.assert_called_once_with("$ make\nbuilding\n$ ls\nfile\n")
+	assert plugin._commandHistoryManager.list_history() == [(1, "make"), (2, "ls")]
+
+
+# ---------------------------------------------------------------------------
+# Command block index
+# ---------------------------------------------------------------------------
+
+def test_block_index_tracks_output_ranges():
+	"""Each block's output runs to the row before the next prompt."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	manager.ingest_text("$ ls\na\nb\n$ pwd\n/home\n$ true\n$ ")
+
+	assert list(manager._history) == [
+		(0, "ls", 1, 2),
+		(3, "pwd", 4, 4),
+		(5, "true", 6, 5),
+	]
+	assert manager.get_output_text(0) == "a\nb"
+	assert manager.get_output_text(2) == ""
+
+
+def test_newest_block_output_grows_with_new_lines():
+	"""Output appended after the newest prompt extends its block."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	manager.ingest_text("$ make\nstep 1\n")
+	manager.ingest_text("$ make\nstep 1\nstep 2\n\x1b[32mdone\x1b[0m\n")
+
+	assert manager.get_block() == (0, "make", 1, 3)
+	assert manager.get_output_text() == "step 1\nstep 2\ndone"
+
+
+def test_block_index_is_bounded_and_shifts():
+	"""Oldest blocks are dropped past the limit and rows shift on rollover."""
+	from globalPlugins.terminalAccess import CommandBlockIndex
+
+	index = CommandBlockIndex(max_blocks=2)
+	index.append(0, "a")
+	index.append(2, "b")
+	index.append(5, "c")
+	index.extend_last_output(7)
+	assert list(index) == [(2, "b", 3, 4), (5, "c", 6, 7)]
+
+	index.shift(3)
+	assert list(index) == [(2, "c", 3, 4)]
+
+
+def test_jump_to_output_uses_row_lookup():
+	"""Output jumps resolve the target row with a single move."""
+	_setup_textinfos()
+
+	import api
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	moves = []
+
+	class RecordingCursor(LineCursor):
+		def move(self, unit, count):
+			moves.append(count)
+			return super().move(unit, count)
+
+	class RecordingTerminal(BufferTerminal):
+		def makeTextInfo(self, arg):
+			info = super().makeTextInfo(arg)
+			if arg == textInfos.POSITION_FIRST:
+				return RecordingCursor()
+			return info
+
+	manager = CommandHistoryManager(RecordingTerminal("$ ls\na\nb\nc\n$ "))
+	manager.detect_and_store_commands()
+
+	api.setReviewPosition.reset_mock()
+	assert manager.jump_to_output() == 1
+	assert manager.jump_to_output(at_end=True) == 3
+	assert moves == [1, 3]
+	assert api.setReviewPosition.call_args[0][0].line_index == 3
+
+
+def test_output_scripts_act_on_navigated_command():
+	"""The navigated command, not only the newest, is used for output actions."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	manager.ingest_text("$ ls\na\n$ pwd\n/home\n$ ")
+	manager._current_index = 0
+
+	assert manager.get_output_text() == "a"
+	manager._current_index = -1
+	assert manager.get_output_text() == "/home"
+
+
+def test_copy_command_output_script():
+	"""The copy script puts the newest command's output on the clipboard."""
+	from unittest.mock import Mock, patch
+	from globalPlugins.terminalAccess import CommandHistoryManager, GlobalPlugin
+
+	_setup_textinfos()
+	plugin = GlobalPlugin.__new__(GlobalPlugin)
+	plugin.isTerminalApp = Mock(return_value=True)
+	plugin._commandHistoryManager = CommandHistoryManager(BufferTerminal("$ echo hi\nhi\n$ "))
+	plugin._copyToClipboard = Mock(return_value=True)
+
+	with patch("globalPlugins.terminalAccess.ui") as mock_ui:
+		plugin.script_copyCommandOutput(Mock())
+
+	plugin._copyToClipboard.assert_called_once_with("hi")
+	mock_ui.message.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# OSC 133 shell-integration marks
+# ---------------------------------------------------------------------------
+
+def _osc(kind):
+	return f"\x1b]133;{kind}\x07"
+
+
+def test_strip_ansi_with_marks_reports_clean_offsets():
+	"""OSC 133 marks are removed and located in the stripped text."""
+	from globalPlugins.terminalAccess import ANSIParser
+
+	text = f"{_osc('A')}\x1b[32m~\x1b[0m $ {_osc('B')}ls{_osc('C')}"
+	clean, marks = ANSIParser.stripANSIWithMarks(text)
+
+	assert clean == "~ $ ls"
+	assert marks == [("A", 0), ("B", 4), ("C", 6)]
+	assert clean == ANSIParser.stripANSI(text)
+	assert ANSIParser.stripANSIWithMarks("plain") == ("plain", [])
+
+
+def test_shell_integration_marks_define_blocks_exactly():
+	"""Marks give command text and output ranges without prompt heuristics."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	text = "\n".join([
+		f"{_osc('A')}❯ {_osc('B')}ls",
+		f"{_osc('C')}a.txt",
+		"b.txt",
+		f"{_osc('D;0')}{_osc('A')}~/src",
+		f"❯ {_osc('B')}ls",
+		f"{_osc('C')}note: done",
+		f"{_osc('D;0')}{_osc('A')}❯ {_osc('B')}",
+	])
+	manager = CommandHistoryManager(BufferTerminal(""))
+
+	assert manager.ingest_text(text) == 2
+	assert list(manager._history) == [(0, "ls", 1, 2), (4, "ls", 5, 5)]
+	assert manager.get_output_text(0) == "a.txt\nb.txt"
+
+
+def test_marks_disable_prompt_pattern_fallback():
+	"""Once marks are seen, prompt-looking output lines are not commands."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	manager.ingest_text(f"{_osc('A')}> {_osc('B')}cat log\n{_osc('C')}$ not a command\nx\n")
+
+	assert _commands(manager) == [(0, "cat log")]
+	manager.clear_history()
+	manager.ingest_text("$ echo plain\nplain\n")
+	assert _commands(manager) == [(0, "echo plain")]
+
+
+# ---------------------------------------------------------------------------
+# Learned prompts
+# ---------------------------------------------------------------------------
+
+def test_learn_prompt_pattern_generalises_varying_middle():
+	"""Shared prefix and symbol suffix are kept; the middle becomes a wildcard."""
+	from globalPlugins.terminalAccess import _learn_prompt_pattern
+
+	pattern = _learn_prompt_pattern(["~/src on main ❯", "~/src/app on dev ❯"])
+
+	assert pattern.match("~/src/lib on fix ❯ git log").group(1) == "git log"
+	assert pattern.match("~/src/lib on fix ❯") is None
+	assert pattern.match("/etc ❯ ls") is None
+	assert _learn_prompt_pattern(["λ"]).match("λ cargo test").group(1) == "cargo test"
+	# Without a symbol at the end the command boundary is unknown.
+	assert _learn_prompt_pattern(["alpha", "beta"]) is None
+
+
+def test_observed_starship_prompt_populates_history():
+	"""Custom prompts the built-ins miss are learned and the buffer rescanned."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	text = "~/src on main\n❯ ls\na.txt\n~/src on main\n❯ make\nok\n~/src on main\n❯ "
+	manager = CommandHistoryManager(BufferTerminal(text))
+
+	assert manager.detect_and_store_commands() == 0
+	assert manager.observe_prompt("❯ ") is False  # One sample is not enough
+	assert manager.observe_prompt("❯ ") is True
+	assert _commands(manager) == [(1, "ls"), (4, "make")]
+	assert manager.detect_and_store_commands() == 0
+	# Builtin-recognised prompts are not learned.
+	assert manager.observe_prompt("user@host:~$ ") is False
+
+
+def test_learned_prompts_are_scoped_per_profile():
+	"""Each profile keeps its own learned pattern."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	manager = CommandHistoryManager(BufferTerminal(""))
+	manager.set_prompt_scope("wezterm")
+	manager.observe_prompt("λ")
+	manager.observe_prompt("λ")
+	manager.set_prompt_scope("alacritty")
+
+	assert manager.ingest_text("λ make\nok\n") == 0
+	manager.set_prompt_scope("wezterm")
+	assert _commands(manager) == [(0, "make")]
+
+
+def test_learned_prompt_adds_to_builtin_rules():
+	"""A stray REPL sample is not learned; a learned prompt keeps bash detection."""
+	from globalPlugins.terminalAccess import CommandHistoryManager
+
+	text = "$ python3\n>>> import os\n>>> exit()\n$ ls\na.txt\n$ make\nok\n$ "
+	manager = CommandHistoryManager(BufferTerminal(text))
+	assert manager.detect_and_store_commands() == 3
+
+	assert manager.observe_prompt(">>> ") is False
+	assert _commands(manager) == [(0, "python3"), (3, "ls"), (5, "make")]
+
+	assert manager.observe_prompt(">>> ") is True
+	assert _commands(manager) == [
+		(0, "python3"), (1, "import os"), (2, "exit()"), (3, "ls"), (5, "make"),
+	]
+	assert manager.ingest_text(text + "\n$ pwd\n/home\n$ ") == 1
+
+
+def test_first_typed_character_samples_prompt():
+	"""Typing the first character of a command sends the bare prompt once."""
+	from unittest.mock import MagicMock, Mock
+	from globalPlugins.terminalAccess import GlobalPlugin
+
+	_setup_textinfos()
+	textInfos.POSITION_CARET = "caret"
+	plugin = GlobalPlugin.__new__(GlobalPlugin)
+	plugin._commandHistoryManager = Mock()
+	obj = MagicMock()
+	obj.makeTextInfo.return_value.copy.return_value.text = "❯ "
+
+	plugin._samplePromptOnTyping(obj, "l")
+	plugin._samplePromptOnTyping(obj, "s")
+	plugin._samplePromptOnTyping(obj, "\r")
+	plugin._samplePromptOnTyping(obj, "p")
+
+	assert plugin._commandHistoryManager.observe_prompt.call_count == 2
+	plugin._commandHistoryManager.observe_prompt.assert_called_with("❯ ")
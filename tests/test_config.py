@@ -310,5 +310,77 @@ class TestConfigMigration(unittest.TestCase):
         self.assertEqual(config_dict["punctuationLevel"], PUNCT_ALL)
 
 
+class TestSettingsResolver(unittest.TestCase):
+    """Test effective settings resolution with profile overrides."""
+
+    def setUp(self):
+        config_mock = sys.modules['config']
+        self.config_dict = {
+            "cursorTracking": True,
+            "keyEcho": True,
+            "punctuationLevel": 2,
+            "repeatedSymbols": False,
+            "cursorDelay": 20,
+            "quietMode": False,
+        }
+        config_mock.conf = MagicMock()
+        config_mock.conf.__getitem__ = MagicMock(return_value=self.config_dict)
+
+    def test_profile_overrides_global_settings(self):
+        from globalPlugins.terminalAccess import ApplicationProfile, SettingsResolver, PUNCT_ALL
+
+        profile = ApplicationProfile('vim')
+        profile.punctuationLevel = PUNCT_ALL
+        profile.keyEcho = False
+        settings = SettingsResolver().resolve(profile)
+
+        self.assertEqual(settings.punctuationLevel, PUNCT_ALL)
+        self.assertIsNone(settings.punctuationSet)
+        self.assertFalse(settings.keyEcho)
+        self.assertEqual(settings.cursorDelay, 20)
+        # Keys missing from the section fall back to confspec defaults
+        self.assertEqual(settings.repeatedSymbolsValues, "-_=!")
+
+    def test_settings_are_immutable(self):
+        from globalPlugins.terminalAccess import SettingsResolver
+
+        settings = SettingsResolver().resolve()
+        with self.assertRaises(AttributeError):
+            settings.keyEcho = False
+
+    def test_rebuilt_only_on_profile_change_or_signal(self):
+        from globalPlugins.terminalAccess import ApplicationProfile, ConfigManager, SettingsResolver
+
+        resolver = SettingsResolver()
+        first = resolver.resolve()
+        self.config_dict["cursorDelay"] = 500
+        self.assertIs(resolver.resolve(), first)
+
+        profile = ApplicationProfile('htop')
+        self.assertIsNot(resolver.resolve(profile), first)
+        self.assertEqual(resolver.resolve(profile).cursorDelay, 500)
+
+        cached = resolver.resolve(profile)
+        ConfigManager().set("quietMode", True)
+        self.assertIsNot(resolver.resolve(profile), cached)
+        self.assertTrue(resolver.resolve(profile).quietMode)
+
+    def test_key_echo_honours_profile(self):
+        from globalPlugins.terminalAccess import ApplicationProfile, GlobalPlugin
+
+        config_mock = sys.modules['config']
+        keyboard = {"speakTypedCharacters": False}
+        config_mock.conf.__getitem__ = MagicMock(
+            side_effect=lambda key: keyboard if key == "keyboard" else self.config_dict
+        )
+        plugin = GlobalPlugin.__new__(GlobalPlugin)
+        self.assertTrue(plugin._isKeyEchoActive())
+
+        profile = ApplicationProfile('less')
+        profile.keyEcho = False
+        plugin._currentProfile = profile
+        self.assertFalse(plugin._isKeyEchoActive())
+
+
 if __name__ == '__main__':
     unittest.main()
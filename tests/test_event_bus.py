@@ -0,0 +1,167 @@
+"""Tests for the terminal event subscription bus."""
+
+from unittest.mock import Mock
+
+import textInfos
+
+
+class CountingTerminal:
+	"""Terminal stub counting full-buffer fetches."""
+
+	def __init__(self, text):
+		self.text = text
+		self.fetches = 0
+
+	def makeTextInfo(self, arg):
+		if arg == textInfos.POSITION_ALL:
+			self.fetches += 1
+		info = Mock()
+		info.text = self.text
+		return info
+
+
+def _setup_textinfos():
+	"""Ensure textInfos constants are set."""
+	textInfos.POSITION_ALL = "all"
+	textInfos.POSITION_FIRST = "first"
+	textInfos.UNIT_LINE = "line"
+
+
+def test_no_fetch_without_snapshot_subscribers():
+	"""Subscribers that do not need text never cause a buffer fetch."""
+	_setup_textinfos()
+	from globalPlugins.terminalAccess import TerminalEventBus
+
+	bus = TerminalEventBus()
+	calls = []
+	bus.subscribe(bus.EVENT_CARET, lambda obj, text: calls.append(text))
+	bus.subscribe(bus.EVENT_CARET, lambda obj, text: calls.append("off"), needs_snapshot=True, is_active=lambda: False)
+	terminal = CountingTerminal("abc")
+
+	assert bus.publish(bus.EVENT_CARET, terminal) is None
+	assert terminal.fetches == 0
+	assert calls == [None]
+
+
+def test_snapshot_fetched_once_for_all_subscribers():
+	"""Several text-consuming subscribers share one fetch."""
+	_setup_textinfos()
+	from globalPlugins.terminalAccess import TerminalEventBus
+
+	bus = TerminalEventBus()
+	seen = []
+	bus.subscribe(bus.EVENT_CARET, lambda obj, text: seen.append(text), needs_snapshot=True)
+	bus.subscribe(bus.EVENT_CARET, lambda obj, text: seen.append(text), needs_snapshot=True)
+	terminal = CountingTerminal("abc")
+
+	assert bus.publish(bus.EVENT_CARET, terminal) == "abc"
+	assert terminal.fetches == 1
+	assert seen == ["abc", "abc"]
+
+
+def test_content_changed_reports_first_changed_row():
+	"""Content watchers run only when the observer reports a change."""
+	_setup_textinfos()
+	from globalPlugins.terminalAccess import ContentGeneration, TerminalEventBus
+
+	generation = ContentGeneration()
+	bus = TerminalEventBus(observer=generation.observe)
+	changes = []
+	bus.subscribe(
+		bus.EVENT_CONTENT_CHANGED,
+		lambda obj, text, first_row: changes.append(first_row),
+		needs_snapshot=True,
+	)
+	terminal = CountingTerminal("a\nb\nc")
+
+	bus.publish(bus.EVENT_CARET, terminal)
+	bus.publish(bus.EVENT_CARET, terminal)
+	terminal.text = "a\nb\nX\nd"
+	bus.publish(bus.EVENT_CARET, terminal)
+
+	assert changes == [0, 2]
+
+
+def test_failing_subscriber_does_not_block_others():
+	"""An exception in one callback is isolated from the rest."""
+	from globalPlugins.terminalAccess import TerminalEventBus
+
+	bus = TerminalEventBus()
+	received = []
+
+	def _broken(obj, text, ch):
+		raise RuntimeError("boom")
+
+	bus.subscribe(bus.EVENT_TYPED_CHARACTER, _broken)
+	bus.subscribe(bus.EVENT_TYPED_CHARACTER, lambda obj, text, ch: received.append(ch))
+
+	bus.publish(bus.EVENT_TYPED_CHARACTER, Mock(), ch="x")
+	assert received == ["x"]
+	assert bus.unsubscribe(bus.EVENT_TYPED_CHARACTER, _broken) is True
+	assert bus.unsubscribe(bus.EVENT_TYPED_CHARACTER, _broken) is False
+
+
+def test_caret_event_skips_fetch_when_features_need_no_text(reset_config):
+	"""With output announcement off and no history bound, caret makes no fetch."""
+	_setup_textinfos()
+	import config
+	from globalPlugins.terminalAccess import GlobalPlugin
+
+	config.conf["terminalAccess"]["cursorTracking"] = False
+	plugin = GlobalPlugin()
+	plugin.isTerminalApp = lambda obj=None: True
+	terminal = CountingTerminal("$ ls\nfile\n")
+	generation = plugin._generation.value
+
+	plugin.event_caret(terminal, lambda: None)
+
+	assert terminal.fetches == 0
+	# Nothing was seen to change, so generation-keyed caches stay valid
+	assert plugin._generation.value == generation
+
+
+def test_bound_history_does_not_force_caret_fetches(reset_config):
+	"""History waits for a shared snapshot or for the user to navigate it."""
+	_setup_textinfos()
+	import config
+	from globalPlugins.terminalAccess import CommandHistoryManager, GlobalPlugin
+
+	config.conf["terminalAccess"]["cursorTracking"] = False
+	plugin = GlobalPlugin()
+	plugin.isTerminalApp = lambda obj=None: True
+	terminal = CountingTerminal("$ ls\nfile\n$ make\nok\n")
+	plugin._commandHistoryManager = CommandHistoryManager(terminal)
+
+	plugin.event_caret(terminal, lambda: None)
+	plugin.event_caret(terminal, lambda: None)
+	assert terminal.fetches == 0
+	assert plugin._commandHistoryManager.get_history_count() == 0
+
+	plugin.script_previousCommand(Mock())
+	assert terminal.fetches == 1
+	assert plugin._commandHistoryManager.get_current_command() == "make"
+
+
+def test_caret_event_ingests_history_and_tracks_first_changed_row(reset_config):
+	"""History ingests snapshots another feature takes; one snapshot sets the changed row."""
+	_setup_textinfos()
+	import config
+	from globalPlugins.terminalAccess import CommandHistoryManager, GlobalPlugin, TerminalEventBus
+
+	config.conf["terminalAccess"]["cursorTracking"] = False
+	plugin = GlobalPlugin()
+	plugin.isTerminalApp = lambda obj=None: True
+	terminal = CountingTerminal("$ ls\nfile\n")
+	plugin._commandHistoryManager = CommandHistoryManager(terminal)
+	# Stands in for new output announcement, which reads every caret snapshot
+	plugin._eventBus.subscribe(TerminalEventBus.EVENT_CARET, lambda obj, text: None, needs_snapshot=True)
+
+	plugin.event_caret(terminal, lambda: None)
+	filled = plugin._generation.value
+	terminal.text += "$ make\nok\n"
+	plugin.event_caret(terminal, lambda: None)
+
+	assert terminal.fetches == 2
+	assert [cmd for _row, cmd, *_ in plugin._commandHistoryManager._history] == ["ls", "make"]
+	assert plugin._generation.is_row_current(1, filled)
+	assert not plugin._generation.is_row_current(2, filled)
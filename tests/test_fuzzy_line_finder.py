@@ -0,0 +1,205 @@
+"""Tests for the fuzzy line finder."""
+
+import threading
+import time
+
+import api
+import textInfos
+
+
+def _setup_textinfos():
+	"""Ensure textInfos constants are set."""
+	textInfos.POSITION_ALL = "all"
+	textInfos.POSITION_FIRST = "first"
+	textInfos.UNIT_LINE = "line"
+	textInfos.UNIT_CHARACTER = "character"
+
+
+def _make_log(count):
+	"""Build a synthetic log of *count* lines with one memorable line near the top."""
+	lines = [f"2026-01-01 12:00:{i % 60:02d} INFO worker-{i % 7} processed batch {i}" for i in range(count)]
+	lines[123] = "psycopg2.OperationalError: could not connect: Connection refused (port 5432)"
+	return lines
+
+
+def test_exact_tokens_rank_first():
+	"""Lines containing every token as substrings outrank partial matches."""
+	from globalPlugins.terminalAccess import FuzzyLineFinder
+
+	lines = [
+		"connection established",
+		"error: connection refused on port 5432",
+		"refused",
+	]
+	results = FuzzyLineFinder().rank(lines, "conn refused 5432")
+
+	assert results[0][1] == 1
+	assert [index for _, index, _ in results] == [1, 2, 0]
+
+
+def test_subsequence_tokens_match_within_a_word():
+	"""Abbreviated tokens match their characters in order inside one word."""
+	from globalPlugins.terminalAccess import FuzzyLineFinder
+
+	finder = FuzzyLineFinder()
+	assert finder.rank(["connection refused"], "refsd")[0][1] == 0
+	# Characters spread across separate words do not count.
+	assert finder.rank(["r e f s d"], "refsd") == []
+
+
+def test_results_bounded_and_ties_favour_newer_lines():
+	"""At most max_results lines are kept; equal scores prefer later lines."""
+	from globalPlugins.terminalAccess import FuzzyLineFinder
+
+	lines = [f"build step {i}" for i in range(100)]
+	results = FuzzyLineFinder(max_results=5).rank(lines, "build")
+
+	assert len(results) == 5
+	assert [index for _, index, _ in results] == [99, 98, 97, 96, 95]
+
+
+def test_match_offset_points_at_first_token():
+	"""The reported offset is where the first token was found."""
+	from globalPlugins.terminalAccess import FuzzyLineFinder
+
+	results = FuzzyLineFinder().rank(["xx  timeout reached"], "timeout")
+	assert results[0][2] == 4
+
+
+def test_cancelled_rank_returns_nothing():
+	"""A set cancellation event stops ranking."""
+	from globalPlugins.terminalAccess import FuzzyLineFinder
+
+	cancel = threading.Event()
+	cancel.set()
+	assert FuzzyLineFinder().rank(["abc"] * 10, "abc", cancel) == []
+
+
+def test_subsequence_scan_is_linear_on_adversarial_lines():
+	"""Near-miss subsequences in long words are rejected without backtracking."""
+	import time
+	from globalPlugins.terminalAccess import FuzzyLineFinder
+
+	finder = FuzzyLineFinder()
+	urls = ["https://host/" + "/".join(f"segment{i}" for i in range(30)) for _ in range(100)]
+	start = time.perf_counter()
+	assert finder.rank(["a" * 100], "aaaaab") == []
+	assert finder.rank(urls, "segment999x") == []
+	assert time.perf_counter() - start < 1.0
+
+	# The characters must appear in order within one word
+	assert FuzzyLineFinder._find_subsequence("refsd", "connection refused") == 11
+	assert FuzzyLineFinder._find_subsequence("ab", "a b") == -1
+
+
+def test_find_async_cancels_superseded_query():
+	"""Starting a new query cancels the previous worker's callback."""
+	from globalPlugins.terminalAccess import FuzzyLineFinder
+
+	finder = FuzzyLineFinder()
+	delivered = []
+	done = threading.Event()
+
+	def _callback(results):
+		delivered.append(results)
+		done.set()
+
+	lines = _make_log(50000)
+	finder.find_async(lines, "no such words", _callback)
+	finder.find_async(lines, "conn refused 5432", _callback)
+
+	assert done.wait(10)
+	time.sleep(0.05)
+	assert len(delivered) == 1
+	assert delivered[0][0][1] == 123
+
+
+def test_fifty_thousand_lines_interactive():
+	"""Ranking a 50k-line buffer stays within interactive latency."""
+	from globalPlugins.terminalAccess import FuzzyLineFinder
+
+	lines = _make_log(50000)
+	start = time.perf_counter()
+	results = FuzzyLineFinder().rank(lines, "conn refused 5432")
+	elapsed = time.perf_counter() - start
+
+	assert results[0][1] == 123
+	assert len(results) <= FuzzyLineFinder.MAX_RESULTS
+	assert elapsed < 2.0, f"Fuzzy ranking took {elapsed:.3f}s for 50k lines"
+
+
+class _LineInfo:
+	"""Minimal TextInfo tracking line and character moves."""
+
+	def __init__(self):
+		self.line_index = 0
+		self.char_offset = 0
+
+	@property
+	def bookmark(self):
+		return None
+
+	def move(self, unit, count):
+		if unit == textInfos.UNIT_CHARACTER:
+			self.char_offset += count
+		else:
+			self.line_index += count
+		return True
+
+	def copy(self):
+		info = _LineInfo()
+		info.line_index = self.line_index
+		info.char_offset = self.char_offset
+		return info
+
+
+class _Terminal:
+	"""Terminal stub exposing a fixed buffer."""
+
+	def __init__(self, text):
+		self.text = text
+
+	def makeTextInfo(self, arg):
+		if arg == textInfos.POSITION_ALL:
+			info = _LineInfo()
+			info.text = self.text
+			return info
+		if arg == textInfos.POSITION_FIRST:
+			return _LineInfo()
+		raise ValueError("Bookmarks not supported")
+
+
+def test_fuzzy_find_jumps_through_search_resolution_path():
+	"""Manager results are 1-based and jump_to_line positions the review cursor."""
+	_setup_textinfos()
+
+	from globalPlugins.terminalAccess import OutputSearchManager
+
+	manager = OutputSearchManager(_Terminal("start\nok\n  disk quota exceeded\nend"))
+	done = threading.Event()
+	received = []
+
+	def _callback(results):
+		received.extend(results)
+		done.set()
+
+	assert manager.fuzzy_find("quota exc", _callback) is True
+	assert done.wait(5)
+	line_num, char_offset, line_text = received[0]
+	assert (line_num, char_offset) == (3, 7)
+	assert line_text == "  disk quota exceeded"
+
+	api.setReviewPosition.reset_mock()
+	assert manager.jump_to_line(line_num, char_offset) is True
+	position = api.setReviewPosition.call_args[0][0]
+	assert (position.line_index, position.char_offset) == (2, 7)
+
+
+def test_fuzzy_find_rejects_blank_query():
+	"""A whitespace-only query does not start a worker."""
+	_setup_textinfos()
+
+	from globalPlugins.terminalAccess import OutputSearchManager
+
+	manager = OutputSearchManager(_Terminal("abc"))
+	assert manager.fuzzy_find("   ", lambda results: None) is False
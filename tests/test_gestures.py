@@ -104,5 +104,52 @@ class TestGestureScoping(unittest.TestCase):
 		self.assertTrue(plugin._gesturesBound)
 
 
+class TestFocusContext(unittest.TestCase):
+	"""Test the per-focus context read by scripts."""
+
+	def _focus(self, plugin, appName):
+		obj = MagicMock()
+		obj.appModule = MagicMock()
+		obj.appModule.appName = appName
+		plugin.event_gainFocus(obj, lambda: None)
+		return obj
+
+	def test_terminal_focus_builds_context(self):
+		import api
+		from globalPlugins.terminalAccess import GlobalPlugin
+
+		plugin = GlobalPlugin()
+		terminal = self._focus(plugin, "WindowsTerminal")
+		context = plugin._focusContext
+
+		self.assertIs(context.terminal, terminal)
+		self.assertEqual(context.app_name, "windowsterminal")
+		self.assertEqual(context.tab_id, plugin._tabManager.get_current_tab_id())
+		self.assertIs(plugin._boundTerminal, terminal)
+
+		api.getForegroundObject.reset_mock()
+		self.assertTrue(plugin.isTerminalApp())
+		api.getForegroundObject.assert_not_called()
+
+	def test_non_terminal_focus_clears_context(self):
+		from globalPlugins.terminalAccess import GlobalPlugin
+
+		plugin = GlobalPlugin()
+		self._focus(plugin, "WindowsTerminal")
+		self._focus(plugin, "notepad")
+
+		self.assertFalse(plugin.isTerminalApp())
+		self.assertIsNone(plugin._boundTerminal)
+		self.assertIsNone(plugin._currentProfile)
+
+	def test_bound_terminal_settable_without_init(self):
+		from globalPlugins.terminalAccess import GlobalPlugin
+
+		plugin = GlobalPlugin.__new__(GlobalPlugin)
+		terminal = MagicMock()
+		plugin._boundTerminal = terminal
+		self.assertIs(plugin._focusContext.terminal, terminal)
+
+
 if __name__ == '__main__':
 	unittest.main()
@@ -161,3 +161,218 @@ def test_search_next_and_previous():
 	assert manager.previous_match() is True
 	info = manager.get_current_match_info()
 	assert info[0] == 3  # wrapped to match 3
+
+
+class CharTextInfo(DummyTextInfo):
+	"""TextInfo stub that tracks line and character moves separately."""
+
+	def __init__(self, source_text, line_index=0, char_offset=0):
+		super().__init__(source_text, line_index)
+		self.char_offset = char_offset
+
+	def move(self, unit, count):
+		if unit == textInfos.UNIT_CHARACTER:
+			self.char_offset += count
+		else:
+			self.line_index += count
+		return True
+
+	def copy(self):
+		return CharTextInfo(self._source_text, self.line_index, self.char_offset)
+
+
+class CharTerminal(DummyTerminal):
+	"""Terminal stub returning CharTextInfo positions."""
+
+	def makeTextInfo(self, arg):
+		if arg in (textInfos.POSITION_ALL, textInfos.POSITION_FIRST):
+			return CharTextInfo(self.text, 0)
+		raise ValueError("Bookmarks not supported")
+
+
+def test_search_records_every_occurrence_on_a_line():
+	"""Each occurrence on a line is a separate match with its own column."""
+	_setup_textinfos()
+	textInfos.UNIT_CHARACTER = "character"
+
+	from globalPlugins.terminalAccess import OutputSearchManager
+
+	manager = OutputSearchManager(CharTerminal("error: x error y\nok\nERROR"))
+
+	assert manager.search("error") == 3
+	assert [m[2] for m in manager._matches] == [1, 1, 3]
+	assert [m[4] for m in manager._matches] == [0, 9, 0]
+
+	api.setReviewPosition.reset_mock()
+	assert manager.first_match() is True
+	assert manager.next_match() is True
+	position = api.setReviewPosition.call_args[0][0]
+	assert position.line_index == 0
+	assert position.char_offset == 9
+	assert manager.get_current_match_info() == (2, 3, "error: x error y", 1)
+
+
+def test_search_literal_text_is_not_treated_as_regex():
+	"""Plain-text queries containing regex metacharacters match literally."""
+	_setup_textinfos()
+
+	from globalPlugins.terminalAccess import OutputSearchManager
+
+	manager = OutputSearchManager(DummyTerminal("a.b\naxb\n(a.b)"))
+
+	assert manager.search("a.b") == 2
+	assert manager.search("a.b", use_regex=True) == 3
+
+
+def test_zero_width_regex_matches_once_per_line():
+	"""Anchors and empty matches must not produce one match per character."""
+	_setup_textinfos()
+
+	from globalPlugins.terminalAccess import OutputSearchManager
+
+	manager = OutputSearchManager(DummyTerminal("abc\ndef\n"))
+
+	assert manager.search("^", use_regex=True) == 2
+	assert manager.search("x*", use_regex=True) == 2
+
+
+def test_invalid_regex_returns_no_matches():
+	"""A malformed regular expression yields zero matches instead of raising."""
+	_setup_textinfos()
+
+	from globalPlugins.terminalAccess import OutputSearchManager
+
+	manager = OutputSearchManager(DummyTerminal("abc"))
+
+	assert manager.search("(unclosed", use_regex=True) == 0
+
+
+def test_compiled_patterns_are_cached_by_pattern_and_flags():
+	"""The shared pattern cache reuses compiled objects per (pattern, flags)."""
+	import re
+	from globalPlugins.terminalAccess import _get_compiled_pattern, _get_search_pattern
+
+	first = _get_search_pattern("needle", case_sensitive=False)
+	assert _get_search_pattern("needle", case_sensitive=False) is first
+	assert _get_search_pattern("needle", case_sensitive=True) is not first
+	assert _get_compiled_pattern("needle", re.IGNORECASE) is first
+	assert _get_compiled_pattern.cache_info().maxsize > 0
+
+
+# ---------------------------------------------------------------------------
+# Search-as-you-type
+# ---------------------------------------------------------------------------
+
+def test_incremental_search_narrows_previous_candidates():
+	"""Each added character filters the previous candidate set."""
+	from globalPlugins.terminalAccess import IncrementalSearchSession
+
+	session = IncrementalSearchSession(["make all", "Error: one", "warning", "error: two error"])
+
+	assert session.update("e") == [0, 1, 3]
+	assert session.update("er") == [1, 3]
+	assert session.update("err") == [1, 3]
+	assert session.update("erro: ") == []
+	assert session.match_count() == 0
+
+
+def test_incremental_search_only_scans_current_candidates():
+	"""Per-keystroke work touches only the lines that still match."""
+	from globalPlugins.terminalAccess import IncrementalSearchSession
+
+	class CountingStr(str):
+		checks = 0
+
+		def __contains__(self, item):
+			CountingStr.checks += 1
+			return str.__contains__(self, item)
+
+	lines = ["x"] * 1000 + ["needle"]
+	session = IncrementalSearchSession(lines, case_sensitive=True)
+	session._folded = [CountingStr(line) for line in lines]
+
+	session.update("n")
+	assert CountingStr.checks == 1001
+	CountingStr.checks = 0
+	session.update("ne")
+	assert CountingStr.checks == 1
+
+
+def test_incremental_search_backspace_restores_cached_set():
+	"""Deleting characters pops back to the previously computed set."""
+	from globalPlugins.terminalAccess import IncrementalSearchSession
+
+	session = IncrementalSearchSession(["alpha", "alpine", "beta"])
+
+	al = session.update("al")
+	session.update("alp")
+	session.update("alph")
+	assert session.update("al") is al
+	assert session.query == "al"
+	# A different continuation narrows from the restored set.
+	assert session.update("ali") == []
+	assert session.update("") == [0, 1, 2]
+
+
+def test_incremental_search_count_and_first_match():
+	"""Match count counts occurrences; first match is the earliest line."""
+	from globalPlugins.terminalAccess import IncrementalSearchSession
+
+	session = IncrementalSearchSession(["ok", "FAIL fail", "fail"])
+
+	assert session.first_match() is None
+	session.update("fail")
+	assert session.match_count() == 3
+	assert session.first_match() == (1, "FAIL fail")
+
+
+def test_begin_incremental_search_snapshot_feeds_final_search():
+	"""The dialog snapshot is reused for the final search without a refetch."""
+	_setup_textinfos()
+
+	from globalPlugins.terminalAccess import OutputSearchManager
+
+	terminal = DummyTerminal("one\n\x1b[31mtwo\x1b[0m\nthree two")
+	manager = OutputSearchManager(terminal)
+	session = manager.begin_incremental_search()
+
+	assert session.lines == ["one", "two", "three two"]
+	session.update("two")
+	terminal.text = "changed"
+	assert manager.search("two", lines=session.lines) == 2
+
+
+def test_incremental_counts_match_committed_search_for_non_ascii():
+	"""Typing and committing fold case the same way, mapping offsets back to the line."""
+	_setup_textinfos()
+
+	from globalPlugins.terminalAccess import IncrementalSearchSession, OutputSearchManager
+
+	lines = ["STRASSE 1", "Straße 2", "ﬁle ok"]
+	session = IncrementalSearchSession(lines)
+	session.update("strasse")
+	assert session.match_count() == 2
+	session.update("file")
+	assert session.match_count() == 1
+
+	manager = OutputSearchManager(CharTerminal("\n".join(lines)))
+	assert manager.search("strasse", lines=lines) == 2
+	assert manager.search("OK", lines=lines) == 1
+	assert manager._matches[0][4] == 4
+
+
+def test_committed_search_is_stale_from_the_snapshot_generation():
+	"""Output arriving while the dialog is open makes the committed results stale."""
+	_setup_textinfos()
+
+	from globalPlugins.terminalAccess import ContentGeneration, OutputSearchManager
+
+	generation = ContentGeneration()
+	terminal = DummyTerminal("one\ntwo")
+	manager = OutputSearchManager(terminal, generation=generation)
+	session = manager.begin_incremental_search()
+	generation.advance(0)
+
+	manager.search("two", lines=session.lines, generation=session.generation)
+	assert manager._search_generation == session.generation
+	assert generation.first_changed_row_since(manager._search_generation) == 0
@@ -150,6 +150,84 @@ class TestLargeSelectionPerformance(unittest.TestCase):
 			f"Summary generation took {elapsed:.3f}s, expected < 0.01s")
 
 
+class TestPromptDetectionPerformance(unittest.TestCase):
+	"""Test command prompt detection over large buffers."""
+
+	LINE_COUNT = 50000
+
+	def _make_fixture(self):
+		"""Build a 50k-line build log with a prompt every 1000 lines."""
+		lines = []
+		for i in range(self.LINE_COUNT):
+			if i % 1000 == 0:
+				lines.append(f"user@host:~/project$ make target{i}")
+			elif i % 3 == 0:
+				lines.append(f"  Compiling crate_{i} v0.{i % 10}.0 (/src/crate_{i})")
+			elif i % 3 == 1:
+				lines.append(f"   = note: unused variable `x{i}` in src/lib.rs:{i}")
+			else:
+				lines.append(f"[{i:05d}] test suite_{i % 50}::case_{i} ... ok")
+		return lines
+
+	def test_combined_matcher_50k_lines(self):
+		"""Combined matcher agrees with the rules in turn and prefilters output lines."""
+		from addon.globalPlugins import terminalAccess
+		from addon.globalPlugins.terminalAccess import _PROMPT_PATTERNS, _match_prompt_command
+
+		lines = self._make_fixture()
+
+		combined_re = MagicMock(wraps=terminalAccess._PROMPT_COMBINED_RE)
+		with patch.object(terminalAccess, '_PROMPT_COMBINED_RE', combined_re):
+			combined = [_match_prompt_command(line.strip()) for line in lines]
+
+		sequential = []
+		for line in lines:
+			line = line.strip()
+			command = None
+			for pattern in _PROMPT_PATTERNS:
+				match = pattern.match(line)
+				if match:
+					command = match.group(1).strip()
+					break
+			sequential.append(command)
+
+		self.assertEqual(combined, sequential)
+		# Only the prompt lines get past the literal prefilter to the regex
+		self.assertEqual(combined_re.match.call_count, self.LINE_COUNT // 1000)
+
+	def test_detect_and_store_commands_50k_lines(self):
+		"""A full history scan of a 50k-line buffer completes quickly."""
+		import textInfos
+		from addon.globalPlugins.terminalAccess import CommandHistoryManager
+
+		text = "\n".join(self._make_fixture())
+
+		class _Cursor:
+			bookmark = None
+
+			def move(self, unit, count):
+				return True
+
+		class _Terminal:
+			def makeTextInfo(self, arg):
+				info = _Cursor()
+				info.text = text
+				return info
+
+		textInfos.POSITION_ALL = "all"
+		textInfos.POSITION_FIRST = "first"
+		textInfos.UNIT_LINE = "line"
+		manager = CommandHistoryManager(_Terminal())
+
+		start_time = time.perf_counter()
+		found = manager.detect_and_store_commands()
+		elapsed = time.perf_counter() - start_time
+
+		self.assertEqual(found, self.LINE_COUNT // 1000)
+		self.assertLess(elapsed, 1.0,
+			f"History scan of 50k lines took {elapsed:.3f}s, expected < 1.0s")
+
+
 class TestMemoryUsage(unittest.TestCase):
 	"""Test memory usage stays within bounds."""
 
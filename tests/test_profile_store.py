@@ -0,0 +1,138 @@
+"""Tests for the on-disk profile store."""
+
+import json
+import os
+from unittest.mock import Mock, patch
+
+
+def _custom_profile():
+	"""Build a custom profile with a title detection rule."""
+	from globalPlugins.terminalAccess import ApplicationProfile, PUNCT_ALL
+
+	profile = ApplicationProfile('stern', 'Stern')
+	profile.punctuationLevel = PUNCT_ALL
+	profile.detectionRules = [{'title': r'\bstern\b', 'priority': 50}]
+	return profile
+
+
+def test_added_profile_survives_restart(tmp_path):
+	"""Profiles added with a store are written and reloaded by a new manager."""
+	from globalPlugins.terminalAccess import PUNCT_ALL, ProfileManager, ProfileStore
+
+	ProfileManager(store=ProfileStore(str(tmp_path))).addProfile(_custom_profile())
+
+	index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+	assert index['profiles']['stern']['file'] == "stern.json"
+	assert (tmp_path / "stern.json").exists()
+
+	manager = ProfileManager(store=ProfileStore(str(tmp_path)))
+	assert manager.hasProfile('stern')
+	assert 'stern' in manager.profileNames()
+	profile = manager.getProfile('stern')
+	assert profile.displayName == 'Stern'
+	assert profile.punctuationLevel == PUNCT_ALL
+
+
+def test_stored_profiles_parsed_only_on_first_use(tmp_path):
+	"""Startup reads the index only; detection works before the file is parsed."""
+	from globalPlugins.terminalAccess import ProfileManager, ProfileStore
+
+	ProfileManager(store=ProfileStore(str(tmp_path))).addProfile(_custom_profile())
+
+	store = ProfileStore(str(tmp_path))
+	with patch.object(ProfileStore, 'load', wraps=store.load) as load:
+		manager = ProfileManager(store=store)
+		focus = Mock()
+		focus.appModule.appName = "WindowsTerminal"
+		focus.name = "stern - prod logs"
+		assert manager.detectApplication(focus) == 'stern'
+		assert 'stern' not in manager.profiles
+		load.assert_not_called()
+
+		manager.getProfile('stern')
+		manager.getProfile('stern')
+		assert load.call_count == 1
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+	"""A write interrupted before the rename leaves the old file and no temp file."""
+	from globalPlugins.terminalAccess import ProfileStore
+
+	store = ProfileStore(str(tmp_path))
+	profile = _custom_profile()
+	assert store.save(profile) is True
+	before = (tmp_path / "stern.json").read_text(encoding="utf-8")
+
+	profile.displayName = "Changed"
+	with patch('os.replace', side_effect=OSError("disk full")):
+		assert store.save(profile) is False
+
+	assert (tmp_path / "stern.json").read_text(encoding="utf-8") == before
+	assert sorted(os.listdir(tmp_path)) == ["index.json", "stern.json"]
+
+
+def test_removed_profile_deleted_from_disk(tmp_path):
+	"""Removing a stored profile deletes its file and index entry."""
+	from globalPlugins.terminalAccess import ProfileManager, ProfileStore
+
+	manager = ProfileManager(store=ProfileStore(str(tmp_path)))
+	manager.addProfile(_custom_profile())
+	manager.removeProfile('stern')
+
+	assert not (tmp_path / "stern.json").exists()
+	assert not ProfileManager(store=ProfileStore(str(tmp_path))).hasProfile('stern')
+
+
+def test_corrupt_index_is_ignored(tmp_path):
+	"""An unreadable index yields no stored profiles instead of an error."""
+	from globalPlugins.terminalAccess import ProfileManager, ProfileStore
+
+	(tmp_path / "index.json").write_text("{not json", encoding="utf-8")
+	manager = ProfileManager(store=ProfileStore(str(tmp_path)))
+	assert manager.getProfile('vim') is not None
+	assert ProfileStore._fileName("my/app") != ProfileStore._fileName("my:app")
+
+
+def test_missing_profile_file_falls_back_without_error(tmp_path):
+	"""A stored default profile whose file is gone leaves no profile active."""
+	import globalPlugins.terminalAccess as terminalAccess
+	from globalPlugins.terminalAccess import GlobalPlugin, ProfileManager, ProfileStore
+
+	ProfileManager(store=ProfileStore(str(tmp_path))).addProfile(_custom_profile())
+	(tmp_path / "stern.json").unlink()
+
+	plugin = GlobalPlugin()
+	plugin._profileManager = ProfileManager(store=ProfileStore(str(tmp_path)))
+	plugin.isTerminalApp = lambda obj=None: True
+	plugin._updateGestureBindingsForFocus = lambda obj: True
+	focus = Mock()
+	focus.appModule.appName = "WindowsTerminal"
+	focus.name = "PowerShell"
+	with patch.dict(terminalAccess.config.conf["terminalAccess"], {"defaultProfile": "stern"}):
+		plugin.event_gainFocus(focus, lambda: None)
+
+	assert plugin._currentProfile is None
+	assert not plugin._profileManager.hasProfile('stern')
+	focus.name = "stern - prod logs"
+	assert plugin._profileManager.detectApplication(focus) == 'default'
+
+
+def test_malformed_stored_rules_are_skipped(tmp_path):
+	"""Hand-edited rules of the wrong type are ignored, the rest still register."""
+	from globalPlugins.terminalAccess import ProfileManager, ProfileStore
+
+	ProfileManager(store=ProfileStore(str(tmp_path))).addProfile(_custom_profile())
+	index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+	index['profiles']['stern']['detectionRules'] = [
+		{'title': 'stern', 'priority': "5"},
+		{'title': 42},
+		"not a rule",
+		{'app': 'stern.exe', 'priority': 10},
+	]
+	(tmp_path / "index.json").write_text(json.dumps(index), encoding="utf-8")
+
+	manager = ProfileManager(store=ProfileStore(str(tmp_path)))
+	focus = Mock()
+	focus.appModule.appName = "stern.exe"
+	focus.name = ""
+	assert manager.detectApplication(focus) == 'stern'
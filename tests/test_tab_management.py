@@ -290,3 +290,123 @@ def test_tab_manager_handles_missing_properties():
 	tab_id = manager.get_current_tab_id()
 	assert tab_id is not None
 	assert isinstance(tab_id, str)
+
+
+def _tab_terminal(title, text=""):
+	"""Mock terminal for one tab of a shared window."""
+	terminal = Mock()
+	terminal.windowHandle = 12345
+	terminal.windowText = title
+	terminal.makeTextInfo = Mock(return_value=Mock(text=text))
+	return terminal
+
+
+def test_tab_states_are_bounded_lru():
+	"""Least recently used tabs are evicted together with their tab info."""
+	from globalPlugins.terminalAccess import TabManager
+
+	manager = TabManager(_tab_terminal("Tab 0"))
+	manager.MAX_TABS = 3
+	first_id = manager.get_current_tab_id()
+	manager.get_tab_state().bookmarks["1"] = "kept"
+
+	for i in range(1, 3):
+		manager.update_terminal(_tab_terminal(f"Tab {i}"))
+	# Touching tab 0 makes tab 1 the eviction candidate
+	assert manager.get_tab_state(first_id).bookmarks == {"1": "kept"}
+	manager.update_terminal(_tab_terminal("Tab 3"))
+
+	assert len(manager._states) == 3
+	assert manager.get_tab_count() == 3
+	assert manager.get_tab_state(first_id, create=False) is not None
+
+
+def test_search_results_survive_refocus_and_tab_switch():
+	"""Search results are kept per tab instead of cleared on every focus event."""
+	import textInfos
+	from globalPlugins.terminalAccess import OutputSearchManager, TabManager
+
+	textInfos.POSITION_ALL = "all"
+	textInfos.POSITION_FIRST = "first"
+	tab1 = _tab_terminal("Tab 1", "alpha\nbeta")
+	tab2 = _tab_terminal("Tab 2", "gamma")
+	tab_manager = TabManager(tab1)
+	search = OutputSearchManager(tab1, tab_manager)
+
+	assert search.search("beta") == 1
+	search.update_terminal(tab1)
+	assert search.get_match_count() == 1
+
+	tab_manager.update_terminal(tab2)
+	search.update_terminal(tab2)
+	assert search.get_match_count() == 0
+
+	tab_manager.update_terminal(tab1)
+	search.update_terminal(tab1)
+	assert search.get_match_count() == 1
+
+
+def test_command_history_is_swapped_per_tab():
+	"""Each tab keeps its own history and scan position."""
+	from globalPlugins.terminalAccess import CommandHistoryManager, TabManager
+
+	tab1 = _tab_terminal("Tab 1")
+	tab2 = _tab_terminal("Tab 2")
+	tab_manager = TabManager(tab1)
+	history = CommandHistoryManager(tab1, tab_manager=tab_manager)
+	history.ingest_text("$ ls\na\n$ ")
+
+	tab_manager.update_terminal(tab2)
+	history.update_terminal(tab2)
+	assert history.get_history_count() == 0
+	history.ingest_text("$ make\nok\n$ pwd\n/\n$ ")
+	assert history.get_history_count() == 2
+
+	tab_manager.update_terminal(tab1)
+	history.update_terminal(tab1)
+	assert [cmd for _, cmd, *_ in history._history] == ["ls"]
+	# The restored scan anchor means nothing is rescanned
+	assert history.ingest_text("$ ls\na\n$ ", force=True) == 0
+
+
+def _uia_terminal(runtime_id, title, hwnd=12345):
+	"""Mock UIA terminal control with a runtime id."""
+	terminal = Mock()
+	terminal.windowHandle = hwnd
+	terminal.windowText = title
+	terminal.UIAElement.GetRuntimeId = Mock(return_value=runtime_id)
+	return terminal
+
+
+def test_tab_identity_cached_by_runtime_id():
+	"""Known tabs are found by (hwnd, runtime id) without re-reading the title."""
+	from globalPlugins.terminalAccess import TabManager
+
+	tab1 = _uia_terminal([42, 1], "Tab 1")
+	manager = TabManager(tab1)
+	tab1_id = manager.get_current_tab_id()
+	manager.update_terminal(_uia_terminal([42, 2], "Tab 2"))
+
+	# A new wrapper for the same control, title changed: same tab, cached title
+	again = _uia_terminal((42, 1), "renamed")
+	manager.update_terminal(again)
+	assert manager.get_current_tab_id() == tab1_id
+	assert manager._tabs[tab1_id]['title'] == "Tab 1"
+	assert manager.get_tab_count() == 2
+
+	assert manager.on_name_change(again) is False
+	assert manager._tabs[tab1_id]['title'] == "renamed"
+
+
+def test_name_change_reidentifies_title_based_tabs():
+	"""Without a runtime id the title is part of the id, so a rename re-identifies."""
+	from globalPlugins.terminalAccess import TabManager
+
+	terminal = Mock(spec=['windowHandle', 'windowText'])
+	terminal.windowHandle = 1
+	terminal.windowText = "cmd"
+	manager = TabManager(terminal)
+
+	terminal.windowText = "cmd - ping"
+	assert manager.on_name_change(terminal) is True
+	assert manager.on_name_change(Mock()) is False
@@ -368,6 +368,85 @@ class TestTUIWindowTitleDetection(unittest.TestCase):
 		focus = self._make_focus(title='Some Random Application')
 		self.assertEqual(manager.detectApplication(focus), 'default')
 
+	def test_specific_rule_outranks_earlier_substring(self):
+		"""Priority, not position in the title, decides between matching rules."""
+		manager = self._get_manager()
+		self.assertEqual(manager.detectApplication(self._make_focus(title='lazygit-less')), 'lazygit')
+		self.assertEqual(manager.detectApplication(self._make_focus(title='less lazygit.log')), 'lazygit')
+		self.assertEqual(manager.detectApplication(self._make_focus(title='wireless setup')), 'default')
+
+	def test_detection_is_memoized(self):
+		"""Refocusing the same window does not run the matchers again."""
+		from globalPlugins.terminalAccess import ProfileManager
+
+		manager = self._get_manager()
+		focus = self._make_focus(title='yazi /tmp')
+		with patch.object(ProfileManager, '_matchApplication', wraps=manager._matchApplication) as matcher:
+			manager.detectApplication(focus)
+			manager.detectApplication(focus)
+		self.assertEqual(matcher.call_count, 1)
+
+		for i in range(ProfileManager.DETECTION_CACHE_SIZE + 10):
+			manager.detectApplication(self._make_focus(title=f'window {i}'))
+		self.assertEqual(len(manager._detectionCache), ProfileManager.DETECTION_CACHE_SIZE)
+
+	def test_user_profile_supplies_rules(self):
+		"""Custom profiles register title and app rules without code changes."""
+		from globalPlugins.terminalAccess import ApplicationProfile
+
+		manager = self._get_manager()
+		self.assertEqual(manager.detectApplication(self._make_focus(title='ssh git@prod')), 'git')
+
+		profile = ApplicationProfile('prodshell', 'Production shell')
+		profile.detectionRules = [
+			{'title': r'^ssh .*@prod', 'priority': 200},
+			{'app': 'plink'},
+		]
+		manager.addProfile(profile)
+
+		self.assertEqual(manager.detectApplication(self._make_focus(title='ssh git@prod')), 'prodshell')
+		self.assertEqual(manager.detectApplication(self._make_focus(app_name='PLINK')), 'prodshell')
+
+		restored = ApplicationProfile.fromDict(profile.toDict())
+		self.assertEqual(restored.detectionRules, profile.detectionRules)
+
+		manager.removeProfile('prodshell')
+		self.assertEqual(manager.detectApplication(self._make_focus(title='ssh git@prod')), 'git')
+
+	def test_invalid_rule_rejected(self):
+		"""Malformed regexes are rejected instead of breaking detection."""
+		manager = self._get_manager()
+		self.assertFalse(manager.addDetectionRule('x', title='(unclosed'))
+		self.assertFalse(manager.addDetectionRule('x'))
+		self.assertEqual(manager.detectApplication(self._make_focus(title='vim main.py')), 'vim')
+
+	def test_rule_invalid_in_combined_pattern_rejected(self):
+		"""Inline flags and backreferences are refused and leave detection working."""
+		from globalPlugins.terminalAccess import ApplicationProfile
+
+		manager = self._get_manager()
+		self.assertFalse(manager.addDetectionRule('x', title='(?i)foo'))
+		self.assertFalse(manager.addDetectionRule('x', title=r'(a)\1'))
+		self.assertTrue(manager.addDetectionRule('x', title=r'\\1 (a|b)'))
+
+		manager.addProfile(ApplicationProfile('later', 'Later'))
+		self.assertTrue(manager.addDetectionRule('later', title='later-app'))
+		self.assertEqual(manager.detectApplication(self._make_focus(title='later-app')), 'later')
+
+	def test_removing_custom_rules_keeps_builtin_ones(self):
+		"""Rules are flagged built-in when registered, not by their position."""
+		manager = self._get_manager()
+		self.assertTrue(manager.addDetectionRule('vim', title='^edit ', priority=300))
+		self.assertEqual(manager.detectApplication(self._make_focus(title='edit notes')), 'vim')
+
+		manager.removeDetectionRules('vim', includeBuiltin=False)
+		self.assertEqual(manager.detectApplication(self._make_focus(title='edit notes')), 'default')
+		self.assertEqual(manager.detectApplication(self._make_focus(title='vim main.py')), 'vim')
+		self.assertTrue(all(rule[5] for rule in manager._detectionRules if rule[2] == 'vim'))
+
+		manager.removeDetectionRules('vim')
+		self.assertFalse(any(rule[2] == 'vim' for rule in manager._detectionRules))
+
 
 if __name__ == '__main__':
 	unittest.main()